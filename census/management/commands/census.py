@@ -6,13 +6,37 @@ import pandas as pd
 from django.utils import timezone
 from tqdm import tqdm
 
-from gazetteer.models import AdminCounty, HistoricCounty, Place
+from gazetteer.resolver import PlaceResolver, ResolvedPlace
 from lwmdb.management.commands.fixtures import Fixture
 
 CSV_FIXTURE_PATH: Path = Path("./fixture-files/UKDA-8613-csv/")
 JSON_FIXTURE_WRITE_PATH: Path = Path("./census/fixtures/Record.json")
 
 
+def fix_census_label(x: str) -> str:
+    """Correct census labels known not to match gazetteer labels.
+
+    Example:
+        ```pycon
+        >>> fix_census_label("East Riding of Yorkshire")
+        'YORKSHIRE'
+        >>> fix_census_label("bury st edmund")
+        'Bury St Edmunds'
+        >>> fix_census_label("Bolton")
+        'Bolton'
+
+        ```
+    """
+    # do some manual data wrangling - on hold until Mariona is back
+    if "yorkshire" in x.lower():
+        x = "YORKSHIRE"
+
+    if "bury" in x and "edmund" in x.lower():
+        x = "Bury St Edmunds"
+
+    return x
+
+
 class Command(Fixture):
     """Build census."""
 
@@ -51,81 +75,16 @@ class Command(Fixture):
         df["created_at"] = str(now)
         df["updated_at"] = str(now)
 
-        def get_rel(x):
-            # do some manual data wrangling - on hold until Mariona is back
-            if "yorkshire" in x.lower():
-                x = "YORKSHIRE"
-
-            if "bury" in x and "edmund" in x.lower():
-                x = "Bury St Edmunds"
-
-            ##### first try
-            try:
-                historic_county = HistoricCounty.objects.get(label__iexact=x).pk
-            except:
-                historic_county = None
-
-            try:
-                admin_county = AdminCounty.objects.get(label__iexact=x).pk
-            except:
-                admin_county = None
-
-            try:
-                place = Place.objects.get(label__iexact=x).pk
-            except:
-                place = None
-
-            if historic_county != None or admin_county != None or place != None:
-                return (x, historic_county, admin_county, place)
-
-            ##### second try: without EAST/WEST/NORTH/SOUTH/WESTERN/SOUTHEAST/FIRST/CENTRAL
-            if historic_county == None and place == None:
-                for word in [
-                    "east",
-                    "north",
-                    "west",
-                    "south",
-                    "western",
-                    "southeast",
-                    "first",
-                    "central",
-                    "south east",
-                ]:
-                    if f"{word} " in x.lower() or f" {word}" in x.lower():
-                        x = x.replace(f"{word} ", " ").replace(f" {word}", " ").strip()
-                        x = (
-                            x.replace(f"{word.upper()} ", " ")
-                            .replace(f" {word.upper()}", " ")
-                            .strip()
-                        )
-
-            try:
-                historic_county = HistoricCounty.objects.get(label__iexact=x).pk
-            except:
-                historic_county = None
-
-            try:
-                admin_county = AdminCounty.objects.get(label__iexact=x).pk
-            except:
-                admin_county = None
-
-            try:
-                place = Place.objects.get(label__iexact=x).pk
-            except:
-                place = None
-
-            return (x, historic_county, admin_county, place)
-
+        resolver = PlaceResolver.from_db(preprocess=fix_census_label)
         cats = ["REGCNTY", "REGDIST", "SUBDIST"]
 
         for cat in (bar1 := tqdm(cats, leave=False)):
             bar1.set_description(f"Correcting record :: {cat}")
-            df[f"{cat}_rel"] = df[cat].apply(lambda x: get_rel(x))
-            df[f"{cat}_historic_county_id"] = df[f"{cat}_rel"].apply(lambda x: x[1])
-            df[f"{cat}_admin_county_id"] = df[f"{cat}_rel"].apply(lambda x: x[2])
-            df[f"{cat}_place_id"] = df[f"{cat}_rel"].apply(lambda x: x[3])
-
-        df.drop([f"{cat}_rel" for cat in cats], axis=1, inplace=True)
+            resolved: dict[str, ResolvedPlace] = resolver.resolve(df[cat].unique())
+            for field in ("historic_county_id", "admin_county_id", "place_id"):
+                df[f"{cat}_{field}"] = df[cat].map(
+                    {label: getattr(rel, field) for label, rel in resolved.items()}
+                )
 
         lst = []
         for record in json.loads(df.to_json(orient="records")):
@@ -1,6 +1,28 @@
+from os import PathLike
+from typing import TYPE_CHECKING, Final
+
 from django.db import models
 
 from gazetteer.models import AdminCounty, HistoricCounty, Place
+from lwmdb.arrow import (
+    DEFAULT_ARROW_BATCH_SIZE,
+    arrow_schema,
+    import_pyarrow,
+    queryset_to_arrow,
+    queryset_to_parquet,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# `Record` values are census counts and rates, so `float32` precision suffices
+RECORD_ARROW_FLOAT_TYPE: Final[str] = "float32"
+RECORD_ARROW_DICTIONARY_FIELDS: Final[tuple[str, ...]] = (
+    "REGCNTY",
+    "REGDIST",
+    "SUBDIST",
+    "TYPE",
+)
 
 
 class CensusModel(models.Model):
@@ -11,6 +33,47 @@ class CensusModel(models.Model):
         abstract = True
 
 
+class RecordQuerySet(models.QuerySet):
+    """Export `Record`s in bulk as `pyarrow` batches or `parquet`."""
+
+    def arrow_schema(self) -> "pa.Schema":
+        """Return `Record` columns typed as `float32`, `int16` and `int32`."""
+        pa = import_pyarrow()
+        types: dict[str, pa.DataType] = {
+            field.attname: getattr(pa, RECORD_ARROW_FLOAT_TYPE)()
+            for field in self.model._meta.concrete_fields
+            if isinstance(field, models.FloatField)
+        }
+        types["CENSUS_YEAR"] = pa.int16()
+        types |= {
+            field.attname: pa.int32()
+            for field in self.model._meta.concrete_fields
+            if field.is_relation
+        }
+        return arrow_schema(
+            self.model, types=types, dictionary=RECORD_ARROW_DICTIONARY_FIELDS
+        )
+
+    def to_arrow(
+        self, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> "pa.RecordBatchReader":
+        """Stream records via a server-side cursor as `pyarrow` batches.
+
+        Example:
+            ```python
+            table = Record.objects.filter(CENSUS_YEAR=1851).to_arrow().read_all()
+            df = table.to_pandas()
+            ```
+        """
+        return queryset_to_arrow(self, self.arrow_schema(), batch_size)
+
+    def to_parquet(
+        self, path: PathLike, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> int:
+        """Write records to a `parquet` file at `path`, returning the row count."""
+        return queryset_to_parquet(self, path, self.arrow_schema(), batch_size)
+
+
 class Record(CensusModel):
     REGCNTY_place = models.ForeignKey(
         Place,
@@ -86,6 +149,8 @@ class Record(CensusModel):
     SUBDIST = models.CharField(max_length=40, blank=False, null=True)
     TYPE = models.CharField(max_length=20, blank=False, null=True)
 
+    objects = RecordQuerySet.as_manager()
+
     POP_DENS = models.FloatField(blank=False, null=True)
     POP = models.FloatField(blank=False, null=True)
     ACRES = models.FloatField(blank=False, null=True)
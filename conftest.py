@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 from coverage_badge.__main__ import main as gen_cov_badge
+from django.core.cache import cache
 from django.core.management import call_command
 
 # from django.conf import settings
@@ -28,6 +29,12 @@ def set_default_language() -> None:
 #         )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Ensure cached queries and responses are not shared between tests."""
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def media_storage(settings, tmpdir) -> None:
     """Generate a temp path for testing media files."""
@@ -1,7 +1,8 @@
 # Register your models here.
 from django.contrib import admin
 
-from .models import Fulltext
+from .models import CompressionDictionary, Fulltext
 
 # Register your models here.
+admin.site.register(CompressionDictionary)
 admin.site.register(Fulltext)
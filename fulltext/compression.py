@@ -0,0 +1,176 @@
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Final
+
+DEFAULT_COMPRESSION_LEVEL: Final[int] = 9
+DEFAULT_TEXT_ENCODING: Final[str] = "utf-8"
+
+# `zlib` only looks back 32 KiB, so longer dictionaries are wasted bytes
+MAX_ZDICT_SIZE: Final[int] = 32 * 1024
+DEFAULT_ZDICT_MIN_TOKEN_LENGTH: Final[int] = 3
+
+
+def compress_text(
+    text: str,
+    zdict: bytes | None = None,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    encoding: str = DEFAULT_TEXT_ENCODING,
+) -> bytes:
+    """Return `text` compressed via `zlib`, optionally with a preset `zdict`.
+
+    Args:
+        text: `str` to compress
+        zdict: shared preset dictionary, see `train_zdict`
+        level: `zlib` compression level
+        encoding: encoding of `text` prior to compression
+
+    Returns:
+        Compressed `bytes`; decompress with the same `zdict`.
+
+    Example:
+        ```pycon
+        >>> text: str = "The Birkenhead News and Wirral General Advertiser " * 20
+        >>> compressed: bytes = compress_text(text)
+        >>> len(compressed) < len(text)
+        True
+        >>> decompress_text(compressed) == text
+        True
+
+        ```
+    """
+    if zdict:
+        compressor = zlib.compressobj(level=level, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(level=level)
+    return compressor.compress(text.encode(encoding)) + compressor.flush()
+
+
+def decompress_text(
+    compressed: bytes | memoryview,
+    zdict: bytes | None = None,
+    encoding: str = DEFAULT_TEXT_ENCODING,
+) -> str:
+    """Return `str` from `compressed` `bytes` created by `compress_text`.
+
+    Example:
+        ```pycon
+        >>> zdict: bytes = train_zdict(["railway accident inquest verdict"])
+        >>> compressed: bytes = compress_text("SAD END OF A railway", zdict=zdict)
+        >>> decompress_text(compressed, zdict=zdict)
+        'SAD END OF A railway'
+
+        ```
+    """
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return (decompressor.decompress(bytes(compressed)) + decompressor.flush()).decode(
+        encoding
+    )
+
+
+def train_zdict(
+    samples: Iterable[str],
+    size: int = MAX_ZDICT_SIZE,
+    min_token_length: int = DEFAULT_ZDICT_MIN_TOKEN_LENGTH,
+    encoding: str = DEFAULT_TEXT_ENCODING,
+) -> bytes:
+    """Build a `zlib` preset dictionary from the most common tokens in `samples`.
+
+    Note:
+        `zlib` favours matches closest to the data being compressed, so the most
+        frequent tokens are placed at the *end* of the returned `bytes`.
+
+    Args:
+        samples: example texts, for example from one `DataProvider`
+        size: maximum length of the dictionary in `bytes`
+        min_token_length: ignore tokens shorter than this
+        encoding: encoding used for the dictionary `bytes`
+
+    Returns:
+        `bytes` of at most `size` to pass as `zdict`.
+
+    Example:
+        ```pycon
+        >>> train_zdict(["the railway and the railway inquest", "an inquest"])
+        b'and inquest railway the '
+
+        ```
+    """
+    token_counts: Counter[str] = Counter(
+        token
+        for sample in samples
+        for token in sample.split()
+        if len(token) >= min_token_length
+    )
+    zdict: bytes = b""
+    for token, _ in token_counts.most_common():
+        token_bytes: bytes = f"{token} ".encode(encoding)
+        if len(zdict) + len(token_bytes) > size:
+            break
+        zdict = token_bytes + zdict
+    return zdict
+
+
+@dataclass
+class CompressionBenchmark:
+    """Size and timing comparison of plain versus compressed texts."""
+
+    text_count: int
+    plain_bytes: int
+    compressed_bytes: int
+    compress_seconds: float
+    decompress_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """Return `compressed_bytes` as a fraction of `plain_bytes`."""
+        return self.compressed_bytes / self.plain_bytes if self.plain_bytes else 0.0
+
+    @property
+    def compress_per_second(self) -> float:
+        """Return how many texts were compressed per second."""
+        return self.text_count / self.compress_seconds if self.compress_seconds else 0.0
+
+    @property
+    def mean_decompress_ms(self) -> float:
+        """Return mean milliseconds to decompress one text."""
+        return (
+            1000 * self.decompress_seconds / self.text_count if self.text_count else 0.0
+        )
+
+
+def benchmark_compression(
+    texts: Sequence[str],
+    zdict: bytes | None = None,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+) -> CompressionBenchmark:
+    """Compress then decompress `texts`, timing both and summing sizes.
+
+    Example:
+        ```pycon
+        >>> result = benchmark_compression(["SAD END OF A RAILWAY " * 50] * 10)
+        >>> result.text_count
+        10
+        >>> result.ratio < 0.1
+        True
+
+        ```
+    """
+    plain_bytes: int = sum(len(text.encode(DEFAULT_TEXT_ENCODING)) for text in texts)
+    start: float = perf_counter()
+    compressed: list[bytes] = [
+        compress_text(text, zdict=zdict, level=level) for text in texts
+    ]
+    compressed_time: float = perf_counter()
+    for blob in compressed:
+        decompress_text(blob, zdict=zdict)
+    decompressed_time: float = perf_counter()
+    return CompressionBenchmark(
+        text_count=len(texts),
+        plain_bytes=plain_bytes,
+        compressed_bytes=sum(len(blob) for blob in compressed),
+        compress_seconds=compressed_time - start,
+        decompress_seconds=decompressed_time - compressed_time,
+    )
@@ -0,0 +1,238 @@
+from time import perf_counter
+from typing import Final
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from tqdm import tqdm
+
+from ...compression import benchmark_compression, compress_text, train_zdict
+from ...models import CompressionDictionary, Fulltext
+
+DEFAULT_CHUNK_SIZE: Final[int] = 2000
+DEFAULT_TRAIN_SAMPLE_SIZE: Final[int] = 1000
+DEFAULT_BENCHMARK_SAMPLE_SIZE: Final[int] = 1000
+
+COMPRESSION_UPDATE_FIELDS: Final[list[str]] = [
+    "text",
+    "text_compressed",
+    "compression_dictionary",
+]
+
+
+class Command(BaseCommand):
+    """Bulk (re)encode `Fulltext` records to and from compressed storage."""
+
+    help: str = "Compress, decompress or benchmark `Fulltext` storage in bulk"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--dictionary",
+            type=str,
+            help="`CompressionDictionary.code` to compress with (created if --train)",
+        )
+        parser.add_argument(
+            "--data-provider",
+            type=str,
+            help="Only process `Fulltext` of `Item`s from this `DataProvider.code`",
+        )
+        parser.add_argument(
+            "--train",
+            nargs="?",
+            const=DEFAULT_TRAIN_SAMPLE_SIZE,
+            type=int,
+            help="Train --dictionary from this many uncompressed texts first",
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            "--decompress",
+            action="store_true",
+            help="Restore compressed records to plain `text`",
+        )
+        parser.add_argument(
+            "--benchmark",
+            nargs="?",
+            const=DEFAULT_BENCHMARK_SAMPLE_SIZE,
+            type=int,
+            help="Compare plain `TEXT` and compressed storage on a sample",
+        )
+
+    def handle(self, *args, **options) -> None:
+        qs: QuerySet[Fulltext] = Fulltext.objects.all()
+        if options["data_provider"]:
+            qs = qs.filter(item__data_provider__code=options["data_provider"])
+
+        if options["train"] and not options["dictionary"]:
+            raise CommandError("--train requires a --dictionary code to train")
+        dictionary: CompressionDictionary | None = None
+        if options["dictionary"]:
+            if options["train"]:
+                dictionary = self.train(
+                    options["dictionary"], qs, sample_size=options["train"]
+                )
+            else:
+                try:
+                    dictionary = CompressionDictionary.objects.get(
+                        code=options["dictionary"]
+                    )
+                except CompressionDictionary.DoesNotExist:
+                    raise CommandError(
+                        f"No `CompressionDictionary` {options['dictionary']}; "
+                        "use --train to create it."
+                    )
+
+        if options["benchmark"]:
+            self.benchmark(qs, dictionary, sample_size=options["benchmark"])
+        elif options["decompress"]:
+            self.reencode(
+                qs.filter(text_compressed__isnull=False),
+                chunk_size=options["chunk_size"],
+                decompress=True,
+            )
+        else:
+            # `search_vector` can only be calculated from plain `text`
+            qs.update_search_vectors()
+            self.reencode(
+                qs.filter(text_compressed__isnull=True),
+                dictionary=dictionary,
+                chunk_size=options["chunk_size"],
+            )
+
+    def train(
+        self, code: str, qs: QuerySet[Fulltext], sample_size: int
+    ) -> CompressionDictionary:
+        """Create or replace `CompressionDictionary` `code` from `qs` samples."""
+        if Fulltext.objects.filter(compression_dictionary__code=code).exists():
+            raise CommandError(
+                f"`CompressionDictionary` {code} is in use; "
+                "decompress its records before retraining."
+            )
+        samples: list[str] = list(
+            qs.filter(text_compressed__isnull=True).values_list("text", flat=True)[
+                :sample_size
+            ]
+        )
+        dictionary, _ = CompressionDictionary.objects.update_or_create(
+            code=code, defaults={"zdict": train_zdict(samples)}
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Trained `{code}` dictionary ({len(dictionary.zdict)} bytes) "
+                f"from {len(samples)} texts"
+            )
+        )
+        return dictionary
+
+    def reencode(
+        self,
+        qs: QuerySet[Fulltext],
+        dictionary: CompressionDictionary | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> None:
+        """Compress (or `decompress`) `qs` in chunks via `bulk_update`."""
+        batch: list[Fulltext] = []
+        total: int = 0
+        for fulltext in tqdm(
+            qs.select_related("compression_dictionary").iterator(chunk_size=chunk_size),
+            total=qs.count(),
+        ):
+            if decompress:
+                fulltext.decompress()
+            else:
+                fulltext.compress(dictionary)
+            batch.append(fulltext)
+            if len(batch) >= chunk_size:
+                total += Fulltext.objects.bulk_update(batch, COMPRESSION_UPDATE_FIELDS)
+                batch = []
+        if batch:
+            total += Fulltext.objects.bulk_update(batch, COMPRESSION_UPDATE_FIELDS)
+        action: str = "Decompressed" if decompress else "Compressed"
+        self.stdout.write(self.style.SUCCESS(f"{action} {total} `Fulltext` records"))
+
+    def benchmark(
+        self,
+        qs: QuerySet[Fulltext],
+        dictionary: CompressionDictionary | None,
+        sample_size: int,
+    ) -> None:
+        """Compare `TEXT`/`TOAST` storage with compressed bytes on a sample.
+
+        Sizes use `pg_column_size`, which already includes `TOAST`'s own `pglz`
+        compression. Insert and read timings write the sample to new rows
+        inside a transaction which is rolled back afterwards.
+        """
+        zdict: bytes | None = bytes(dictionary.zdict) if dictionary else None
+        sample_pks: list[int] = list(
+            qs.filter(text_compressed__isnull=True).values_list("pk", flat=True)[
+                :sample_size
+            ]
+        )
+        texts: list[str] = list(
+            Fulltext.objects.filter(pk__in=sample_pks).values_list("text", flat=True)
+        )
+        if not texts:
+            self.stdout.write(self.style.WARNING("No uncompressed texts to sample"))
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT SUM(pg_column_size(text)) FROM {Fulltext._meta.db_table} "
+                "WHERE id = ANY(%s)",
+                [sample_pks],
+            )
+            toast_bytes: int = cursor.fetchone()[0] or 0
+
+        in_memory = benchmark_compression(texts, zdict=zdict)
+        rows: list[tuple[str, str, str]] = [
+            ("texts", str(len(texts)), str(len(texts))),
+            (
+                "bytes",
+                f"{toast_bytes} (raw {in_memory.plain_bytes})",
+                str(in_memory.compressed_bytes),
+            ),
+        ]
+        with transaction.atomic():
+            start: float = perf_counter()
+            plain = Fulltext.objects.bulk_create([Fulltext(text=t) for t in texts])
+            plain_insert: float = perf_counter() - start
+
+            start = perf_counter()
+            compressed = Fulltext.objects.bulk_create(
+                [
+                    Fulltext(
+                        text_compressed=compress_text(t, zdict=zdict),
+                        compression_dictionary=dictionary,
+                    )
+                    for t in texts
+                ]
+            )
+            compressed_insert: float = perf_counter() - start
+
+            start = perf_counter()
+            for fulltext in Fulltext.objects.filter(pk__in=[f.pk for f in plain]):
+                fulltext.content
+            plain_read: float = perf_counter() - start
+
+            start = perf_counter()
+            for fulltext in Fulltext.objects.filter(
+                pk__in=[f.pk for f in compressed]
+            ).select_related("compression_dictionary"):
+                fulltext.content
+            compressed_read: float = perf_counter() - start
+            transaction.set_rollback(True)
+
+        rows += [
+            (
+                "inserts/s",
+                f"{len(texts) / plain_insert:.0f}",
+                f"{len(texts) / compressed_insert:.0f}",
+            ),
+            (
+                "read ms/text",
+                f"{1000 * plain_read / len(texts):.3f}",
+                f"{1000 * compressed_read / len(texts):.3f}",
+            ),
+        ]
+        self.stdout.write(f"{'':<14}{'TEXT/TOAST':>28}{'compressed':>16}")
+        for label, plain_value, compressed_value in rows:
+            self.stdout.write(f"{label:<14}{plain_value:>28}{compressed_value:>16}")
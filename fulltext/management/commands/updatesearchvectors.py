@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from ...models import DEFAULT_SEARCH_CONFIG, DEFAULT_SEARCH_VECTOR_CHUNK_SIZE, Fulltext
+
+
+class Command(BaseCommand):
+    """Populate `Fulltext.search_vector` in bulk after loading texts."""
+
+    help: str = "Update `Fulltext.search_vector` in chunks for full-text search"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--config", type=str, default=DEFAULT_SEARCH_CONFIG)
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_SEARCH_VECTOR_CHUNK_SIZE
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recalculate `search_vector` for records that already have one",
+        )
+
+    def handle(self, *args, **options) -> None:
+        updated: int = Fulltext.objects.update_search_vectors(
+            config=options["config"],
+            chunk_size=options["chunk_size"],
+            force=options["force"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated `search_vector` of {updated} `Fulltext`")
+        )
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2023-11-20 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fulltext", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompressionDictionary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("code", models.SlugField(max_length=100, unique=True)),
+                ("zdict", models.BinaryField()),
+            ],
+            options={
+                "verbose_name_plural": "compression dictionaries",
+            },
+        ),
+        migrations.AlterField(
+            model_name="fulltext",
+            name="text",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="fulltext",
+            name="text_compressed",
+            field=models.BinaryField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="fulltext",
+            name="compression_dictionary",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="fulltexts",
+                related_query_name="fulltext",
+                to="fulltext.compressiondictionary",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2023-11-21 09:41
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fulltext", "0002_compressiondictionary_fulltext_text_compressed_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fulltext",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fulltext",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="fulltext_fu_search__ab86ee_gin"
+            ),
+        ),
+    ]
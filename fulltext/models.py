@@ -1,7 +1,118 @@
+from typing import Final
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Max, Min
+
+from .compression import compress_text, decompress_text
+
+DEFAULT_SEARCH_CONFIG: Final[str] = "english"
+DEFAULT_SEARCH_VECTOR_CHUNK_SIZE: Final[int] = 10000
+
+
+class CompressionDictionary(models.Model):
+    """Shared `zlib` preset dictionary, usually one per `DataProvider`."""
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    code = models.SlugField(max_length=100, unique=True)
+    zdict = models.BinaryField()
+
+    class Meta:
+        verbose_name_plural = "compression dictionaries"
+
+    def __str__(self):
+        return str(self.code)
+
+
+class FulltextQuerySet(models.QuerySet):
+    def update_search_vectors(
+        self,
+        config: str = DEFAULT_SEARCH_CONFIG,
+        chunk_size: int = DEFAULT_SEARCH_VECTOR_CHUNK_SIZE,
+        force: bool = False,
+    ) -> int:
+        """Set `search_vector` from `text` in `pk` ranges of `chunk_size`.
+
+        Designed to be run once after a bulk load rather than maintaining
+        `search_vector` with a per-row trigger. Each chunk is a single
+        `UPDATE`, so the `GIN` index is updated in batches. Compressed records
+        are skipped as `text` is empty; update them before compressing.
+
+        Args:
+            config: `postgres` text search configuration
+            chunk_size: how many `pk` values to update per `UPDATE`
+            force: recalculate `search_vector` even if already set
+
+        Returns:
+            Count of updated records.
+        """
+        qs = self.filter(text_compressed__isnull=True)
+        if not force:
+            qs = qs.filter(search_vector__isnull=True)
+        bounds: dict[str, int | None] = qs.aggregate(start=Min("pk"), end=Max("pk"))
+        if bounds["start"] is None or bounds["end"] is None:
+            return 0
+        total: int = 0
+        for chunk_start in range(bounds["start"], bounds["end"] + 1, chunk_size):
+            total += qs.filter(
+                pk__gte=chunk_start, pk__lt=chunk_start + chunk_size
+            ).update(search_vector=SearchVector("text", config=config))
+        return total
 
 
 class Fulltext(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    text = models.TextField()
+    text = models.TextField(blank=True, default="")
+    text_compressed = models.BinaryField(null=True, blank=True, default=None)
+    compression_dictionary = models.ForeignKey(
+        CompressionDictionary,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="fulltexts",
+        related_query_name="fulltext",
+    )
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    objects = FulltextQuerySet.as_manager()
+
+    class Meta:
+        indexes = [GinIndex(fields=["search_vector"])]
+
+    @property
+    def is_compressed(self) -> bool:
+        """Whether the text is stored in `text_compressed` rather than `text`."""
+        return self.text_compressed is not None
+
+    @property
+    def content(self) -> str:
+        """Return the text, decompressing `text_compressed` if necessary."""
+        if not self.is_compressed:
+            return self.text
+        zdict: bytes | None = (
+            bytes(self.compression_dictionary.zdict)
+            if self.compression_dictionary
+            else None
+        )
+        return decompress_text(self.text_compressed, zdict=zdict)
+
+    def compress(self, dictionary: CompressionDictionary | None = None) -> None:
+        """Move `text` into `text_compressed`, optionally using `dictionary`.
+
+        Note:
+            This does not call `save`, allowing use with `bulk_update`.
+        """
+        text: str = self.content
+        zdict: bytes | None = bytes(dictionary.zdict) if dictionary else None
+        self.text_compressed = compress_text(text, zdict=zdict)
+        self.compression_dictionary = dictionary
+        self.text = ""
+
+    def decompress(self) -> None:
+        """Move `text_compressed` back into plain `text` without saving."""
+        self.text = self.content
+        self.text_compressed = None
+        self.compression_dictionary = None
@@ -1 +1,46 @@
-# Create your tests here.
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from .compression import train_zdict
+from .models import CompressionDictionary, Fulltext
+
+TEST_FULLTEXT: str = "SAD END OF A RAILWAY. The jury concurred, and returned a verdict."
+
+
+@pytest.mark.django_db
+class TestFulltextCompression:
+    """Test compressed storage of `Fulltext.text`."""
+
+    def test_compress_round_trip(self) -> None:
+        fulltext = Fulltext.objects.create(text=TEST_FULLTEXT)
+        assert not fulltext.is_compressed
+        dictionary = CompressionDictionary.objects.create(
+            code="lwm", zdict=train_zdict([TEST_FULLTEXT])
+        )
+        fulltext.compress(dictionary)
+        fulltext.save()
+
+        fulltext = Fulltext.objects.get(pk=fulltext.pk)
+        assert fulltext.is_compressed
+        assert fulltext.text == ""
+        assert fulltext.content == TEST_FULLTEXT
+
+        fulltext.decompress()
+        fulltext.save()
+        fulltext = Fulltext.objects.get(pk=fulltext.pk)
+        assert not fulltext.is_compressed
+        assert fulltext.text == TEST_FULLTEXT
+
+    def test_compressfulltext_train_errors(self) -> None:
+        with pytest.raises(CommandError, match="--dictionary"):
+            call_command("compressfulltext", "--train")
+
+        fulltext = Fulltext.objects.create(text=TEST_FULLTEXT)
+        dictionary = CompressionDictionary.objects.create(
+            code="lwm", zdict=train_zdict([TEST_FULLTEXT])
+        )
+        fulltext.compress(dictionary)
+        fulltext.save()
+        with pytest.raises(CommandError, match="in use"):
+            call_command("compressfulltext", "--dictionary", "lwm", "--train")
@@ -0,0 +1,97 @@
+import re
+from collections.abc import Iterable
+from os import PathLike
+from typing import Final, NamedTuple
+from zipfile import ZipFile
+
+DEFAULT_TEXT_ENCODING: Final[str] = "utf-8"
+PLAINTEXT_SUFFIX: Final[str] = ".txt"
+
+# A "clean" token is letters, optionally joined by `'` or `-`, wrapped in punctuation
+CLEAN_TOKEN_REGEX: Final[re.Pattern] = re.compile(
+    r"^[\"'(\[]*[^\W\d_]+(?:['\-][^\W\d_]+)*[\"'.,;:!?)\]]*$"
+)
+NUMBER_TOKEN_REGEX: Final[re.Pattern] = re.compile(r"^[(£$]*[\d.,/\-]+[).,;:s]*$")
+
+
+class TextStatistics(NamedTuple):
+    """Counts and an `OCR` noise estimate for one text."""
+
+    token_count: int
+    char_count: int
+    line_count: int
+    noise_score: float
+
+
+def ocr_noise_score(tokens: Iterable[str]) -> float:
+    """Return the fraction of `tokens` which look like `OCR` errors.
+
+    A cheap heuristic: tokens which are neither words (letters joined by `'`
+    or `-`, allowing surrounding punctuation) nor numbers count as noise.
+
+    Example:
+        ```pycon
+        >>> ocr_noise_score("The jury concurred, and returned a verdict.".split())
+        0.0
+        >>> tokens = "Tile—jUr7 concurred, and returned • verdict".split()
+        >>> round(ocr_noise_score(tokens), 2)
+        0.33
+        >>> ocr_noise_score([])
+        0.0
+
+        ```
+    """
+    total: int = 0
+    noisy: int = 0
+    for token in tokens:
+        total += 1
+        if not (CLEAN_TOKEN_REGEX.match(token) or NUMBER_TOKEN_REGEX.match(token)):
+            noisy += 1
+    return noisy / total if total else 0.0
+
+
+def text_statistics(text: str) -> TextStatistics:
+    """Return `TextStatistics` of `text`.
+
+    Example:
+        ```pycon
+        >>> text_statistics("SAD END OF A RAILWAY\\nThe jury concurred.\\n")
+        TextStatistics(token_count=8, char_count=41, line_count=2, noise_score=0.0)
+
+        ```
+    """
+    tokens: list[str] = text.split()
+    return TextStatistics(
+        token_count=len(tokens),
+        char_count=len(text),
+        line_count=text.count("\n") + (1 if text and not text.endswith("\n") else 0),
+        noise_score=round(ocr_noise_score(tokens), 4),
+    )
+
+
+def archive_text_statistics(
+    archive_path: PathLike | str,
+    suffix: str = PLAINTEXT_SUFFIX,
+    encoding: str = DEFAULT_TEXT_ENCODING,
+) -> dict[str, TextStatistics]:
+    """Return `TextStatistics` for each `suffix` file in a `zip` archive.
+
+    Each file is read once, in archive order, and only one text is held in
+    memory at a time, so this is suited to running per archive in parallel.
+
+    Args:
+        archive_path: path to a `*_plaintext.zip` archive
+        suffix: only process archive members ending with `suffix`
+        encoding: encoding of the text files
+
+    Returns:
+        A `dict` of archive member path to `TextStatistics`.
+    """
+    statistics: dict[str, TextStatistics] = {}
+    with ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            if member.is_dir() or not member.filename.endswith(suffix):
+                continue
+            text: str = archive.read(member).decode(encoding, errors="replace")
+            statistics[member.filename] = text_statistics(text)
+    return statistics
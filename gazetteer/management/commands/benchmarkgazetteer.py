@@ -0,0 +1,70 @@
+from pathlib import Path
+from time import perf_counter
+from typing import Final
+
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from lwmdb.management.commands.fixtures import AUTO_FILE_LOCATIONS
+
+from .gazetteer import CSV_ENGINE
+from .gazetteer import Command as GazetteerFixture
+
+DEFAULT_REPEAT: Final[int] = 3
+
+
+def list_filter_main_frame(path: Path, list_mitchells_wqid: list[str]) -> pd.DataFrame:
+    """Filter the Wikidata gazetteer by list membership and `.loc`, for comparison."""
+    main_frame = pd.read_csv(
+        path,
+        low_memory=False,
+        usecols=[
+            "wikidata_id",
+            "english_label",
+            "latitude",
+            "longitude",
+            "geonamesIDs",
+        ],
+    ).rename({"wikidata_id": "place_wikidata_id"}, axis=1)
+    filtered = [x for x in main_frame.place_wikidata_id if x in list_mitchells_wqid]
+    return main_frame.set_index("place_wikidata_id").loc[filtered].reset_index()
+
+
+class Command(BaseCommand):
+    """Time building the gazetteer main frame from the fixture `CSV` files."""
+
+    help: str = "Benchmark filtering the Wikidata gazetteer to Mitchells places"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--gazetteer",
+            type=Path,
+            default=settings.BASE_DIR / AUTO_FILE_LOCATIONS["wikidata_gazetteer"],
+        )
+        parser.add_argument(
+            "--wikidata-ids",
+            type=Path,
+            default=settings.BASE_DIR
+            / AUTO_FILE_LOCATIONS["wikidata_ids_publication_mitchells"],
+        )
+        parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+
+    def handle(self, *args, **options) -> None:
+        list_mitchells_wqid: list[str] = [
+            x.strip()
+            for x in options["wikidata_ids"].read_text().splitlines()
+            if x.strip().startswith("Q")
+        ]
+        methods = {
+            "list filter + loc (c)": list_filter_main_frame,
+            f"isin ({CSV_ENGINE})": GazetteerFixture().get_main_frame,
+        }
+        self.stdout.write(f"{'method':<26}{'seconds':>10}{'rows':>8}")
+        for name, method in methods.items():
+            timings: list[float] = []
+            for _ in range(options["repeat"]):
+                start: float = perf_counter()
+                rows: int = len(method(options["gazetteer"], list_mitchells_wqid))
+                timings.append(perf_counter() - start)
+            self.stdout.write(f"{name:<26}{min(timings):>10.2f}{rows:>8}")
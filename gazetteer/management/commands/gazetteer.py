@@ -1,4 +1,6 @@
 import json
+from importlib.util import find_spec
+from typing import Final
 
 import numpy as np
 import pandas as pd
@@ -7,6 +9,45 @@ from lwmdb.management.commands.fixtures import AUTO_FILE_LOCATIONS, Fixture
 
 from ...models import AdminCounty, Country, HistoricCounty, Place
 
+# `pyarrow` parses the gazetteer CSV in parallel, if available
+CSV_ENGINE: Final[str] = "pyarrow" if find_spec("pyarrow") else "c"
+
+WIKIDATA_GAZETTEER_DTYPES: Final[dict[str, str]] = {
+    "wikidata_id": "string",
+    "english_label": "string",
+    "latitude": "float64",
+    "longitude": "float64",
+    "geonamesIDs": "string",
+}
+
+
+def read_wikidata_gazetteer(path, engine: str = CSV_ENGINE) -> pd.DataFrame:
+    """Read `WIKIDATA_GAZETTEER_DTYPES` columns of `path` with those types.
+
+    `pandas` applies `dtype` only after the `pyarrow` engine has inferred
+    types, which turns ids like `0123` into `123.0`, so with `pyarrow`
+    column types are passed to `pyarrow.csv.read_csv` instead.
+    """
+    if engine == "pyarrow":
+        from pyarrow import csv
+
+        table = csv.read_csv(
+            path,
+            convert_options=csv.ConvertOptions(
+                column_types=WIKIDATA_GAZETTEER_DTYPES,
+                include_columns=list(WIKIDATA_GAZETTEER_DTYPES),
+                # Empty cells are missing, as with `pandas.read_csv`
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas().astype(WIKIDATA_GAZETTEER_DTYPES)
+    return pd.read_csv(
+        path,
+        engine=engine,
+        usecols=list(WIKIDATA_GAZETTEER_DTYPES),
+        dtype=WIKIDATA_GAZETTEER_DTYPES,
+    )
+
 
 class Command(Fixture):
     app_name = "gazetteer"
@@ -16,18 +57,22 @@ class Command(Fixture):
         self.force = force
         super(Fixture, self).__init__()
 
+    def bulk_write_frame(self, df, model, *args, **kwargs) -> int:
+        """Write `df` as `Fixture.bulk_write_frame`, then set `Place.point`."""
+        operational_errors_occurred: int = super().bulk_write_frame(
+            df, model, *args, **kwargs
+        )
+        if model is Place:
+            Place.objects.update_points()
+        return operational_errors_occurred
+
+    def load_fixtures(self, models=None) -> None:
+        """Load fixtures, then set `Place.point`, as loading skips `save`."""
+        super().load_fixtures(models)
+        Place.objects.update_points()
+
     def get_main_frame(self, path, list_mitchells_wqid):
-        main_frame = pd.read_csv(
-            path,
-            low_memory=False,
-            usecols=[
-                "wikidata_id",
-                "english_label",
-                "latitude",
-                "longitude",
-                "geonamesIDs",
-            ],
-        ).rename(
+        main_frame = read_wikidata_gazetteer(path).rename(
             {
                 "wikidata_id": "place_wikidata_id",
                 "english_label": "place_label",
@@ -36,9 +81,9 @@ class Command(Fixture):
             axis=1,
         )
 
-        filtered = [x for x in main_frame.place_wikidata_id if x in list_mitchells_wqid]
-        main_frame = main_frame.set_index("place_wikidata_id").loc[filtered]
-        main_frame.reset_index(inplace=True)
+        main_frame = main_frame[
+            main_frame.place_wikidata_id.isin(set(list_mitchells_wqid))
+        ].reset_index(drop=True)
         main_frame["place_pk"] = np.arange(1, len(main_frame) + 1)
 
         # reorder columns
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Place
+
+
+class Command(BaseCommand):
+    """Populate `Place.point` in bulk from `latitude` and `longitude`."""
+
+    help: str = (
+        "Update `Place.point` from `latitude` and `longitude` for spatial queries"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recalculate `point` for places that already have one",
+        )
+
+    def handle(self, *args, **options) -> None:
+        places = Place.objects.all()
+        if not options["force"]:
+            places = places.filter(point__isnull=True)
+        updated: int = places.update_points()
+        self.stdout.write(self.style.SUCCESS(f"Updated `point` of {updated} `Place`"))
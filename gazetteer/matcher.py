@@ -0,0 +1,283 @@
+"""Match batches of coordinates to `Place`s in memory for bulk geocoding.
+
+All `Place` coordinates are loaded once into a `numpy` array. Queries use a
+`scipy` `cKDTree` over unit vectors if `scipy` is installed, otherwise a
+chunked `numpy` haversine calculation. A `PlaceMatcher` can be cached to an
+`.npz` file, which is rebuilt when the `Place` table changes.
+"""
+
+from logging import getLogger
+from os import PathLike
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+from django.db.models import Count, Max, Sum
+
+from .models import Place
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+logger = getLogger(__name__)
+
+EARTH_RADIUS_KM: Final[float] = 6371.0088
+DEFAULT_MATCHER_CHUNK_SIZE: Final[int] = 1024
+DEFAULT_MATCHER_CACHE_PATH: Final[Path] = (
+    Path("gazetteer") / "data" / "place-coordinates.npz"
+)
+
+
+def unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Return 3D unit vectors for `latitudes` and `longitudes` in degrees.
+
+    Example:
+        ```pycon
+        >>> unit_vectors(np.array([0.0, 90.0]), np.array([0.0, 0.0])).round(6)
+        array([[1., 0., 0.],
+               [0., 0., 1.]])
+
+        ```
+    """
+    lat: np.ndarray = np.radians(latitudes)
+    lon: np.ndarray = np.radians(longitudes)
+    return np.column_stack(
+        (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat))
+    )
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Convert unit sphere chord lengths to great circle distances in km."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Convert a great circle distance in km to a unit sphere chord length."""
+    return 2 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+def haversine_km(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    place_latitudes: np.ndarray,
+    place_longitudes: np.ndarray,
+) -> np.ndarray:
+    """Return a matrix of distances in km from each point to each place.
+
+    Example:
+        ```pycon
+        >>> manchester, liverpool = (53.4808, -2.2426), (53.4084, -2.9916)
+        >>> haversine_km(
+        ...     np.array([manchester[0]]), np.array([manchester[1]]),
+        ...     np.array([liverpool[0]]), np.array([liverpool[1]]),
+        ... ).round(1)
+        array([[50.3]])
+
+        ```
+    """
+    lat: np.ndarray = np.radians(latitudes)[:, None]
+    lon: np.ndarray = np.radians(longitudes)[:, None]
+    place_lat: np.ndarray = np.radians(place_latitudes)[None, :]
+    place_lon: np.ndarray = np.radians(place_longitudes)[None, :]
+    a: np.ndarray = (
+        np.sin((place_lat - lat) / 2) ** 2
+        + np.cos(lat) * np.cos(place_lat) * np.sin((place_lon - lon) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+class PlaceMatcher:
+    """Batched nearest and within radius queries of `Place` coordinates.
+
+    Attributes:
+        pks: `Place` pk for each row of `coordinates`.
+        coordinates: `latitude` and `longitude` in degrees per `Place`.
+        signature: `Place` table state the matcher was built from, if any.
+        use_kdtree: Whether to query a `cKDTree` rather than haversine.
+
+    Example:
+        ```pycon
+        >>> matcher = PlaceMatcher(
+        ...     pks=[1, 2, 3],
+        ...     coordinates=[(53.4808, -2.2426), (53.4084, -2.9916), (51.5072, -0.1276)],
+        ...     use_kdtree=False,
+        ... )
+        >>> distances, pks = matcher.nearest([53.4875, 51.5], [-2.2926, -0.12], k=2)
+        >>> pks.tolist()
+        [[1, 2], [3, 1]]
+        >>> distances[0].round(1).tolist()
+        [3.4, 47.1]
+        >>> [pks.tolist() for pks in matcher.within_radius([53.45], [-2.6], 30)]
+        [[1, 2]]
+
+        ```
+    """
+
+    def __init__(
+        self,
+        pks: np.ndarray,
+        coordinates: np.ndarray,
+        signature: np.ndarray | None = None,
+        use_kdtree: bool | None = None,
+        chunk_size: int = DEFAULT_MATCHER_CHUNK_SIZE,
+    ) -> None:
+        self.pks: np.ndarray = np.asarray(pks, dtype=np.int64)
+        self.coordinates: np.ndarray = np.asarray(coordinates, dtype=np.float64)
+        self.signature = signature
+        self.use_kdtree: bool = (
+            cKDTree is not None if use_kdtree is None else use_kdtree
+        )
+        self.chunk_size = chunk_size
+        self.tree = (
+            cKDTree(unit_vectors(*self.coordinates.T)) if self.use_kdtree else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.pks)
+
+    @classmethod
+    def from_db(cls, **kwargs) -> "PlaceMatcher":
+        """Build from all `Place`s with coordinates in one query."""
+        rows: np.ndarray = np.array(
+            Place.objects.filter(latitude__isnull=False, longitude__isnull=False)
+            .order_by("pk")
+            .values_list("pk", "latitude", "longitude"),
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        return cls(
+            pks=rows[:, 0],
+            coordinates=rows[:, 1:],
+            signature=place_signature(),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_cache(
+        cls, path: PathLike = DEFAULT_MATCHER_CACHE_PATH, **kwargs
+    ) -> "PlaceMatcher":
+        """Load from `path`, rebuilding and saving if `Place` has changed."""
+        path = Path(path)
+        signature: np.ndarray = place_signature()
+        if path.exists():
+            with np.load(path) as cached:
+                if np.array_equal(cached["signature"], signature):
+                    return cls(
+                        pks=cached["pks"],
+                        coordinates=cached["coordinates"],
+                        signature=signature,
+                        **kwargs,
+                    )
+            logger.info(f"`Place` changed since {path} was saved, rebuilding")
+        matcher: PlaceMatcher = cls.from_db(**kwargs)
+        matcher.save(path)
+        return matcher
+
+    def save(self, path: PathLike = DEFAULT_MATCHER_CACHE_PATH) -> Path:
+        """Save `pks`, `coordinates` and `signature` to an `.npz` file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            pks=self.pks,
+            coordinates=self.coordinates,
+            signature=self.signature if self.signature is not None else np.array([]),
+        )
+        return path
+
+    def _haversine_chunks(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        """Yield `(start, distances)` for chunks of at most `chunk_size` points."""
+        for start in range(0, len(latitudes), self.chunk_size):
+            stop: int = start + self.chunk_size
+            yield start, haversine_km(
+                latitudes[start:stop],
+                longitudes[start:stop],
+                self.coordinates[:, 0],
+                self.coordinates[:, 1],
+            )
+
+    def nearest(
+        self, latitudes: np.ndarray, longitudes: np.ndarray, k: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return distances in km and pks of the `k` nearest `Place`s per point.
+
+        Both arrays have shape `(len(latitudes), k)`, nearest first, with
+        `k` reduced to the number of `Place`s if fewer.
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        k = min(k, len(self))
+        if k <= 0:
+            return (
+                np.empty((len(latitudes), 0)),
+                np.empty((len(latitudes), 0), dtype=np.int64),
+            )
+        if self.tree is not None:
+            chords, indexes = self.tree.query(
+                unit_vectors(latitudes, longitudes), k=[*range(1, k + 1)]
+            )
+            return chord_to_km(chords), self.pks[indexes]
+        distances: np.ndarray = np.empty((len(latitudes), k))
+        indexes: np.ndarray = np.empty((len(latitudes), k), dtype=np.int64)
+        for start, chunk in self._haversine_chunks(latitudes, longitudes):
+            nearest: np.ndarray = np.argpartition(chunk, k - 1, axis=1)[:, :k]
+            nearest_distances: np.ndarray = np.take_along_axis(chunk, nearest, axis=1)
+            order: np.ndarray = np.argsort(nearest_distances, axis=1)
+            stop: int = start + len(chunk)
+            indexes[start:stop] = np.take_along_axis(nearest, order, axis=1)
+            distances[start:stop] = np.take_along_axis(nearest_distances, order, axis=1)
+        return distances, self.pks[indexes]
+
+    def within_radius(
+        self, latitudes: np.ndarray, longitudes: np.ndarray, radius_km: float
+    ) -> list[np.ndarray]:
+        """Return an array of `Place` pks within `radius_km` of each point.
+
+        Each array is sorted nearest first.
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        if self.tree is not None:
+            vectors: np.ndarray = unit_vectors(latitudes, longitudes)
+            matches: list[np.ndarray] = []
+            for vector, indexes in zip(
+                vectors, self.tree.query_ball_point(vectors, km_to_chord(radius_km))
+            ):
+                indexes = np.asarray(indexes, dtype=np.int64)
+                chords: np.ndarray = np.linalg.norm(
+                    self.tree.data[indexes] - vector, axis=1
+                )
+                matches.append(self.pks[indexes[np.argsort(chords)]])
+            return matches
+        matches = []
+        for _, chunk in self._haversine_chunks(latitudes, longitudes):
+            for distances in chunk:
+                indexes = np.flatnonzero(distances <= radius_km)
+                matches.append(self.pks[indexes[np.argsort(distances[indexes])]])
+        return matches
+
+
+def place_signature() -> np.ndarray:
+    """Return `Place` state used to detect changes since a matcher was built.
+
+    That is the count, max pk, latest `updated_at` and coordinate sums. The
+    sums catch `QuerySet.update` calls, which do not set `updated_at`.
+    """
+    state: dict = Place.objects.aggregate(
+        count=Count("pk"),
+        max_pk=Max("pk"),
+        updated_at=Max("updated_at"),
+        latitude_sum=Sum("latitude"),
+        longitude_sum=Sum("longitude"),
+    )
+    updated_at: float = state["updated_at"].timestamp() if state["updated_at"] else 0
+    return np.array(
+        [
+            state["count"],
+            state["max_pk"] or 0,
+            updated_at,
+            state["latitude_sum"] or 0,
+            state["longitude_sum"] or 0,
+        ]
+    )
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-19 16:20
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+POPULATE_PLACE_POINTS_SQL: str = """
+UPDATE gazetteer_place
+SET point = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gazetteer", "0002_alter_admincounty_options_alter_country_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="place",
+            name="point",
+            field=django.contrib.gis.db.models.fields.PointField(
+                geography=True, null=True, srid=4326
+            ),
+        ),
+        migrations.RunSQL(POPULATE_PLACE_POINTS_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,4 +1,15 @@
+from typing import Final
+
+from django.apps import apps
 from django.contrib.gis.db import models
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import Point, Polygon
+from django.contrib.gis.measure import D
+from django.db.models import F, FloatField, Func, Q, QuerySet, Value
+
+WGS84_SRID: Final[int] = 4326
+DEFAULT_RADIUS_KM: Final[float] = 10.0
+DEFAULT_K_NEAREST: Final[int] = 10
 
 
 class GazetteerModel(models.Model):
@@ -46,7 +57,88 @@ class HistoricCounty(GazetteerModel):
         verbose_name_plural = "historic counties"
 
 
-class PlaceOfPublicationManager(models.Manager):
+class KNNDistance(Func):
+    """PostGIS `<->` distance operator, ordered by the `GiST` index."""
+
+    arg_joiner = " <-> "
+    template = "%(expressions)s"
+    output_field = FloatField()
+
+
+class PlaceQuerySet(models.QuerySet):
+    """Spatial queries of `Place.point`, which are answered via its `GiST` index.
+
+    Coordinates are WGS84, with `Point(longitude, latitude)` order.
+    """
+
+    def update_points(self) -> int:
+        """Set `point` from `latitude` and `longitude` in one query."""
+        return self.filter(latitude__isnull=False, longitude__isnull=False).update(
+            point=Func(
+                Func(F("longitude"), F("latitude"), function="ST_MakePoint"),
+                WGS84_SRID,
+                function="ST_SetSRID",
+                output_field=models.PointField(srid=WGS84_SRID),
+            )
+        )
+
+    def within_radius(
+        self, point: Point, radius_km: float = DEFAULT_RADIUS_KM
+    ) -> "PlaceQuerySet":
+        """Return `Place`s within `radius_km` of `point`, nearest first."""
+        return (
+            self.filter(point__dwithin=(point, D(km=radius_km)))
+            .annotate(distance=Distance("point", point))
+            .order_by("distance")
+        )
+
+    def k_nearest(self, point: Point, k: int = DEFAULT_K_NEAREST) -> "PlaceQuerySet":
+        """Return the `k` `Place`s nearest `point`, nearest first."""
+        return (
+            self.filter(point__isnull=False)
+            .order_by(
+                KNNDistance(
+                    "point",
+                    Value(
+                        point,
+                        output_field=models.PointField(geography=True, srid=WGS84_SRID),
+                    ),
+                )
+            )
+            .annotate(distance=Distance("point", point))[:k]
+        )
+
+    def in_bbox(
+        self,
+        min_longitude: float,
+        min_latitude: float,
+        max_longitude: float,
+        max_latitude: float,
+    ) -> "PlaceQuerySet":
+        """Return `Place`s within a longitude/latitude bounding box."""
+        bbox: Polygon = Polygon.from_bbox(
+            (min_longitude, min_latitude, max_longitude, max_latitude)
+        )
+        bbox.srid = WGS84_SRID
+        return self.filter(point__intersects=bbox)
+
+    def newspapers(self) -> QuerySet:
+        """Return `Newspaper`s published in these `Place`s."""
+        Newspaper = apps.get_model("newspapers", "Newspaper")
+        return Newspaper.objects.filter(place_of_publication__in=self.values("pk"))
+
+    def census_records(self) -> QuerySet:
+        """Return census `Record`s with a county, district or sub district here."""
+        Record = apps.get_model("census", "Record")
+        pks: QuerySet = self.values("pk")
+        return Record.objects.filter(
+            Q(REGCNTY_place__in=pks)
+            | Q(REGDIST_place__in=pks)
+            | Q(SUBDIST_place__in=pks)
+        )
+
+
+class PlaceOfPublicationManager(models.Manager.from_queryset(PlaceQuerySet)):
     def get_by_natural_key(self, wikidata_id, label):
         return self.get(wikidata_id=wikidata_id, label=label)
 
@@ -57,6 +149,7 @@ class Place(GazetteerModel):
     latitude = models.FloatField(null=True)
     longitude = models.FloatField(null=True)
     geonames_ids = models.CharField(max_length=255, default=None, null=True)
+    point = models.PointField(geography=True, srid=WGS84_SRID, null=True)
 
     historic_county = models.ForeignKey(
         HistoricCounty,
@@ -90,3 +183,12 @@ class Place(GazetteerModel):
 
     def __str__(self):
         return str(self.label)
+
+    def save(self, *args, **kwargs):
+        # Derived from `latitude` and `longitude`, so kept in step on every save.
+        # Bulk writes and `loaddata` bypass this: call `update_points` after them
+        if None in (self.latitude, self.longitude):
+            self.point = None
+        else:
+            self.point = Point(self.longitude, self.latitude, srid=WGS84_SRID)
+        super().save(*args, **kwargs)
@@ -0,0 +1,239 @@
+"""Resolve place-name labels to gazetteer primary keys without per-row queries.
+
+Fixture builders previously matched labels with a database query (or a
+`DataFrame.query`) per row. A `LabelIndex` loads `label -> pk` pairs once and
+answers lookups from memory, and `PlaceResolver` combines indexes of
+`HistoricCounty`, `AdminCounty` and `Place` with the fallbacks used to match
+census labels.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from functools import lru_cache
+from typing import Final, NamedTuple
+
+from django.db.models import QuerySet
+
+from .models import AdminCounty, HistoricCounty, Place
+
+DEFAULT_LABEL_FIELD: Final[str] = "label"
+DEFAULT_RESOLVER_CACHE_SIZE: Final[int] = 2**16
+
+DIRECTIONAL_WORDS: Final[tuple[str, ...]] = (
+    "east",
+    "north",
+    "west",
+    "south",
+    "western",
+    "southeast",
+    "first",
+    "central",
+    "south east",
+)
+
+
+@lru_cache(maxsize=DEFAULT_RESOLVER_CACHE_SIZE)
+def normalise_label(label: str) -> str:
+    """Return `label` case folded with whitespace collapsed for matching.
+
+    Example:
+        ```pycon
+        >>> normalise_label("  Bury  St Edmunds ")
+        'bury st edmunds'
+        >>> normalise_label("YORKSHIRE") == normalise_label("Yorkshire")
+        True
+
+        ```
+    """
+    return " ".join(str(label).split()).casefold()
+
+
+def strip_directional_words(label: str) -> str:
+    """Remove `DIRECTIONAL_WORDS` in lower or upper case from `label`.
+
+    Example:
+        ```pycon
+        >>> strip_directional_words("WEST DERBY")
+        'DERBY'
+        >>> strip_directional_words("Bolton")
+        'Bolton'
+
+        ```
+    """
+    for word in DIRECTIONAL_WORDS:
+        if f"{word} " in label.lower() or f" {word}" in label.lower():
+            label = label.replace(f"{word} ", " ").replace(f" {word}", " ").strip()
+            label = (
+                label.replace(f"{word.upper()} ", " ")
+                .replace(f" {word.upper()}", " ")
+                .strip()
+            )
+    return label
+
+
+class LabelIndex:
+    """An in-memory index of normalised labels to primary keys.
+
+    Labels shared by more than one pk are ambiguous: `get` returns `None` for
+    them (as `QuerySet.get` would fail) while `pks` returns all of them.
+
+    Attributes:
+        normalise: `Callable` applied to labels before indexing and lookup.
+
+    Example:
+        ```pycon
+        >>> index = LabelIndex([("Derby", 1), ("Bolton", 2), ("BOLTON", 3)])
+        >>> index.get("derby")
+        1
+        >>> index.get("Bolton") is None
+        True
+        >>> index.pks("bolton")
+        (2, 3)
+        >>> index.resolve(["Derby", "Wigan"])
+        {'Derby': 1, 'Wigan': None}
+        >>> len(index)
+        2
+
+        ```
+    """
+
+    def __init__(
+        self,
+        pairs: Iterable[tuple[str, Hashable]],
+        normalise: Callable[[str], str] = normalise_label,
+    ) -> None:
+        self.normalise = normalise
+        index: defaultdict[str, list[Hashable]] = defaultdict(list)
+        for label, pk in pairs:
+            if isinstance(label, str):
+                index[normalise(label)].append(pk)
+        self._index: dict[str, tuple[Hashable, ...]] = {
+            label: tuple(pks) for label, pks in index.items()
+        }
+
+    @classmethod
+    def from_queryset(
+        cls,
+        queryset: QuerySet,
+        field: str = DEFAULT_LABEL_FIELD,
+        normalise: Callable[[str], str] = normalise_label,
+    ) -> "LabelIndex":
+        """Index `field` of every record in `queryset` in a single query."""
+        return cls(queryset.values_list(field, "pk").iterator(), normalise=normalise)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, label: object) -> bool:
+        return isinstance(label, str) and self.normalise(label) in self._index
+
+    def pks(self, label: str) -> tuple[Hashable, ...]:
+        """Return all pks indexed for `label`, empty if there are none."""
+        if not isinstance(label, str):
+            return ()
+        return self._index.get(self.normalise(label), ())
+
+    def get(self, label: str) -> Hashable | None:
+        """Return the pk for `label` if exactly one record matches."""
+        pks: tuple[Hashable, ...] = self.pks(label)
+        return pks[0] if len(pks) == 1 else None
+
+    def resolve(self, labels: Iterable[str]) -> dict[str, Hashable | None]:
+        """Return a `dict` of each distinct label in `labels` to `get(label)`."""
+        return {label: self.get(label) for label in dict.fromkeys(labels)}
+
+
+class ResolvedPlace(NamedTuple):
+    """The label matched and pks found for a place name."""
+
+    label: str
+    historic_county_id: int | None = None
+    admin_county_id: int | None = None
+    place_id: int | None = None
+
+    @property
+    def is_resolved(self) -> bool:
+        return any(pk is not None for pk in self[1:])
+
+
+class PlaceResolver:
+    """Resolve labels to `HistoricCounty`, `AdminCounty` and `Place` pks.
+
+    If a label matches none of the three, `DIRECTIONAL_WORDS` are removed and
+    the lookup is retried. Results are cached per label, so repeated labels
+    (common across census years) are resolved once.
+
+    Attributes:
+        preprocess: Optional `Callable` to correct labels before lookup.
+
+    Example:
+        ```pycon
+        >>> resolver = PlaceResolver(
+        ...     historic_counties=LabelIndex([("Lancashire", 1)]),
+        ...     admin_counties=LabelIndex([("Derby", 2)]),
+        ...     places=LabelIndex([("Derby", 7)]),
+        ... )
+        >>> resolver.resolve_label("WEST DERBY")[1:]
+        (None, 2, 7)
+        >>> resolved = resolver.resolve(["LANCASHIRE", "Atlantis"])
+        >>> resolved["LANCASHIRE"].historic_county_id
+        1
+        >>> resolved["Atlantis"].is_resolved
+        False
+
+        ```
+    """
+
+    def __init__(
+        self,
+        historic_counties: LabelIndex,
+        admin_counties: LabelIndex,
+        places: LabelIndex,
+        preprocess: Callable[[str], str] | None = None,
+        cache_size: int | None = DEFAULT_RESOLVER_CACHE_SIZE,
+    ) -> None:
+        self.historic_counties = historic_counties
+        self.admin_counties = admin_counties
+        self.places = places
+        self.preprocess = preprocess
+        self.resolve_label: Callable[[str], ResolvedPlace] = lru_cache(
+            maxsize=cache_size
+        )(self._resolve_label)
+
+    @classmethod
+    def from_db(
+        cls,
+        preprocess: Callable[[str], str] | None = None,
+        cache_size: int | None = DEFAULT_RESOLVER_CACHE_SIZE,
+    ) -> "PlaceResolver":
+        """Build a `PlaceResolver` from one query per gazetteer model."""
+        return cls(
+            historic_counties=LabelIndex.from_queryset(HistoricCounty.objects.all()),
+            admin_counties=LabelIndex.from_queryset(AdminCounty.objects.all()),
+            places=LabelIndex.from_queryset(Place.objects.all()),
+            preprocess=preprocess,
+            cache_size=cache_size,
+        )
+
+    def lookup(self, label: str) -> ResolvedPlace:
+        """Return pks exactly matching normalised `label`, without fallbacks."""
+        return ResolvedPlace(
+            label,
+            self.historic_counties.get(label),
+            self.admin_counties.get(label),
+            self.places.get(label),
+        )
+
+    def _resolve_label(self, label: str) -> ResolvedPlace:
+        if not isinstance(label, str):
+            return ResolvedPlace(label)
+        if self.preprocess:
+            label = self.preprocess(label)
+        resolved: ResolvedPlace = self.lookup(label)
+        if resolved.is_resolved:
+            return resolved
+        return self.lookup(strip_directional_words(label))
+
+    def resolve(self, labels: Iterable[str]) -> dict[str, ResolvedPlace]:
+        """Return a `dict` of each distinct label in `labels` resolved."""
+        return {label: self.resolve_label(label) for label in dict.fromkeys(labels)}
@@ -1,10 +1,18 @@
 from io import StringIO
 
+import numpy as np
+import pandas as pd
 import pytest
 from django.contrib.gis.geos import GeometryCollection, Point
 from django.core.management import call_command
 
-from .models import Place
+from newspapers.models import Newspaper
+
+from .management.commands.gazetteer import Command as GazetteerCommand
+from .management.commands.gazetteer import read_wikidata_gazetteer
+from .matcher import PlaceMatcher
+from .models import AdminCounty, HistoricCounty, Place
+from .resolver import PlaceResolver
 
 
 @pytest.fixture
@@ -51,6 +59,143 @@ class TestPlaceGeom:
         assert test_manc.geom.distance(liverpool_point) == manc_to_liverpool_2d_dist
 
 
+@pytest.mark.django_db
+def test_place_resolver_from_db() -> None:
+    """Test resolving labels against gazetteer records loaded once."""
+    lancashire = HistoricCounty.objects.create(label="Lancashire", wikidata_id="Q1")
+    derby_county = AdminCounty.objects.create(label="Derby", wikidata_id="Q2")
+    derby = Place.objects.create(label="Derby", wikidata_id="Q3")
+    Place.objects.create(label="Newport", wikidata_id="Q4")
+    Place.objects.create(label="NEWPORT", wikidata_id="Q5")
+    resolver = PlaceResolver.from_db()
+    resolved = resolver.resolve(["LANCASHIRE", "West Derby", "Newport"])
+    assert resolved["LANCASHIRE"].historic_county_id == lancashire.pk
+    assert resolved["West Derby"].admin_county_id == derby_county.pk
+    assert resolved["West Derby"].place_id == derby.pk
+    assert not resolved["Newport"].is_resolved
+
+
+@pytest.mark.django_db
+def test_place_spatial_queries(manc_point, liverpool_point) -> None:
+    """Test `Place.point` is set on save and queried by distance and bbox."""
+    manchester = Place.objects.create(
+        label="Manchester",
+        wikidata_id="Q18125",
+        latitude=manc_point.x,
+        longitude=manc_point.y,
+    )
+    liverpool = Place.objects.create(
+        label="Liverpool",
+        wikidata_id="Q24826",
+        latitude=liverpool_point.x,
+        longitude=liverpool_point.y,
+    )
+    newspaper = Newspaper.objects.create(
+        publication_code="0000001",
+        title="Manchester Times",
+        place_of_publication=manchester,
+    )
+    salford = Point(-2.2926, 53.4875, srid=4326)
+    assert manchester.point.coords == (manc_point.y, manc_point.x)
+    assert list(Place.objects.within_radius(salford, radius_km=10)) == [manchester]
+    assert list(Place.objects.k_nearest(salford, k=2)) == [manchester, liverpool]
+    assert list(Place.objects.in_bbox(-3.1, 53.3, -2.8, 53.5)) == [liverpool]
+    assert list(Place.objects.within_radius(salford).newspapers()) == [newspaper]
+    Place.objects.update(point=None)
+    assert Place.objects.update_points() == 2
+    manchester.latitude, manchester.longitude = liverpool_point.x, liverpool_point.y
+    manchester.save()
+    assert manchester.point.coords == (liverpool_point.y, liverpool_point.x)
+
+
+@pytest.mark.django_db
+def test_gazetteer_fixtures_set_points(manc_point, tmp_path) -> None:
+    """Test `Place.point` is set after bulk writing and loading fixtures."""
+    command = GazetteerCommand()
+    command.get_output_dir = lambda app_name=None: tmp_path
+    df = pd.DataFrame(
+        {
+            "wikidata_id": ["Q18125"],
+            "label": ["Manchester"],
+            "latitude": [manc_point.x],
+            "longitude": [manc_point.y],
+        },
+        index=[1],
+    )
+    command.write_models([(df, Place)])
+    assert Place.objects.get().point.coords == (manc_point.y, manc_point.x)
+    Place.objects.update(point=None)
+    command.load_fixtures([Place])
+    assert Place.objects.get().point.coords == (manc_point.y, manc_point.x)
+
+
+@pytest.mark.django_db
+def test_place_matcher_cache(manc_point, liverpool_point, tmp_path) -> None:
+    """Test `PlaceMatcher` queries and `.npz` cache invalidation."""
+    cache_path = tmp_path / "place-coordinates.npz"
+    manchester = Place.objects.create(
+        label="Manchester",
+        wikidata_id="Q18125",
+        latitude=manc_point.x,
+        longitude=manc_point.y,
+    )
+    matcher = PlaceMatcher.from_cache(cache_path)
+    assert cache_path.exists()
+    assert len(matcher) == 1
+    liverpool = Place.objects.create(
+        label="Liverpool",
+        wikidata_id="Q24826",
+        latitude=liverpool_point.x,
+        longitude=liverpool_point.y,
+    )
+    matcher = PlaceMatcher.from_cache(cache_path)
+    assert len(matcher) == 2
+    distances, pks = matcher.nearest([53.41, 53.48], [-2.98, -2.29])
+    assert pks[:, 0].tolist() == [liverpool.pk, manchester.pk]
+    assert [pks.tolist() for pks in matcher.within_radius([53.41], [-2.98], 5)] == [
+        [liverpool.pk]
+    ]
+    Place.objects.filter(pk=liverpool.pk).update(latitude=manc_point.x)
+    matcher = PlaceMatcher.from_cache(cache_path)
+    assert matcher.coordinates[matcher.pks == liverpool.pk, 0] == manc_point.x
+
+
+@pytest.mark.parametrize("use_kdtree", [False, True])
+def test_place_matcher_empty(use_kdtree) -> None:
+    """Test `PlaceMatcher.nearest` with no `Place`s or `k=0`."""
+    if use_kdtree:
+        pytest.importorskip("scipy")
+    matcher = PlaceMatcher(pks=[], coordinates=np.empty((0, 2)), use_kdtree=use_kdtree)
+    distances, pks = matcher.nearest([53.48, 53.41], [-2.24, -2.98])
+    assert distances.shape == pks.shape == (2, 0)
+    matcher = PlaceMatcher(
+        pks=[1], coordinates=[(53.4808, -2.2426)], use_kdtree=use_kdtree
+    )
+    distances, pks = matcher.nearest([53.48], [-2.24], k=0)
+    assert distances.shape == pks.shape == (1, 0)
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_read_wikidata_gazetteer_dtypes(engine, tmp_path) -> None:
+    """Test ids keep leading zeros whichever `CSV` engine is used."""
+    path = tmp_path / "wikidata_gazetteer_selected.csv"
+    path.write_text(
+        "wikidata_id,english_label,latitude,longitude,geonamesIDs,extra\n"
+        "Q2607,Derby,52.92,-1.47,0123,a\n"
+        "Q18125,Manchester,53.48,-2.24,123,b\n"
+    )
+    df = read_wikidata_gazetteer(path, engine=engine)
+    assert list(df.columns) == [
+        "wikidata_id",
+        "english_label",
+        "latitude",
+        "longitude",
+        "geonamesIDs",
+    ]
+    assert df.geonamesIDs.tolist() == ["0123", "123"]
+    assert df.latitude.tolist() == [52.92, 53.48]
+
+
 @pytest.mark.xfail(reason="SystemExit: App(s) not allowed: ['gazetteer']")
 @pytest.mark.django_db
 def test_gazetteer_admin_county_invalid_str_fixture_error():
@@ -0,0 +1,341 @@
+"""Stream `QuerySet`s to `pyarrow` record batches and `parquet` files.
+
+Rows are read with `values_list` through a server-side cursor and converted a
+batch at a time, rather than creating a model instance per row. `pyarrow` is
+only imported when first needed, to keep it out of every command's startup.
+
+Files written from an `arrow_schema` record their model, so they can be loaded
+back as fixtures with `load_arrow_fixture` via `PostgreSQL` `COPY`.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from logging import getLogger
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Field, ForeignObjectRel, Model, QuerySet
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = getLogger(__name__)
+
+DEFAULT_ARROW_BATCH_SIZE: Final[int] = 50000
+DEFAULT_PARQUET_COMPRESSION: Final[str] = "zstd"
+
+PARQUET_FORMAT_EXTENSION: Final[str] = ".parquet"
+ARROW_FORMAT_EXTENSION: Final[str] = ".arrow"
+# File extension to `pyarrow.dataset` format name
+ARROW_FIXTURE_FORMATS: Final[dict[str, str]] = {
+    PARQUET_FORMAT_EXTENSION: "parquet",
+    ARROW_FORMAT_EXTENSION: "ipc",
+}
+# `Schema` metadata key recording the `Model._meta.label_lower` exported
+ARROW_MODEL_METADATA_KEY: Final[bytes] = b"lwmdb.model"
+
+# `Field.get_internal_type()` to `pyarrow` type name, see `arrow_type`
+ARROW_INTERNAL_TYPES: Final[dict[str, str]] = {
+    "AutoField": "int32",
+    "BigAutoField": "int64",
+    "BigIntegerField": "int64",
+    "BooleanField": "bool_",
+    "CharField": "string",
+    "DateField": "date32",
+    "DateTimeField": "timestamp",
+    "FloatField": "float64",
+    "IntegerField": "int32",
+    "JSONField": "string",
+    "PositiveBigIntegerField": "int64",
+    "PositiveIntegerField": "int32",
+    "PositiveSmallIntegerField": "int16",
+    "SlugField": "string",
+    "SmallIntegerField": "int16",
+    "TextField": "string",
+    "URLField": "string",
+}
+
+
+def import_pyarrow():
+    """Return the `pyarrow` module, or raise an `ImportError` explaining why."""
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "`pyarrow` is required for `parquet` and `arrow` export: "
+            "run `poetry install` to install it"
+        ) from error
+    return pyarrow
+
+
+def lookup_field(model: type[Model], lookup: str) -> Field:
+    """Return the `Field` a `values_list` `lookup` of `model` refers to.
+
+    `ForeignKey` attnames (`issue_id`) and related lookups (`issue__issue_date`)
+    are followed to the concrete field of the related model.
+    """
+    *relations, name = lookup.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field: Field | ForeignObjectRel = model._meta.get_field(name)
+    while field.is_relation:
+        field = field.target_field
+    return field
+
+
+def arrow_type(field: Field, dictionary: bool = False) -> "pa.DataType":
+    """Return the `pyarrow` type for values of `field`.
+
+    Args:
+        field: A concrete `Field`, see `lookup_field`.
+        dictionary: Whether to dictionary encode `str` values.
+    """
+    pa = import_pyarrow()
+    type_name: str = ARROW_INTERNAL_TYPES.get(field.get_internal_type(), "string")
+    if type_name == "timestamp":
+        return pa.timestamp("us", tz="UTC")
+    data_type: pa.DataType = getattr(pa, type_name)()
+    if dictionary and data_type == pa.string():
+        return pa.dictionary(pa.int32(), data_type)
+    return data_type
+
+
+def arrow_schema(
+    model: type[Model],
+    lookups: Iterable[str] | None = None,
+    types: dict[str, "pa.DataType"] | None = None,
+    dictionary: Iterable[str] = (),
+) -> "pa.Schema":
+    """Return a `pyarrow` `Schema` for `values_list(*lookups)` of `model`.
+
+    Args:
+        model: `Model` to export.
+        lookups: Field names, attnames or related lookups. Defaults to the
+            `attname` of every concrete field.
+        types: `pyarrow` types for lookups, overriding `arrow_type`. Lookups
+            which are annotations must be included here.
+        dictionary: Lookups of `str` values to dictionary encode.
+    """
+    pa = import_pyarrow()
+    types = types or {}
+    dictionary = set(dictionary)
+    if lookups is None:
+        lookups = [field.attname for field in model._meta.concrete_fields]
+    return pa.schema(
+        [
+            pa.field(
+                lookup,
+                (
+                    types[lookup]
+                    if lookup in types
+                    else arrow_type(lookup_field(model, lookup), lookup in dictionary)
+                ),
+            )
+            for lookup in lookups
+        ],
+        metadata={ARROW_MODEL_METADATA_KEY: model._meta.label_lower},
+    )
+
+
+def record_batch(rows: list[tuple], schema: "pa.Schema") -> "pa.RecordBatch":
+    """Convert `values_list` `rows` to a `RecordBatch` of `schema`."""
+    pa = import_pyarrow()
+    columns: list[tuple] = list(zip(*rows)) or [() for _ in schema]
+    arrays: list[pa.Array] = []
+    for field, values in zip(schema, columns):
+        data_type: pa.DataType = field.type
+        if pa.types.is_dictionary(data_type):
+            arrays.append(
+                pa.array(values, type=data_type.value_type)
+                .dictionary_encode()
+                .cast(data_type)
+            )
+            continue
+        if data_type == pa.string():
+            values = [
+                value if value is None or isinstance(value, str) else json.dumps(value)
+                for value in values
+            ]
+        arrays.append(pa.array(values, type=data_type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_record_batches(
+    queryset: QuerySet,
+    schema: "pa.Schema",
+    batch_size: int = DEFAULT_ARROW_BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """Yield `RecordBatch`es of `schema` columns of `queryset`.
+
+    `QuerySet.iterator` uses a server-side cursor on `PostgreSQL`, so at most
+    `batch_size` rows are held in memory at once.
+    """
+    rows: Iterator[tuple[Any, ...]] = queryset.values_list(*schema.names).iterator(
+        chunk_size=batch_size
+    )
+    while batch := list(islice(rows, batch_size)):
+        yield record_batch(batch, schema)
+
+
+def queryset_to_arrow(
+    queryset: QuerySet,
+    schema: "pa.Schema | None" = None,
+    batch_size: int = DEFAULT_ARROW_BATCH_SIZE,
+) -> "pa.RecordBatchReader":
+    """Return a `RecordBatchReader` streaming `queryset` in `schema`.
+
+    Call `read_all()` on the result for a `pyarrow` `Table`.
+    """
+    pa = import_pyarrow()
+    schema = schema or arrow_schema(queryset.model)
+    return pa.RecordBatchReader.from_batches(
+        schema, iter_record_batches(queryset, schema, batch_size)
+    )
+
+
+def queryset_to_parquet(
+    queryset: QuerySet,
+    path: PathLike,
+    schema: "pa.Schema | None" = None,
+    batch_size: int = DEFAULT_ARROW_BATCH_SIZE,
+    compression: str = DEFAULT_PARQUET_COMPRESSION,
+) -> int:
+    """Write `queryset` to a `parquet` file at `path` a batch at a time.
+
+    Returns the number of rows written.
+    """
+    import_pyarrow()
+    from pyarrow import parquet
+
+    reader: pa.RecordBatchReader = queryset_to_arrow(queryset, schema, batch_size)
+    rows: int = 0
+    with parquet.ParquetWriter(path, reader.schema, compression=compression) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def fixture_model(path: PathLike, schema: "pa.Schema") -> type[Model]:
+    """Return the `Model` an `arrow` or `parquet` fixture at `path` is for.
+
+    The model is read from `ARROW_MODEL_METADATA_KEY` in `schema`, falling back
+    to the file name before any `-` suffix, like `Newspaper-1.parquet`.
+    """
+    label: bytes | None = (schema.metadata or {}).get(ARROW_MODEL_METADATA_KEY)
+    if label:
+        return apps.get_model(label.decode())
+    model_name: str = Path(path).stem.split("-")[0].lower()
+    models: list[type[Model]] = [
+        model for model in apps.get_models() if model._meta.model_name == model_name
+    ]
+    if len(models) != 1:
+        raise ValueError(
+            f"Cannot determine the model of {path}: {len(models)} models "
+            f"named {model_name!r} and no {ARROW_MODEL_METADATA_KEY!r} metadata"
+        )
+    return models[0]
+
+
+def fixture_columns(model: type[Model], names: Iterable[str]) -> dict[str, Field]:
+    """Return `names` which are a field `name`, `attname` or `column` of `model`.
+
+    Example:
+        ```pycon
+        >>> from newspapers.models import Item
+        >>> columns = fixture_columns(Item, ["item_code", "issue", "year"])
+        >>> {name: field.column for name, field in columns.items()}
+        {'item_code': 'item_code', 'issue': 'issue_id'}
+
+        ```
+    """
+    fields: dict[str, Field] = {}
+    for field in model._meta.concrete_fields:
+        fields |= dict.fromkeys((field.name, field.attname, field.column), field)
+    return {name: fields[name] for name in names if name in fields}
+
+
+def load_arrow_fixture(
+    path: PathLike,
+    model: type[Model] | None = None,
+    batch_size: int = DEFAULT_ARROW_BATCH_SIZE,
+) -> int:
+    """Load a `parquet` or `arrow` fixture into `model` with `COPY`.
+
+    Batches are streamed with `COPY` into a temporary table, then upserted on
+    the primary key so, like `loaddata`, existing records are updated and
+    missing `auto_now` timestamps are set. Columns which are not fields of
+    `model` (such as `exportparquet` partition columns) are skipped, and the
+    primary key sequence is reset afterwards.
+
+    Args:
+        path: A `.parquet` or `.arrow` (`IPC`) file.
+        model: `Model` to load into, by default from `fixture_model`.
+        batch_size: Rows read from `path` at a time.
+
+    Returns:
+        The number of rows loaded.
+    """
+    import_pyarrow()
+    from pyarrow import dataset
+
+    source = dataset.dataset(path, format=ARROW_FIXTURE_FORMATS[Path(path).suffix])
+    model = model or fixture_model(path, source.schema)
+    columns: dict[str, Field] = fixture_columns(model, source.schema.names)
+    if skipped := set(source.schema.names) - set(columns):
+        logger.warning(f"Skipping columns not in {model.__name__}: {sorted(skipped)}")
+    quote = connection.ops.quote_name
+    table: str = quote(model._meta.db_table)
+    temp_table: str = quote(f"{model._meta.db_table}_fixture")
+    copy_columns: list[str] = [quote(field.column) for field in columns.values()]
+    # `loaddata` sets `auto_now` and `auto_now_add` fields missing from fixtures
+    timestamp_columns: dict[str, bool] = {
+        quote(field.column): field.auto_now
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        if field not in columns.values()
+    }
+    insert_columns: str = ", ".join(copy_columns + list(timestamp_columns))
+    select_columns: str = ", ".join(
+        copy_columns + ["CURRENT_TIMESTAMP"] * len(timestamp_columns)
+    )
+    conflict: str = ""
+    pk_column: str = quote(model._meta.pk.column)
+    if pk_column in copy_columns:
+        updates: str = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in copy_columns
+            + [column for column, auto_now in timestamp_columns.items() if auto_now]
+            if column != pk_column
+        )
+        conflict = f"ON CONFLICT ({pk_column}) " + (
+            f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        )
+    rows: int = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {temp_table}")
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {temp_table} ON COMMIT DROP AS "
+            f"SELECT {', '.join(copy_columns)} FROM {table} WITH NO DATA"
+        )
+        with cursor.copy(
+            f"COPY {temp_table} ({', '.join(copy_columns)}) FROM STDIN"
+        ) as copy:
+            for batch in source.to_batches(
+                columns=list(columns), batch_size=batch_size
+            ):
+                for row in zip(*(column.to_pylist() for column in batch.columns)):
+                    copy.write_row(row)
+                rows += batch.num_rows
+        cursor.execute(
+            f"INSERT INTO {table} ({insert_columns}) "
+            f"SELECT {select_columns} FROM {temp_table} {conflict}"
+        )
+        for sql in connection.ops.sequence_reset_sql(no_style(), [model]):
+            cursor.execute(sql)
+    return rows
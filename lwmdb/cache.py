@@ -0,0 +1,149 @@
+"""Cache expensive reads under versioned keys invalidated after each ingest.
+
+Each namespace (by default `newspapers`) has a data version stored in the
+cache. Cached values are stored under that version, so bumping it with
+`bump_data_version` (as fixture loading and ingest commands do) makes every
+older entry unreachable at once, to expire by timeout, without deleting keys
+by pattern.
+
+Versions start from the current time rather than `1`, so if the version key
+itself is evicted, values cached under earlier versions are not reused.
+"""
+
+import json
+from collections.abc import Callable
+from functools import wraps
+from hashlib import md5
+from logging import getLogger
+from time import time_ns
+from typing import Any, Final, ParamSpec, TypeVar
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse
+
+logger = getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DATA_VERSION_KEY_PREFIX: Final[str] = "lwmdb:data-version"
+DEFAULT_DATA_NAMESPACE: Final[str] = "newspapers"
+# Seconds to keep cached values, which are also invalidated by version
+DEFAULT_CACHE_TIMEOUT: Final[int] = 60 * 60 * 24
+
+_MISSING: Final[object] = object()
+
+
+def data_version_key(namespace: str = DEFAULT_DATA_NAMESPACE) -> str:
+    """Return the cache key of the data version of `namespace`.
+
+    Example:
+        ```pycon
+        >>> data_version_key()
+        'lwmdb:data-version:newspapers'
+
+        ```
+    """
+    return f"{DATA_VERSION_KEY_PREFIX}:{namespace}"
+
+
+def data_version(namespace: str = DEFAULT_DATA_NAMESPACE) -> int:
+    """Return the current data version of `namespace`, setting it if missing."""
+    key: str = data_version_key(namespace)
+    cache.add(key, time_ns(), timeout=None)
+    return cache.get(key) or time_ns()
+
+
+def bump_data_version(*namespaces: str) -> None:
+    """Invalidate values cached for `namespaces`, by default `newspapers`."""
+    for namespace in namespaces or (DEFAULT_DATA_NAMESPACE,):
+        key: str = data_version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time_ns(), timeout=None)
+        logger.info(f"Bumped {namespace} cache data version")
+
+
+def versioned_key(name: str, *args: Any, **kwargs: Any) -> str:
+    """Return a cache key for `name` called with `args` and `kwargs`.
+
+    Example:
+        ```pycon
+        >>> versioned_key("item_type_counts", publication_code="0003040")
+        'lwmdb:item_type_counts:cc0ea8f49a5ed5bfe4fe1233a75c748a'
+
+        ```
+    """
+    arguments: str = json.dumps([args, kwargs], sort_keys=True, cls=DjangoJSONEncoder)
+    return f"lwmdb:{name}:{md5(arguments.encode()).hexdigest()}"
+
+
+def cached_query(
+    namespace: str = DEFAULT_DATA_NAMESPACE,
+    timeout: int = DEFAULT_CACHE_TIMEOUT,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Cache the result of a function per arguments and `namespace` version.
+
+    The decorated function's results must be picklable, and its arguments
+    `JSON` serialisable.
+
+    Example:
+        ```python
+        @cached_query()
+        def item_type_counts(publication_code: str | None = None) -> dict[str, int]:
+            ...
+        ```
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            key: str = versioned_key(func.__qualname__, *args, **kwargs)
+            version: int = data_version(namespace)
+            result = cache.get(key, _MISSING, version=version)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.set(key, result, timeout=timeout, version=version)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def cache_response(
+    namespace: str = DEFAULT_DATA_NAMESPACE,
+    timeout: int = DEFAULT_CACHE_TIMEOUT,
+) -> Callable:
+    """Cache successful responses of a `GET` view per full path and version.
+
+    Streaming responses and responses other than `200` are not cached. Use
+    with `method_decorator` on class-based views.
+    """
+
+    def decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method != "GET":
+                return view(request, *args, **kwargs)
+            key: str = versioned_key(view.__qualname__, request.get_full_path())
+            version: int = data_version(namespace)
+            cached: tuple[bytes, str] | None = cache.get(key, version=version)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+            response: HttpResponse = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(
+                    key,
+                    (response.content, response["Content-Type"]),
+                    timeout=timeout,
+                    version=version,
+                )
+            return response
+
+        return wrapper
+
+    return decorator
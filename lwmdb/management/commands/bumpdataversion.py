@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from ...cache import DEFAULT_DATA_NAMESPACE, bump_data_version
+
+
+class Command(BaseCommand):
+    """Invalidate cached API responses and aggregates after changing data."""
+
+    help: str = "Bump the cache data version so cached queries are recalculated"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "namespaces", nargs="*", default=[DEFAULT_DATA_NAMESPACE], type=str
+        )
+
+    def handle(self, *args, **options) -> None:
+        bump_data_version(*options["namespaces"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Bumped data version of {options['namespaces']}")
+        )
@@ -6,10 +6,13 @@ import pandas as pd
 from django.conf import settings
 from django.core.management import BaseCommand
 from django.core.serializers import deserialize, serialize
+from django.db.models import Model
 from django.db.utils import OperationalError
 from django.utils import timezone
 
 from gazetteer.models import Place
+from gazetteer.resolver import LabelIndex
+from lwmdb.cache import bump_data_version
 from lwmdb.utils import log_and_django_terminal
 from mitchells.models import Entry
 from newspapers.models import Newspaper
@@ -25,8 +28,12 @@ AUTO_FILE_LOCATIONS = {
     "newspapers_overview": "fixture-files/newspapers_overview_with_links.csv",
     "mitchells_publication_for_linking": "fixture-files/mitchells_publication_for_linking.csv",
     "nlp_loc_wikidata_concat": "fixture-files/nlp_loc_wikidata_concat.csv",
+    "unmatched_links": "fixture-files/unmatched_links.csv",
 }
 
+# rows upserted per `bulk_create` query by `Fixture.write_models`
+WRITE_MODELS_BATCH_SIZE = 5000
+
 # "lwm", "hmd", "jisc", "bna"]  # which are our data providers
 DATA_PROVIDERS = ["jisc"]
 MOUNTPOINT = "cache-alto2txt/{data_provider}-alto2txt/metadata/"  # where the alto2txt metadata is mounted for each provider (or local copies stored)
@@ -56,13 +63,7 @@ class Fixture(BaseCommand):
             operational_errors_occurred = 0
 
             if isinstance(df, pd.DataFrame):
-                df_json = df.to_json(orient="index")
-
-                for pk, fields in json.loads(df_json).items():
-                    try:
-                        model.objects.update_or_create(id=pk, defaults=fields)
-                    except OperationalError:
-                        operational_errors_occurred += 1
+                operational_errors_occurred = self.bulk_write_frame(df, model)
 
             if operational_errors_occurred:
                 self.stdout.write(
@@ -73,22 +74,81 @@ class Fixture(BaseCommand):
 
             path = self.get_output_dir() / filename
 
-            model_fields = model._meta.get_fields()
-            data = serialize(
-                "json",
-                model.objects.all(),
-                fields=[
-                    x.name
-                    for x in model_fields
-                    if not x.name in ["created_at", "updated_at"]
-                ],
-            )
-
             with open(path, "w+") as f:
-                f.write(data)
+                f.write(self.serialize_model(model))
 
+        bump_data_version()
         return True
 
+    @staticmethod
+    def serialize_model(model: type[Model]) -> str:
+        """Serialize all `model` records as a `JSON` fixture.
+
+        Relations to models with a `natural_key` (such as `Issue.newspaper`)
+        are written as natural keys, so they resolve to the right record when
+        loaded into a database where its `pk` differs.
+        """
+        return serialize(
+            "json",
+            model.objects.all(),
+            fields=[
+                field.name
+                for field in model._meta.get_fields()
+                if field.name not in ["created_at", "updated_at"]
+            ],
+            use_natural_foreign_keys=True,
+        )
+
+    @staticmethod
+    def natural_key_pk(instance: Model) -> int | None:
+        """Return the `pk` to load `instance` from a fixture with.
+
+        That is the `pk` of the existing record with the same natural key,
+        else the fixture `pk` if unused, else `None` to assign a new `pk`
+        rather than overwrite another record.
+        """
+        model: type[Model] = type(instance)
+        try:
+            return model._default_manager.get_by_natural_key(*instance.natural_key()).pk
+        except model.DoesNotExist:
+            if model._default_manager.filter(pk=instance.pk).exists():
+                return None
+            return instance.pk
+
+    def bulk_write_frame(
+        self,
+        df: pd.DataFrame,
+        model: type[Model],
+        batch_size: int = WRITE_MODELS_BATCH_SIZE,
+    ) -> int:
+        """Create or update a `model` record per row of `df`, indexed by pk.
+
+        Rows are upserted with `bulk_create` in batches of `batch_size` rather
+        than an `update_or_create` query per row. Returns the number of rows
+        not written due to an `OperationalError`.
+        """
+        pk_name: str = model._meta.pk.name
+        update_fields: list[str] = [col for col in df.columns if col != pk_name]
+        if "updated_at" in {field.name for field in model._meta.concrete_fields}:
+            update_fields.append("updated_at")
+        records: list[Model] = [
+            model(pk=pk, **fields)
+            for pk, fields in json.loads(df.to_json(orient="index")).items()
+        ]
+        operational_errors_occurred: int = 0
+        for start in range(0, len(records), batch_size):
+            batch: list[Model] = records[start : start + batch_size]
+            try:
+                model.objects.bulk_create(
+                    batch,
+                    update_conflicts=True,
+                    unique_fields=[pk_name],
+                    update_fields=update_fields,
+                )
+            except OperationalError:
+                operational_errors_occurred += len(batch)
+        return operational_errors_occurred
+
     def load_fixtures(self, models=None):
         if not models:
             models = self.models
@@ -109,7 +169,13 @@ class Fixture(BaseCommand):
                 continue
 
             data = path.read_text()
+            natural_keys: bool = hasattr(model, "natural_key") and hasattr(
+                model._default_manager, "get_by_natural_key"
+            )
+            # Natural foreign keys are resolved by `deserialize`
             for obj in deserialize("json", data):
+                if natural_keys:
+                    obj.object.pk = self.natural_key_pk(obj.object)
                 value = timezone.now()
                 setattr(obj.object, "created_at", value)
                 setattr(obj.object, "updated_at", value)
@@ -121,6 +187,7 @@ class Fixture(BaseCommand):
                     f"Wrote {success} objects of model {obj.object._meta.model._meta.label} to db"
                 )
             )
+        bump_data_version()
 
     def get_output_dir(self, app_name=None):
         if app_name:
@@ -181,85 +248,139 @@ class Connector(Fixture):
         with open(path, "w+") as f:
             f.write(data)
 
-    def connect(self):
-        # Now we want to attempt to connect mitchells.Entry > newspapers.Newspaper
-        mitchells_publication_for_linking = (
-            self.get_input(
-                "Where is mitchells_publication_for_linking.csv?",
-                AUTO_FILE_LOCATIONS["mitchells_publication_for_linking"],
-            )
+    def get_linking_frame(self, name: str) -> pd.DataFrame:
+        """Read the `AUTO_FILE_LOCATIONS` linking `CSV` `name`."""
+        path = (
+            self.get_input(f"Where is {name}.csv?", AUTO_FILE_LOCATIONS[name])
             if not self.force
-            else AUTO_FILE_LOCATIONS["mitchells_publication_for_linking"]
+            else AUTO_FILE_LOCATIONS[name]
         )
-        self.try_file(mitchells_publication_for_linking, False)
-
-        df = pd.read_csv(mitchells_publication_for_linking, dtype={"NLP": str})
-
-        for _, row in df.iterrows():
-            if not Newspaper.objects.filter(publication_code=row.NLP):
-                log_and_django_terminal(
-                    f"NLP {row.NLP} not found in database => failed connection to mitchells.Publication {row.entry}.",
-                    level=WARNING,
-                )
-                # self.stdout.write(
-                #     self.style.WARNING(
-                #     )
-                # )
+        self.try_file(path, False)
+        return pd.read_csv(path, dtype={"NLP": str})
+
+    def connect_entries(
+        self, df: pd.DataFrame, newspapers: LabelIndex
+    ) -> list[dict[str, str]]:
+        """Set `Entry.newspaper` for `df` rows with a known `NLP` and `entry`.
+
+        Returns a `dict` per row which could not be linked.
+        """
+        entry_pks: set[int] = set(Entry.objects.values_list("pk", flat=True))
+        entry_newspapers: dict[int, int] = {}
+        unmatched: list[dict[str, str]] = []
+        for row in df.itertuples(index=False):
+            if row.NLP not in newspapers:
+                reason = "NLP not in newspapers.Newspaper"
+            elif row.entry not in entry_pks:
+                reason = "entry not in mitchells.Entry"
+            else:
+                entry_newspapers[row.entry] = newspapers.pks(row.NLP)[-1]
                 continue
-
-            entry = Entry.objects.get(pk=row.entry)
-            for newspaper in Newspaper.objects.filter(publication_code=row.NLP):
-                entry.newspaper = newspaper
-                entry.save()
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"NLP {row.NLP} connected to mitchells.Entry {row.entry}."
-                    )
-                )
-
-        self.special_write_fixture()
-
-        # Now we want to attempt to connect newspapers.Newspaper > gazetteer.Place
-        nlp_loc_wikidata_concat = (
-            self.get_input(
-                "Where is nlp_loc_wikidata_concat.csv?",
-                AUTO_FILE_LOCATIONS["nlp_loc_wikidata_concat"],
+            unmatched.append(
+                {
+                    "link": "mitchells.Entry > newspapers.Newspaper",
+                    "reason": reason,
+                    "value": f"NLP {row.NLP}, entry {row.entry}",
+                }
+            )
+        now = timezone.now()
+        Entry.objects.bulk_update(
+            [
+                Entry(pk=entry_pk, newspaper_id=newspaper_pk, updated_at=now)
+                for entry_pk, newspaper_pk in entry_newspapers.items()
+            ],
+            ["newspaper", "updated_at"],
+            batch_size=WRITE_MODELS_BATCH_SIZE,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(entry_newspapers)} mitchells.Entry connected to newspapers.Newspaper."
             )
-            if not self.force
-            else AUTO_FILE_LOCATIONS["nlp_loc_wikidata_concat"]
         )
-        self.try_file(nlp_loc_wikidata_concat, False)
+        return unmatched
 
-        df = pd.read_csv(nlp_loc_wikidata_concat, dtype={"NLP": str})
+    def connect_places(
+        self, df: pd.DataFrame, newspapers: LabelIndex
+    ) -> list[dict[str, str]]:
+        """Set `Newspaper.place_of_publication` from `NLP` and `Wikidata ID`.
 
-        for _, row in df.iterrows():
-            if not Newspaper.objects.filter(publication_code=row.NLP):
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"NLP {row.NLP} not found in database => failed connection to gazetteer.Place with Wikidata ID {row['Wikidata ID']}."
-                    )
-                )
+        Returns a `dict` per row which could not be linked.
+        """
+        places = LabelIndex.from_queryset(
+            Place.objects.all(), "wikidata_id", normalise=str
+        )
+        newspaper_places: dict[int, int] = {}
+        unmatched: list[dict[str, str]] = []
+        for nlp, wikidata_id in zip(df["NLP"], df["Wikidata ID"]):
+            if nlp not in newspapers:
+                reason = "NLP not in newspapers.Newspaper"
+            elif wikidata_id not in places:
+                reason = "Wikidata ID not in gazetteer.Place"
+            else:
+                for newspaper_pk in newspapers.pks(nlp):
+                    newspaper_places[newspaper_pk] = places.pks(wikidata_id)[0]
                 continue
-
-            if not Place.objects.filter(wikidata_id=row["Wikidata ID"]):
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"Wikidata ID {row['Wikidata ID']} not found in database => failed connection to newspaper.Newspaper {row.NLP}."
-                    )
+            unmatched.append(
+                {
+                    "link": "newspapers.Newspaper > gazetteer.Place",
+                    "reason": reason,
+                    "value": f"NLP {nlp}, Wikidata ID {wikidata_id}",
+                }
+            )
+        now = timezone.now()
+        Newspaper.objects.bulk_update(
+            [
+                Newspaper(
+                    pk=newspaper_pk, place_of_publication_id=place_pk, updated_at=now
                 )
-                continue
-
-            place_of_publication = Place.objects.get(wikidata_id=row["Wikidata ID"])
-            for newspaper in Newspaper.objects.filter(publication_code=row.NLP):
-                pub = newspaper
-                pub.place_of_publication = place_of_publication
-                pub.save()
+                for newspaper_pk, place_pk in newspaper_places.items()
+            ],
+            ["place_of_publication", "updated_at"],
+            batch_size=WRITE_MODELS_BATCH_SIZE,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(newspaper_places)} newspapers.Newspaper connected to gazetteer.Place."
+            )
+        )
+        return unmatched
+
+    def write_unmatched_summary(self, unmatched: list[dict[str, str]]) -> Path | None:
+        """Write unmatched rows to a `CSV` and report counts per `link` and `reason`.
+
+        Only the counts and the path of the `CSV` are logged, not each row.
+        Returns the path written, if there were any unmatched rows.
+        """
+        if not unmatched:
+            return None
+        path: Path = settings.BASE_DIR / AUTO_FILE_LOCATIONS["unmatched_links"]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows = pd.DataFrame(unmatched)
+        rows.to_csv(path, index=False)
+        log_and_django_terminal(
+            f"{len(rows)} unmatched rows written to {path}",
+            level=WARNING,
+            django_command_instance=self,
+            style=self.style.WARNING,
+        )
+        self.stdout.write(rows.groupby(["link", "reason"]).size().to_string())
+        return path
 
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"NLP {row.NLP} connected to gazetteer.Place {place_of_publication.id}."
-                    )
-                )
+    def connect(self):
+        """Connect mitchells.Entry > newspapers.Newspaper > gazetteer.Place.
 
+        Newspapers, places and entries are each loaded in one query and links
+        applied with `bulk_update`, rather than querying and saving per row.
+        """
+        newspapers = LabelIndex.from_queryset(
+            Newspaper.objects.order_by("pk"), "publication_code", normalise=str
+        )
+        unmatched: list[dict[str, str]] = self.connect_entries(
+            self.get_linking_frame("mitchells_publication_for_linking"), newspapers
+        )
+        unmatched += self.connect_places(
+            self.get_linking_frame("nlp_loc_wikidata_concat"), newspapers
+        )
+        self.write_unmatched_summary(unmatched)
         self.special_write_fixture()
+        bump_data_version()
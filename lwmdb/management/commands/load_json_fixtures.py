@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 
 from ...utils import (
     DEFAULT_FIXTURE_PATH,
+    FIXTURE_FORMAT_EXTENSIONS,
     JSON_FORMAT_EXTENSION,
     get_fixture_paths,
     import_fixtures,
@@ -12,7 +13,11 @@ from ...utils import (
 
 
 class Command(BaseCommand):
-    """Load a collection of `json` data in the correct order."""
+    """Load a collection of `json` data in the correct order.
+
+    Pass `--format-extension .json .parquet .arrow` to include `parquet` and
+    `arrow` fixtures, which are loaded via `COPY` in the same order.
+    """
 
     help: str = "Loads all `json` files in the `fixtures` path in an enforced order"
     path: Path = Path(DEFAULT_FIXTURE_PATH)
@@ -24,6 +29,12 @@ class Command(BaseCommand):
         )
         parser.add_argument("--start-index", nargs="?", const=1, type=int)
         parser.add_argument("--end-index", nargs="?", const=1, type=int)
+        parser.add_argument(
+            "--format-extension",
+            nargs="+",
+            choices=FIXTURE_FORMAT_EXTENSIONS,
+            default=[self.format_extension],
+        )
 
     def handle(self, *args, **options) -> None:
         if options["path"]:
@@ -34,7 +45,7 @@ class Command(BaseCommand):
         end_index: int | None = options["end_index"] if options["end_index"] else None
         self.stdout.write(self.style.SUCCESS(f"Loading fixtures from {self.path}"))
         self._unsorted_fixture_paths: list[str] = get_fixture_paths(
-            self.path, self.format_extension
+            self.path, options["format_extension"]
         )
         self.fixture_paths = sort_all_fixture_paths(self._unsorted_fixture_paths)
         import_fixtures(
@@ -0,0 +1,55 @@
+import pyarrow as pa
+import pytest
+from pyarrow import parquet
+
+from census.models import Record
+from newspapers.models import DataProvider
+
+from ..arrow import load_arrow_fixture, queryset_to_parquet
+from ..utils import (
+    FIXTURE_FORMAT_EXTENSIONS,
+    get_fixture_paths,
+    import_fixtures,
+    sort_all_fixture_paths,
+)
+
+
+@pytest.mark.django_db
+def test_record_to_arrow_and_parquet(tmp_path) -> None:
+    """Test streaming census `Record`s to typed `arrow` and `parquet`."""
+    for year, population in ((1851, 1204.5), (1861, 1310.0)):
+        Record.objects.create(
+            CENSUS_YEAR=year, CEN=1, REGCNTY="CHESHIRE", POP=population
+        )
+    table = Record.objects.order_by("CENSUS_YEAR").to_arrow(batch_size=1).read_all()
+    assert table.num_rows == 2
+    assert table.schema.field("CENSUS_YEAR").type == pa.int16()
+    assert table.schema.field("POP").type == pa.float32()
+    assert table.schema.field("REGCNTY_place_id").type == pa.int32()
+    assert table.column("POP").to_pylist() == [1204.5, 1310.0]
+
+    path = tmp_path / "census.parquet"
+    assert Record.objects.to_parquet(path) == 2
+    assert parquet.read_table(path).schema == Record.objects.arrow_schema()
+    assert queryset_to_parquet(Record.objects.none(), tmp_path / "empty.parquet") == 0
+
+
+@pytest.mark.django_db
+def test_load_arrow_fixture(tmp_path) -> None:
+    """Test `parquet` fixtures round trip through `COPY` in fixture order."""
+    DataProvider.objects.create(
+        name="lwm", collection="newspapers", source_note="", code="lwm"
+    )
+    path = tmp_path / "DataProvider-1.parquet"
+    assert queryset_to_parquet(DataProvider.objects.all(), path) == 1
+    DataProvider.objects.update(name="changed")
+    paths: list[str] = get_fixture_paths(tmp_path, FIXTURE_FORMAT_EXTENSIONS)
+    assert paths == [str(path)]
+    import_fixtures(sort_all_fixture_paths(paths))
+    assert DataProvider.objects.get().name == "lwm"
+
+    DataProvider.objects.all().delete()
+    assert load_arrow_fixture(path) == 1
+    assert DataProvider.objects.get().code == "lwm"
+    DataProvider.objects.create(name="bl", collection="newspapers", source_note="")
+    assert DataProvider.objects.count() == 2
@@ -1,8 +1,16 @@
 from io import StringIO
 
+import pandas as pd
 import pytest
 from django.core.management import call_command
 
+from gazetteer.models import Place
+from gazetteer.resolver import LabelIndex
+from newspapers.management.commands.newspapers import Command as NewspapersCommand
+from newspapers.models import Issue, Newspaper
+
+from ..management.commands.fixtures import Connector
+
 # pytestmark = [pytest.mark.django_db]
 
 
@@ -25,3 +33,64 @@ class TestCustomLoadFixturesCommand:
         call_command("loadfixtures", "gazzetteer", force=True, stdout=out)
         # self.assertIn("Expected output", out.getvalue())
         assert "Expected output" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_connector_connect_places(settings, tmp_path, capsys) -> None:
+    """Test bulk linking `Newspaper` to `Place`, reporting unmatched rows."""
+    place = Place.objects.create(label="Derby", wikidata_id="Q1")
+    newspaper = Newspaper.objects.create(publication_code="0002647", title="Derby")
+    df = pd.DataFrame(
+        {"NLP": ["0002647", "0009999", "0002647"], "Wikidata ID": ["Q1", "Q1", "Q9"]}
+    )
+    connector = Connector(force=True)
+    newspapers = LabelIndex.from_queryset(
+        Newspaper.objects.all(), "publication_code", normalise=str
+    )
+    unmatched = connector.connect_places(df, newspapers)
+    newspaper.refresh_from_db()
+    assert newspaper.place_of_publication == place
+    assert [row["reason"] for row in unmatched] == [
+        "NLP not in newspapers.Newspaper",
+        "Wikidata ID not in gazetteer.Place",
+    ]
+
+    settings.BASE_DIR = tmp_path
+    path = connector.write_unmatched_summary(unmatched)
+    assert pd.read_csv(path)["value"].tolist() == [
+        "NLP 0009999, Wikidata ID Q1",
+        "NLP 0002647, Wikidata ID Q9",
+    ]
+    output: str = capsys.readouterr().out
+    assert f"2 unmatched rows written to {path}" in output
+    assert "Q9" not in output
+
+
+@pytest.mark.django_db
+def test_load_fixtures_natural_keys(tmp_path) -> None:
+    """Test loading fixtures where a `Newspaper` exists with a different `pk`."""
+    newspaper = Newspaper.objects.create(publication_code="0003040", title="Birkenhead")
+    issue = Issue.objects.create(
+        issue_code="0003040-18940905",
+        issue_date="1894-09-05",
+        input_sub_path="0003040/1894/0905",
+        newspaper=newspaper,
+    )
+    command = NewspapersCommand()
+    command.get_output_dir = lambda app_name=None: tmp_path
+    command.save_fixtures()
+    fixture_pks: tuple[int, int] = (newspaper.pk, issue.pk)
+    issue.delete()
+    newspaper.delete()
+    # Take the fixture `pk` with another newspaper, then recreate under a new one
+    other = Newspaper.objects.create(
+        pk=fixture_pks[0], publication_code="0002647", title="Derby"
+    )
+    newspaper = Newspaper.objects.create(publication_code="0003040", title="Old")
+
+    command.load_fixtures([Newspaper, Issue])
+    newspaper.refresh_from_db()
+    other.refresh_from_db()
+    assert newspaper.title == "Birkenhead"
+    assert other.publication_code == "0002647"
+    assert Issue.objects.get(pk=fixture_pks[1]).newspaper == newspaper
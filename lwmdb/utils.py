@@ -1,7 +1,9 @@
 import json
 import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from glob import glob
@@ -23,6 +25,9 @@ from pandas import DataFrame, Series
 from tqdm import tqdm
 from validators.url import url as validate_url
 
+from .arrow import ARROW_FIXTURE_FORMATS, load_arrow_fixture, lookup_field
+from .cache import bump_data_version
+
 logger = getLogger(__name__)
 
 VALID_TRUE_STRS: Final[tuple[str, ...]] = ("y", "yes", "t", "true", "on", "1")
@@ -30,6 +35,10 @@ VALID_FALSE_STRS: Final[tuple[str, ...]] = ("n", "no", "f", "false", "off", "0")
 
 DEFAULT_FIXTURE_PATH: Final[str] = "fixtures"
 JSON_FORMAT_EXTENSION: Final[str] = ".json"
+FIXTURE_FORMAT_EXTENSIONS: Final[tuple[str, ...]] = (
+    JSON_FORMAT_EXTENSION,
+    *ARROW_FIXTURE_FORMATS,
+)
 
 DEFAULT_MAX_LOG_STR_LENGTH: Final[int] = 30
 DEFAULT_CALLABLE_CHUNK_SIZE: Final[int] = 20000
@@ -46,6 +55,28 @@ ITEM_MODEL_NAME: Final[str] = "Item"
 DEFAULT_APP_DATA_FOLDER: Final[Path] = Path("data")
 DEFAULT_APP_FIXTURE_FOLDER: Final[Path] = Path(DEFAULT_FIXTURE_PATH)
 
+DEFAULT_DATAFRAME_CHUNK_SIZE: Final[int] = 100000
+
+# `Field.get_internal_type()` to nullable `pandas` `dtype`, see `dataframe_dtypes`
+PANDAS_INTERNAL_TYPES: Final[dict[str, str]] = {
+    "AutoField": "Int32",
+    "BigAutoField": "Int64",
+    "BigIntegerField": "Int64",
+    "BooleanField": "boolean",
+    "CharField": "string",
+    "DateField": "datetime64[ns]",
+    "DateTimeField": "datetime64[ns, UTC]",
+    "FloatField": "Float64",
+    "IntegerField": "Int32",
+    "PositiveBigIntegerField": "Int64",
+    "PositiveIntegerField": "Int32",
+    "PositiveSmallIntegerField": "Int16",
+    "SlugField": "string",
+    "SmallIntegerField": "Int16",
+    "TextField": "string",
+    "URLField": "string",
+}
+
 
 class JSONFixtureType(TypedDict):
     """A type to check `JSON` fixture structure."""
@@ -300,13 +331,15 @@ def sort_all_fixture_paths(
 
 def get_fixture_paths(
     folder_path: Path | str = DEFAULT_FIXTURE_PATH,
-    format_extension: str = JSON_FORMAT_EXTENSION,
+    format_extension: str | Iterable[str] = JSON_FORMAT_EXTENSION,
 ) -> list[str]:
     """Return paths matching `folder_path` ending with `format_extension`.
 
     Args:
         folder_path: folder to search for `fixtures` in
-        format_extension: filename fromat extension suffix for filtering results
+        format_extension:
+            filename fromat extension suffix(es) for filtering results, for
+            example `FIXTURE_FORMAT_EXTENSIONS` for `json`, `parquet` and `arrow`
 
     Returns:
         `list` of file path `str` with `format_extension` suffix
@@ -321,10 +354,18 @@ def get_fixture_paths(
         ...     get_fixture_paths(Path('lwmdb') / 'tests')
         ... )
         True
+        >>> len(get_fixture_paths('lwmdb/tests/', FIXTURE_FORMAT_EXTENSIONS))
+        2
 
         ```
     """
-    return glob(f"{folder_path}/*{format_extension}")
+    if isinstance(format_extension, str):
+        format_extension = (format_extension,)
+    return [
+        path
+        for extension in format_extension
+        for path in glob(f"{folder_path}/*{extension}")
+    ]
 
 
 def log_and_django_terminal(
@@ -467,7 +508,13 @@ def import_fixtures(
     end_index: int | None = None,
     django_command_instance: BaseCommand | None = None,
 ) -> None:
-    """Call `loaddata` on fixtuers in `ordered_fixture_paths`."""
+    """Import fixtures in `ordered_fixture_paths`.
+
+    `json` fixtures are loaded with `loaddata`, and `parquet` or `arrow`
+    fixtures with `load_arrow_fixture` via `COPY`. `Place.point` is then set
+    with `update_points` and cached queries invalidated with
+    `bump_data_version`.
+    """
     success_style = (
         django_command_instance.style.SUCCESS if django_command_instance else None
     )
@@ -485,7 +532,15 @@ def import_fixtures(
             django_command_instance=django_command_instance,
             style=success_style,
         )
-        call_command("loaddata", path, verbosity=3)
+        if Path(path).suffix in ARROW_FIXTURE_FORMATS:
+            rows: int = load_arrow_fixture(path)
+            log_and_django_terminal(
+                f"Copied {rows} rows from {path}",
+                django_command_instance=django_command_instance,
+                style=success_style,
+            )
+        else:
+            call_command("loaddata", path, verbosity=3)
         t2 = datetime.now()
         log_and_django_terminal(
             f"Import of path {path} took: {t2 - t1}",
@@ -497,6 +552,87 @@ def import_fixtures(
             django_command_instance=django_command_instance,
             style=success_style,
         )
+    # `loaddata` and `COPY` skip `Place.save`, which sets `point`
+    apps.get_model("gazetteer", "Place").objects.update_points()
+    bump_data_version()
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode `values` as an opaque, URL safe keyset pagination cursor.
+
+    Example:
+        ```pycon
+        >>> cursor: str = encode_cursor(0.0607927, 42)
+        >>> cursor
+        'WzAuMDYwNzkyNywgNDJd'
+        >>> decode_cursor(cursor)
+        [0.0607927, 42]
+
+        ```
+    """
+    return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Return the `list` of values encoded in `cursor` by `encode_cursor`.
+
+    Raises:
+        ValueError: if `cursor` was not created by `encode_cursor`.
+
+    Example:
+        ```pycon
+        >>> decode_cursor('not-a-cursor')
+        Traceback (most recent call last):
+        ...
+        ValueError: Invalid cursor: 'not-a-cursor'
+
+        ```
+    """
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+        assert isinstance(values, list)
+    except (AssertionError, BinasciiError, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return values
+
+
+def dataframe_dtypes(
+    model: type[Model],
+    lookups: Sequence[str],
+    categorical: Iterable[str] | None = None,
+) -> dict[str, str]:
+    """Return a nullable `pandas` `dtype` per `values_list` lookup of `model`.
+
+    Args:
+        model: `Model` the `lookups` are relative to.
+        lookups: Field names, attnames or related lookups.
+        categorical: Lookups to set as `category`. Defaults to `ForeignKey`
+            attnames and related `str` lookups like `data_provider__code`.
+
+    Example:
+        ```pycon
+        >>> from newspapers.models import Item
+        >>> dataframe_dtypes(Item, ["issue_id", "issue__issue_code", "issue__issue_date"])
+        {'issue_id': 'category', 'issue__issue_code': 'category', 'issue__issue_date': 'datetime64[ns]'}
+        >>> dataframe_dtypes(Item, ["word_count", "issue_id"], categorical=[])
+        {'word_count': 'Int32', 'issue_id': 'Int64'}
+
+        ```
+    """
+    dtypes: dict[str, str] = {
+        lookup: PANDAS_INTERNAL_TYPES.get(
+            lookup_field(model, lookup).get_internal_type(), "object"
+        )
+        for lookup in lookups
+    }
+    if categorical is None:
+        categorical = [
+            lookup
+            for lookup in lookups
+            if ("__" in lookup and dtypes[lookup] == "string")
+            or ("__" not in lookup and model._meta.get_field(lookup).is_relation)
+        ]
+    return dtypes | {lookup: "category" for lookup in categorical}
 
 
 def download_file(
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Final
 
@@ -6,6 +7,7 @@ import numpy as np
 import pandas as pd
 from django.db.models import Model
 
+from gazetteer.resolver import LabelIndex
 from lwmdb.management.commands.fixtures import AUTO_FILE_LOCATIONS, Fixture
 
 from .models import (
@@ -91,6 +93,75 @@ SELECTED_DB_COLS: Final[list[str]] = [
 ]
 
 
+def label_ids(
+    entries: pd.DataFrame, labels: LabelIndex, fields: Sequence[str]
+) -> pd.Series:
+    """Return a `list` of `labels` pks for `fields` in each entry.
+
+    Each distinct label in `fields` is looked up in `labels` once and the
+    results mapped back onto the entries, rather than querying per row.
+
+    Args:
+        entries: `DataFrame` with a column for each of `fields`.
+        labels: `LabelIndex` of labels to pks.
+        fields: Columns of `entries` to map, in the order ids are listed.
+
+    Example:
+        ```pycon
+        >>> labels = LabelIndex([("liberal", 1), ("tory", 2)], normalise=str)
+        >>> entries = pd.DataFrame(
+        ...     {"first": ["tory", None, "whig"], "second": ["liberal", None, None]}
+        ... )
+        >>> label_ids(entries, labels, ["first", "second"]).tolist()
+        [[2, 1], [], []]
+
+        ```
+    """
+    pks: dict[str, tuple] = {
+        label: labels.pks(label)
+        for field in fields
+        for label in entries[field].dropna().unique()
+    }
+    return pd.Series(
+        [
+            [pk for label in row if label in pks for pk in pks[label]]
+            for row in entries[list(fields)].itertuples(index=False)
+        ],
+        index=entries.index,
+        dtype=object,
+    )
+
+
+def through_frame(entries: pd.DataFrame, ids_column: str, field: str) -> pd.DataFrame:
+    """Return many-to-many rows from a column of id lists in `entries`.
+
+    Each id in `entries[ids_column]` becomes a row linking the entry (its
+    index) to `{field}_id`, with `order` counting from 1 within each entry.
+    Rows are indexed from 1 for use as pks.
+
+    Example:
+        ```pycon
+        >>> entries = pd.DataFrame({"price_ids": [[2, 1], [], [1]]}, index=[1, 2, 3])
+        >>> through_frame(entries, "price_ids", "price")
+           entry_id  price_id  order
+        1         1         2      1
+        2         1         1      2
+        3         3         1      1
+
+        ```
+    """
+    ids: pd.Series = entries[ids_column].explode().dropna().astype(int)
+    frame = pd.DataFrame(
+        {
+            "entry_id": ids.index,
+            f"{field}_id": ids.array,
+            "order": ids.groupby(level=0).cumcount().array + 1,
+        }
+    )
+    frame.index = np.arange(1, len(frame) + 1)
+    return frame
+
+
 class MitchellsFixture(Fixture):
     app_name: str = "mitchells"
     models: list[type[Model]] = [
@@ -210,8 +281,8 @@ class MitchellsFixture(Fixture):
         )
         mitchells_issues.index = np.arange(1, len(mitchells_issues) + 1)
 
-        mitchells_entries["issue_id"] = mitchells_entries.apply(
-            lambda x: mitchells_issues.query(f"year == {x.year}").index[0], axis=1
+        mitchells_entries["issue_id"] = mitchells_entries.year.map(
+            pd.Series(mitchells_issues.index, index=mitchells_issues.year)
         )
 
         # Create mitchells_publication_for_linking (for newspapers)
@@ -248,15 +319,12 @@ class MitchellsFixture(Fixture):
                 index=np.arange(1, len(values) + 1),
             )
 
-            escape_val = lambda x: x.replace("'", "\\'") if isinstance(x, str) else x
-            mitchells_entries[resulting_column] = mitchells_entries.apply(
-                lambda x: dfs[resulting_df]
-                .query(f"label == '{escape_val(x[field1])}'")
-                .index.to_list()
-                + dfs[resulting_df]
-                .query(f"label == '{escape_val(x[field2])}'")
-                .index.to_list(),
-                axis=1,
+            # labels are already cleaned above, so match them exactly
+            label_index = LabelIndex(
+                zip(dfs[resulting_df].label, dfs[resulting_df].index), normalise=str
+            )
+            mitchells_entries[resulting_column] = label_ids(
+                mitchells_entries, label_index, [field1, field2]
             )
 
             # dfs[resulting_df].to_csv(resulting_df + ".csv")
@@ -286,52 +354,14 @@ class MitchellsFixture(Fixture):
                 ],
                 Entry,
             ),
+            (
+                through_frame(
+                    mitchells_entries, "political_leaning_ids", "political_leaning"
+                ),
+                EntryPoliticalLeanings,
+            ),
+            (through_frame(mitchells_entries, "price_ids", "price"), EntryPrices),
         ]
         self.write_models(models)
 
-        # Create many-to-many fixtures
-        path = self.get_output_dir() / "EntryPoliticalLeanings-fixtures.json"
-        fixture_data = [
-            {
-                "fields": {
-                    "political_leaning_id": _id,
-                    "entry_id": ix,
-                    "order": counter,
-                },
-            }
-            for ix, rows in mitchells_entries[["political_leaning_ids"]].iterrows()
-            for counter, _id in enumerate(rows.political_leaning_ids, start=1)
-        ]
-        fixture_data = [
-            {
-                "model": "mitchells.entrypoliticalleanings",
-                "pk": pk,
-                "fields": x.get("fields"),
-            }
-            for pk, x in enumerate(fixture_data, start=1)
-        ]
-        path.write_text(json.dumps(fixture_data))
-
-        path = self.get_output_dir() / "EntryPrices-fixtures.json"
-        fixture_data = [
-            {
-                "fields": {
-                    "price_id": _id,
-                    "entry_id": ix,
-                    "order": counter,
-                },
-            }
-            for ix, rows in mitchells_entries[["price_ids"]].iterrows()
-            for counter, _id in enumerate(rows.price_ids, start=1)
-        ]
-        fixture_data = [
-            {
-                "model": "mitchells.entryprices",
-                "pk": pk,
-                "fields": x.get("fields"),
-            }
-            for pk, x in enumerate(fixture_data, start=1)
-        ]
-        path.write_text(json.dumps(fixture_data))
-
         self.done()
@@ -1,20 +1,115 @@
+from typing import Final
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.forms.models import BaseInlineFormSet
+
+from lwmdb.admin import LargeTableAdminMixin
 
 from .models import DataProvider, Digitisation, Ingest, Issue, Item, Newspaper
 
+# Most recent issues shown inline on a `Newspaper`, see `IssueAdmin` for all
+MAX_INLINE_ISSUES: Final[int] = 50
+
+
+class TrigramSearchChangeList(ChangeList):
+    """Order search results most similar first, unless sorted by a column."""
+
+    def get_ordering(self, request, queryset):
+        ordering = super().get_ordering(request, queryset)
+        if self.query and ORDER_VAR not in self.params:
+            return ["-word_similarity", *ordering]
+        return ordering
+
+
+class TrigramTitleSearchMixin:
+    """Search `title` by trigram word similarity rather than `icontains`.
+
+    Word similarity matches single words within long titles, which whole
+    title `similar` scores below its threshold. Results are listed most
+    similar first.
+    """
+
+    search_fields = ["title"]
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return queryset.word_similar(search_term), False
+
+    def get_changelist(self, request, **kwargs):
+        return TrigramSearchChangeList
+
+
+class LatestIssuesFormSet(BaseInlineFormSet):
+    """Limit inline issues to the latest `MAX_INLINE_ISSUES`."""
+
+    def get_queryset(self):
+        # Cached so the sliced `QuerySet` is evaluated once per formset
+        if not hasattr(self, "_latest_issues"):
+            self._latest_issues = (
+                super().get_queryset().order_by("-issue_date")[:MAX_INLINE_ISSUES]
+            )
+        return self._latest_issues
+
+
+class IssueInline(admin.TabularInline):
+    """Read-only latest issues of a `Newspaper`, linking to each `Issue`."""
 
-class IssueAdmin(admin.TabularInline):
     model = Issue
+    formset = LatestIssuesFormSet
+    fields = ["issue_code", "issue_date", "item_count", "total_word_count"]
+    readonly_fields = fields
+    show_change_link = True
+    can_delete = False
+    extra = 0
+    verbose_name_plural = f"latest {MAX_INLINE_ISSUES} issues"
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Newspaper)
-class NewspaperAdmin(admin.ModelAdmin):
-    inlines = [IssueAdmin]
-    search_fields = ["title"]
+class NewspaperAdmin(TrigramTitleSearchMixin, admin.ModelAdmin):
+    inlines = [IssueInline]
+    list_display = [
+        "publication_code",
+        "title",
+        "issue_count",
+        "first_issue_date",
+        "last_issue_date",
+    ]
     list_filter = ["location"]
+    raw_id_fields = ["place_of_publication"]
+
+
+@admin.register(Issue)
+class IssueAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ["issue_code", "issue_date", "newspaper", "item_count"]
+    list_select_related = ["newspaper"]
+    list_filter = ["issue_date"]
+    raw_id_fields = ["newspaper"]
+    # Exact matches use the `issue_code` index, unlike `icontains`
+    search_fields = ["=issue_code"]
+
+
+@admin.register(Item)
+class ItemAdmin(LargeTableAdminMixin, TrigramTitleSearchMixin, admin.ModelAdmin):
+    list_display = ["item_code", "title", "item_type", "issue", "data_provider"]
+    list_select_related = ["issue", "data_provider"]
+    list_filter = ["data_provider"]
+    raw_id_fields = ["issue", "digitisation", "ingest", "fulltext"]
+    autocomplete_fields = ["data_provider"]
+
+
+@admin.register(DataProvider)
+class DataProviderAdmin(admin.ModelAdmin):
+    list_display = ["name", "collection", "code"]
+    search_fields = ["name", "code"]
 
 
-admin.site.register(DataProvider)
 admin.site.register(Digitisation)
 admin.site.register(Ingest)
-admin.site.register(Item)
@@ -0,0 +1,160 @@
+import re
+from datetime import date, timedelta
+from typing import Final
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from ...models import Issue, Item, Newspaper
+
+# Indexes added in migration `0015`, dropped to compare plans without them
+BENCHMARK_INDEXES: Final[tuple[str, ...]] = (
+    "issue_newspaper_date_idx",
+    "issue_date_brin_idx",
+    "item_issue_type_idx",
+)
+BENCHMARK_ITEM_TYPES: Final[tuple[str, ...]] = (
+    "ARTICLE",
+    "ADVERTISEMENT",
+    "ILLUSTRATION",
+    "OBITUARY",
+)
+BENCHMARK_START_DATE: Final[date] = date(1800, 1, 1)
+BENCHMARK_PREFIX: Final[str] = "benchmark-"
+DEFAULT_NEWSPAPERS: Final[int] = 50
+DEFAULT_ISSUES_PER_NEWSPAPER: Final[int] = 500
+DEFAULT_ITEMS_PER_ISSUE: Final[int] = 10
+DEFAULT_BATCH_SIZE: Final[int] = 5000
+
+EXECUTION_TIME_REGEX: Final[re.Pattern] = re.compile(r"Execution Time: ([\d.]+) ms")
+
+
+class Command(BaseCommand):
+    """Compare query plans with and without the date-range indexes.
+
+    A synthetic dataset is inserted, each query is run with `EXPLAIN
+    ANALYZE`, the indexes in `BENCHMARK_INDEXES` are dropped and each query
+    is run again. Everything is rolled back at the end, but the dropped
+    indexes lock their tables until then, so only run this against a
+    development database.
+    """
+
+    help: str = "Benchmark composite and BRIN indexes on a synthetic dataset"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--newspapers", type=int, default=DEFAULT_NEWSPAPERS)
+        parser.add_argument(
+            "--issues-per-newspaper", type=int, default=DEFAULT_ISSUES_PER_NEWSPAPER
+        )
+        parser.add_argument(
+            "--items-per-issue", type=int, default=DEFAULT_ITEMS_PER_ISSUE
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print `EXPLAIN ANALYZE` output for each query",
+        )
+
+    def create_dataset(
+        self,
+        newspapers: int,
+        issues_per_newspaper: int,
+        items_per_issue: int,
+        batch_size: int,
+    ) -> Newspaper:
+        """Insert synthetic rows, returning the `Newspaper` to query.
+
+        `Issue`s are created day by day across all `Newspaper`s, so
+        `issue_date` correlates with insertion order as in real ingests.
+        """
+        synthetic_newspapers: list[Newspaper] = Newspaper.objects.bulk_create(
+            Newspaper(
+                publication_code=f"{BENCHMARK_PREFIX}{i:07}",
+                title=f"Benchmark Newspaper {i}",
+            )
+            for i in range(newspapers)
+        )
+        issues: list[Issue] = Issue.objects.bulk_create(
+            (
+                Issue(
+                    issue_code=f"{newspaper.publication_code}-{day}",
+                    issue_date=BENCHMARK_START_DATE + timedelta(days=day),
+                    input_sub_path="",
+                    newspaper=newspaper,
+                )
+                for day in range(issues_per_newspaper)
+                for newspaper in synthetic_newspapers
+            ),
+            batch_size=batch_size,
+        )
+        Item.objects.bulk_create(
+            (
+                Item(
+                    item_code=f"{issue.issue_code}-{i:04}",
+                    title="",
+                    item_type=BENCHMARK_ITEM_TYPES[i % len(BENCHMARK_ITEM_TYPES)],
+                    input_filename="",
+                    issue=issue,
+                )
+                for issue in issues
+                for i in range(items_per_issue)
+            ),
+            batch_size=batch_size,
+        )
+        with connection.cursor() as cursor:
+            for model in (Newspaper, Issue, Item):
+                cursor.execute(
+                    f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}"
+                )
+        return synthetic_newspapers[len(synthetic_newspapers) // 2]
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            newspaper: Newspaper = self.create_dataset(
+                options["newspapers"],
+                options["issues_per_newspaper"],
+                options["items_per_issue"],
+                options["batch_size"],
+            )
+            # A tenth of the synthetic date range, from its midpoint
+            days: int = options["issues_per_newspaper"]
+            start_date: date = BENCHMARK_START_DATE + timedelta(days=days // 2)
+            end_date: date = start_date + timedelta(days=max(days // 10, 1))
+            querysets: dict[str, QuerySet] = {
+                "newspaper issues by date": Issue.objects.filter(
+                    newspaper=newspaper, issue_date__range=(start_date, end_date)
+                ),
+                "issues by date": Issue.objects.filter(
+                    issue_date__range=(start_date, end_date)
+                ),
+                "items by date and type": Item.objects.filter(
+                    issue__issue_date__range=(start_date, end_date),
+                    item_type=BENCHMARK_ITEM_TYPES[0],
+                ),
+            }
+            after: dict[str, str] = {
+                name: qs.explain(analyze=True) for name, qs in querysets.items()
+            }
+            with connection.cursor() as cursor:
+                for index in BENCHMARK_INDEXES:
+                    cursor.execute(
+                        f"DROP INDEX IF EXISTS {connection.ops.quote_name(index)}"
+                    )
+            before: dict[str, str] = {
+                name: qs.explain(analyze=True) for name, qs in querysets.items()
+            }
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{'query':<30}{'before ms':>12}{'after ms':>12}")
+        for name in querysets:
+            timings: list[str] = [
+                match.group(1) if (match := EXECUTION_TIME_REGEX.search(plan)) else "-"
+                for plan in (before[name], after[name])
+            ]
+            self.stdout.write(f"{name:<30}{timings[0]:>12}{timings[1]:>12}")
+        if options["explain"]:
+            for name in querysets:
+                self.stdout.write(f"\n{name} before:\n{before[name]}")
+                self.stdout.write(f"\n{name} after:\n{after[name]}")
@@ -0,0 +1,60 @@
+from time import perf_counter
+from typing import Final
+
+from django.core.management.base import BaseCommand
+
+from ...models import DEFAULT_SIMILARITY_THRESHOLD, Item, Newspaper
+
+TITLE_SEARCH_MODELS: Final[dict[str, type[Item] | type[Newspaper]]] = {
+    "item": Item,
+    "newspaper": Newspaper,
+}
+DEFAULT_REPEAT: Final[int] = 3
+
+
+class Command(BaseCommand):
+    """Compare `icontains` and trigram similarity searches of `title`."""
+
+    help: str = "Benchmark `title__icontains` against trigram `similar` search"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("terms", nargs="+", type=str)
+        parser.add_argument(
+            "--model", choices=TITLE_SEARCH_MODELS.keys(), default="newspaper"
+        )
+        parser.add_argument(
+            "--threshold", type=float, default=DEFAULT_SIMILARITY_THRESHOLD
+        )
+        parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print `EXPLAIN ANALYZE` output for each query",
+        )
+
+    def handle(self, *args, **options) -> None:
+        model = TITLE_SEARCH_MODELS[options["model"]]
+        self.stdout.write(
+            f"{'term':<30}{'icontains ms':>14}{'matches':>9}"
+            f"{'trigram ms':>12}{'matches':>9}"
+        )
+        for term in options["terms"]:
+            querysets = {
+                "icontains": model.objects.filter(title__icontains=term),
+                "trigram": model.objects.similar(term, threshold=options["threshold"]),
+            }
+            results: list[str] = []
+            for name, qs in querysets.items():
+                timings: list[float] = []
+                for _ in range(options["repeat"]):
+                    start: float = perf_counter()
+                    matches: int = len(qs.all().values_list("pk", flat=True))
+                    timings.append(perf_counter() - start)
+                results.append(f"{1000 * min(timings):.1f}")
+                results.append(str(matches))
+                if options["explain"]:
+                    self.stdout.write(f"{name} `{term}`:\n{qs.explain(analyze=True)}")
+            self.stdout.write(
+                f"{term:<30}{results[0]:>14}{results[1]:>9}"
+                f"{results[2]:>12}{results[3]:>9}"
+            )
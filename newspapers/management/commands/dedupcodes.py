@@ -0,0 +1,129 @@
+from itertools import islice
+from typing import Final
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Case, F, Min, Model, Value, When, Window
+
+from lwmdb.cache import bump_data_version
+
+from ...models import Issue, Item, Newspaper
+
+# In merge order: merging `Issue`s moves their `Item`s, which may then collide
+DEDUP_MODELS: Final[dict[str, type[Newspaper] | type[Issue] | type[Item]]] = {
+    "newspaper": Newspaper,
+    "issue": Issue,
+    "item": Item,
+}
+DEFAULT_DEDUP_BATCH_SIZE: Final[int] = 1000
+
+
+def duplicate_pks(model: type[Model]) -> dict[int, int]:
+    """Map each duplicate `pk` to the lowest `pk` sharing its `code_field`."""
+    code_field: str = model.objects.code_field
+    return dict(
+        model.objects.annotate(keep_pk=Window(Min("pk"), partition_by=[F(code_field)]))
+        .filter(keep_pk__lt=F("pk"))
+        .values_list("pk", "keep_pk")
+    )
+
+
+def merge_duplicates(
+    model: type[Model],
+    duplicates: dict[int, int],
+    batch_size: int = DEFAULT_DEDUP_BATCH_SIZE,
+) -> None:
+    """Point relations of `duplicates` at the records kept, then delete them.
+
+    Each batch is one `UPDATE` per relation and one `DELETE`. One-to-one
+    relations are left to their `on_delete`, as the record kept may already
+    have one.
+    """
+    relations = [
+        relation
+        for relation in model._meta.related_objects
+        if relation.many_to_one and relation.field.concrete
+    ]
+    pks = iter(duplicates)
+    while batch := list(islice(pks, batch_size)):
+        with transaction.atomic():
+            for relation in relations:
+                field_name: str = relation.field.name
+                relation.related_model._base_manager.filter(
+                    **{f"{field_name}__in": batch}
+                ).update(
+                    **{
+                        field_name: Case(
+                            *(
+                                When(**{field_name: pk}, then=Value(duplicates[pk]))
+                                for pk in batch
+                            )
+                        )
+                    }
+                )
+            model._base_manager.filter(pk__in=batch).delete()
+
+
+class Command(BaseCommand):
+    """Merge `Newspaper`s, `Issue`s and `Item`s with duplicate codes.
+
+    The record with the lowest `pk` per code is kept. Run before migrating
+    to the unique constraints on `publication_code`, `issue_code` and
+    `item_code` (see #55).
+    """
+
+    help: str = "Merge records sharing a publication, issue or item code"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            choices=DEDUP_MODELS.keys(),
+            default=list(DEDUP_MODELS),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of duplicates",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_DEDUP_BATCH_SIZE)
+
+    def handle(self, *args, **options) -> None:
+        issue_pks: set[int] = set()
+        newspaper_pks: set[int] = set()
+        for name in DEDUP_MODELS:
+            if name not in options["models"]:
+                continue
+            model = DEDUP_MODELS[name]
+            duplicates: dict[int, int] = duplicate_pks(model)
+            self.stdout.write(
+                f"{len(duplicates)} duplicate {model._meta.verbose_name_plural}"
+            )
+            if options["dry_run"] or not duplicates:
+                continue
+            kept: set[int] = set(duplicates.values())
+            if model is Newspaper:
+                newspaper_pks |= kept
+            elif model is Issue:
+                issue_pks |= kept
+                newspaper_pks.update(
+                    Issue.objects.filter(pk__in=kept).values_list(
+                        "newspaper", flat=True
+                    )
+                )
+            else:
+                issue_pks.update(
+                    Item.objects.filter(pk__in=duplicates.keys() | kept).values_list(
+                        "issue", flat=True
+                    )
+                )
+            merge_duplicates(model, duplicates, options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Merged {len(duplicates)} {model._meta.verbose_name_plural}"
+                )
+            )
+        if issue_pks or newspaper_pks:
+            Issue.objects.filter(pk__in=issue_pks).update_counts()
+            Newspaper.objects.filter(pk__in=newspaper_pks).update_counts()
+            bump_data_version()
@@ -0,0 +1,180 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from shutil import rmtree
+from typing import TYPE_CHECKING, Final
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Model, QuerySet
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+
+from lwmdb.arrow import (
+    DEFAULT_ARROW_BATCH_SIZE,
+    DEFAULT_PARQUET_COMPRESSION,
+    arrow_schema,
+    arrow_type,
+    import_pyarrow,
+    lookup_field,
+    queryset_to_arrow,
+)
+
+from ...models import DataProvider, Digitisation, Ingest, Issue, Item, Newspaper
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_EXPORT_PATH: Final[Path] = Path("exports") / "parquet"
+EXPORT_MANIFEST_FILE_NAME: Final[str] = "manifest.json"
+
+
+@dataclass
+class ParquetExport:
+    """How to export a `model` to a `parquet` dataset.
+
+    Attributes:
+        model: `Model` to export every concrete field of.
+        related: Extra columns named for a related lookup, so the dataset can
+            be queried without joins.
+        year_lookup: Date lookup to add as a `year` column, if any.
+        partitioning: Columns to partition the dataset by, `hive` style.
+    """
+
+    model: type[Model]
+    related: dict[str, str] = field(default_factory=dict)
+    year_lookup: str | None = None
+    partitioning: tuple[str, ...] = ()
+
+    def queryset(self) -> QuerySet:
+        annotations = {name: F(lookup) for name, lookup in self.related.items()}
+        if self.year_lookup:
+            annotations["year"] = ExtractYear(self.year_lookup)
+        return self.model.objects.annotate(**annotations).order_by("pk")
+
+    def schema(self, dictionary_codes: bool = False) -> "pa.Schema":
+        """Return the `pyarrow` `Schema` of `queryset` columns.
+
+        Args:
+            dictionary_codes: Whether to dictionary encode `related` columns.
+        """
+        pa = import_pyarrow()
+        lookups: list[str] = [f.attname for f in self.model._meta.concrete_fields]
+        types: dict[str, pa.DataType] = {
+            name: arrow_type(lookup_field(self.model, lookup), dictionary_codes)
+            for name, lookup in self.related.items()
+        }
+        if self.year_lookup:
+            types["year"] = pa.int16()
+        return arrow_schema(self.model, lookups + list(types), types=types)
+
+
+EXPORTS: Final[dict[str, ParquetExport]] = {
+    "dataprovider": ParquetExport(DataProvider),
+    "digitisation": ParquetExport(Digitisation),
+    "ingest": ParquetExport(Ingest),
+    "newspaper": ParquetExport(Newspaper),
+    "issue": ParquetExport(
+        Issue,
+        related={"publication_code": "newspaper__publication_code"},
+        year_lookup="issue_date",
+    ),
+    "item": ParquetExport(
+        Item,
+        related={
+            "data_provider_code": "data_provider__code",
+            "issue_code": "issue__issue_code",
+            "publication_code": "issue__newspaper__publication_code",
+        },
+        year_lookup="issue__issue_date",
+        partitioning=("data_provider_code", "year"),
+    ),
+}
+
+
+class Command(BaseCommand):
+    """Export newspapers models to `parquet` datasets for offline analysis.
+
+    Each model is written to `<output-dir>/<model>/`, with `Item` partitioned
+    by data provider and year (`data_provider_code=hmd/year=1894/...`).
+    Related codes are included as columns so the datasets can be queried by
+    `DuckDB` or `pandas` without the database.
+
+    With `--incremental`, only records updated since the last export (recorded
+    in `manifest.json`) are written, as new files alongside the existing ones.
+    Readers should then keep the row with the latest `updated_at` per `id`.
+    """
+
+    help: str = "Export newspapers models to (partitioned) parquet datasets"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--output-dir", type=Path, default=DEFAULT_EXPORT_PATH)
+        parser.add_argument(
+            "--models", nargs="+", choices=EXPORTS.keys(), default=list(EXPORTS)
+        )
+        parser.add_argument(
+            "--dictionary-codes",
+            action="store_true",
+            help="Dictionary encode related code columns",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only export records updated since the last export",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_ARROW_BATCH_SIZE)
+        parser.add_argument(
+            "--compression", type=str, default=DEFAULT_PARQUET_COMPRESSION
+        )
+
+    def handle(self, *args, **options) -> None:
+        import_pyarrow()
+        from pyarrow import dataset
+
+        output_dir: Path = options["output_dir"]
+        manifest_path: Path = output_dir / EXPORT_MANIFEST_FILE_NAME
+        manifest: dict[str, str] = (
+            json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        )
+        file_format = dataset.ParquetFileFormat()
+        for name in options["models"]:
+            export: ParquetExport = EXPORTS[name]
+            started_at: datetime = timezone.now()
+            queryset: QuerySet = export.queryset()
+            model_dir: Path = output_dir / name
+            if options["incremental"] and name in manifest:
+                queryset = queryset.filter(
+                    updated_at__gt=datetime.fromisoformat(manifest[name])
+                )
+            elif model_dir.exists():
+                rmtree(model_dir)
+            reader = queryset_to_arrow(
+                queryset,
+                export.schema(dictionary_codes=options["dictionary_codes"]),
+                options["batch_size"],
+            )
+            rows: int = 0
+
+            def count_rows(batches):
+                nonlocal rows
+                for batch in batches:
+                    rows += batch.num_rows
+                    yield batch
+
+            dataset.write_dataset(
+                count_rows(reader),
+                model_dir,
+                schema=reader.schema,
+                format=file_format,
+                file_options=file_format.make_write_options(
+                    compression=options["compression"]
+                ),
+                partitioning=list(export.partitioning) or None,
+                partitioning_flavor="hive" if export.partitioning else None,
+                basename_template=f"{started_at:%Y%m%dT%H%M%S}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+            manifest[name] = started_at.isoformat()
+            self.stdout.write(self.style.SUCCESS(f"Exported {rows} {name} rows"))
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=2))
@@ -1,11 +1,14 @@
 import json
 import xml.etree.ElementTree as ET
 import zipfile
+from functools import cache
 from pathlib import Path
+from typing import Final
 
 from django.db.utils import OperationalError
 from tqdm import tqdm
 
+from lwmdb.cache import bump_data_version
 from lwmdb.management.commands.fixtures import DATA_PROVIDERS, MOUNTPOINTS
 
 from ...models import DataProvider, Digitisation, Ingest, Issue, Item
@@ -14,6 +17,24 @@ from .newspapers import Command as NewspapersFixture
 
 item_cache = "cache-item"
 
+# Fields of existing `Item`s overwritten when ingested again
+ITEM_UPSERT_FIELDS: Final[list[str]] = [
+    "title",
+    "title_word_count",
+    "title_char_count",
+    "title_truncated",
+    "item_type",
+    "word_count",
+    "ocr_quality_mean",
+    "ocr_quality_sd",
+    "input_filename",
+    "issue",
+    "data_provider",
+    "digitisation",
+    "ingest",
+]
+ITEM_UPSERT_BATCH_SIZE: Final[int] = 5000
+
 
 class Command(NewspapersFixture):
     models = [Item]
@@ -172,6 +193,20 @@ class Command(NewspapersFixture):
     def ingest_cache(self):
         total = 0
 
+        @cache
+        def digitisation_pk(software: str) -> int:
+            return Digitisation.objects.get(software=software).pk
+
+        @cache
+        def ingest_pk(lwm_tool_name: str, lwm_tool_version: str) -> int:
+            return Ingest.objects.get(
+                lwm_tool_name=lwm_tool_name, lwm_tool_version=lwm_tool_version
+            ).pk
+
+        @cache
+        def data_provider_pk(name: str) -> int:
+            return DataProvider.objects.get(name=name).pk
+
         for data_provider in DATA_PROVIDERS:
             JSONL_FILES = list(
                 Path(f"./{item_cache}/{data_provider}/").glob("**/*.jsonl")
@@ -180,11 +215,20 @@ class Command(NewspapersFixture):
             for jsonl_path in (bar1 := tqdm(JSONL_FILES)):
                 bar1.set_description(f"{data_provider} :: {jsonl_path.name}")
 
-                lines = jsonl_path.read_text().splitlines()
-
-                for line in (bar2 := tqdm(lines, leave=False)):
-                    item = json.loads(line)
+                items = [
+                    json.loads(line) for line in jsonl_path.read_text().splitlines()
+                ]
+                # One lookup per file, rather than one `Issue` query per item
+                issue_pks: dict[str, int] = dict(
+                    Issue.objects.filter(
+                        issue_code__in={
+                            item.get("issue__issue_identifier") for item in items
+                        }
+                    ).values_list("issue_code", "pk")
+                )
+                item_objs: list[Item] = []
 
+                for item in (bar2 := tqdm(items, leave=False)):
                     if not item.get("item_code"):
                         self.stdout.write(
                             self.style.WARNING(
@@ -195,31 +239,18 @@ class Command(NewspapersFixture):
 
                     bar2.set_description(f"{total} saved :: {item['item_code']}")
 
-                    # relations
-                    digitisation_o = Digitisation.objects.get(
-                        software=item.get("digitisation__software")
-                    )
-                    ingest_o = Ingest.objects.get(
-                        lwm_tool_name=item.get("ingest__lwm_tool_name"),
-                        lwm_tool_version=item.get("ingest__lwm_tool_version"),
+                    # relations, cached as few distinct values repeat per file
+                    item["digitisation_id"] = digitisation_pk(
+                        item.pop("digitisation__software")
                     )
-                    data_provider_o = DataProvider.objects.get(
-                        name=item.get("data_provider")
+                    item["ingest_id"] = ingest_pk(
+                        item.pop("ingest__lwm_tool_name"),
+                        item.pop("ingest__lwm_tool_version"),
                     )
-                    issue_o = Issue.objects.get(
-                        issue_code=item.get("issue__issue_identifier")
+                    item["data_provider_id"] = data_provider_pk(
+                        item.pop("data_provider")
                     )
-
-                    del item["digitisation__software"]
-                    del item["ingest__lwm_tool_name"]
-                    del item["ingest__lwm_tool_version"]
-                    del item["data_provider"]
-                    del item["issue__issue_identifier"]
-
-                    item["digitisation"] = digitisation_o
-                    item["ingest"] = ingest_o
-                    item["data_provider"] = data_provider_o
-                    item["issue"] = issue_o
+                    item["issue_id"] = issue_pks[item.pop("issue__issue_identifier")]
 
                     if not item["ocr_quality_mean"] or item["ocr_quality_mean"] == "":
                         item["ocr_quality_mean"] = 0
@@ -227,23 +258,31 @@ class Command(NewspapersFixture):
                     if not item["ocr_quality_sd"] or item["ocr_quality_sd"] == "":
                         item["ocr_quality_sd"] = 0
 
-                    if Item.objects.filter(**item):
-                        # improving speed
-                        continue
-
-                    # write to db
-                    try:
-                        item_o, _ = Item.objects.update_or_create(
-                            item_code=item["item_code"], defaults=item
-                        )
-                        total += 1
-                        # self.stdout.write(
-                        #     self.style.SUCCESS(f"Item {item_o.id} written to db")
-                        # )
-                    except OperationalError as e:
-                        if "database is locked" in str(e):
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"Warning: database is locked. Cannot write Item."
-                                )
+                    item_o = Item(**item)
+                    # `bulk_create` does not call `save`
+                    item_o.normalise()
+                    item_objs.append(item_o)
+
+                # write to db, updating existing items by `ON CONFLICT`
+                try:
+                    Item.objects.upsert(
+                        item_objs,
+                        update_fields=ITEM_UPSERT_FIELDS,
+                        batch_size=ITEM_UPSERT_BATCH_SIZE,
+                    )
+                    total += len(item_objs)
+                except OperationalError as e:
+                    if "database is locked" in str(e):
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f"Warning: database is locked. Cannot write Item."
                             )
+                        )
+
+                # Update counters once per file of items, rather than per item
+                Issue.objects.filter(
+                    pk__in={item.issue_id for item in item_objs}
+                ).update_counts()
+
+        # Invalidate cached API responses once the whole ingest is written
+        bump_data_version()
@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import cpu_count
+from pathlib import Path
+from typing import Final
+
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.utils import timezone
+from tqdm import tqdm
+
+from fulltext.text_statistics import TextStatistics, archive_text_statistics
+
+from ...models import FulltextArchive, Item, ItemTextStatistics
+
+PLAINTEXT_ARCHIVE_GLOB: Final[str] = "*_plaintext.zip"
+DEFAULT_BATCH_SIZE: Final[int] = 5000
+TEXT_STATISTICS_FIELDS: Final[list[str]] = list(TextStatistics._fields)
+
+
+class Command(BaseCommand):
+    """Calculate `ItemTextStatistics` from every plaintext archive, once each.
+
+    Archives are processed in parallel worker processes, while results are
+    written in bulk by this process. Each archive is recorded as a
+    `FulltextArchive` when complete, so an interrupted run resumes from the
+    remaining archives.
+    """
+
+    help: str = "Calculate token, character and line counts from full text archives"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--archive-dir",
+            type=Path,
+            default=Path(Item.DOWNLOAD_DIR) / Item.ARCHIVE_SUBDIR,
+            help="Folder of `*_plaintext.zip` archives",
+        )
+        parser.add_argument("--workers", type=int, default=cpu_count())
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Reprocess archives which have already been completed",
+        )
+
+    def handle(self, *args, **options) -> None:
+        archive_paths: list[Path] = sorted(
+            options["archive_dir"].glob(PLAINTEXT_ARCHIVE_GLOB)
+        )
+        if not options["force"]:
+            completed: set[str] = set(
+                FulltextArchive.objects.filter(completed_at__isnull=False).values_list(
+                    "name", flat=True
+                )
+            )
+            archive_paths = [
+                path for path in archive_paths if path.name not in completed
+            ]
+        self.stdout.write(f"Processing {len(archive_paths)} archives")
+
+        # Worker processes must not inherit open database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {
+                executor.submit(archive_text_statistics, path): path
+                for path in archive_paths
+            }
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                archive_path: Path = futures[future]
+                self.save_archive(
+                    archive_path, future.result(), batch_size=options["batch_size"]
+                )
+
+    def save_archive(
+        self,
+        archive_path: Path,
+        statistics: dict[str, TextStatistics],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Bulk write `statistics` for `Item`s in `archive_path`, marking complete."""
+        publication_code: str = archive_path.name.split("_")[0]
+        item_pks: dict[str, int] = {
+            str(Path(input_sub_path) / input_filename): pk
+            for pk, input_sub_path, input_filename in Item.objects.filter(
+                issue__newspaper__publication_code=publication_code
+            ).values_list("pk", "issue__input_sub_path", "input_filename")
+        }
+        with transaction.atomic():
+            archive, _ = FulltextArchive.objects.get_or_create(name=archive_path.name)
+            records: list[ItemTextStatistics] = [
+                ItemTextStatistics(
+                    item_id=item_pks[path], archive=archive, **stats._asdict()
+                )
+                for path, stats in statistics.items()
+                if path in item_pks
+            ]
+            ItemTextStatistics.objects.bulk_create(
+                records,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["item"],
+                update_fields=["archive", *TEXT_STATISTICS_FIELDS, "updated_at"],
+            )
+            archive.item_count = len(records)
+            archive.unmatched_count = len(statistics) - len(records)
+            archive.completed_at = timezone.now()
+            archive.save()
+        if archive.unmatched_count:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{archive.unmatched_count} texts in {archive_path.name} "
+                    "have no matching `Item`"
+                )
+            )
@@ -3,11 +3,11 @@ import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 
-from django.core.serializers import serialize
 from django.db.utils import OperationalError
 from numpy import append, array
 from tqdm import tqdm
 
+from lwmdb.cache import bump_data_version
 from lwmdb.management.commands.fixtures import DATA_PROVIDERS, MOUNTPOINTS, Fixture
 from newspapers.models import DataProvider, Digitisation, Ingest, Issue, Newspaper
 
@@ -32,19 +32,9 @@ class Command(Fixture):
     def save_fixtures(self):
         for model in self.models:
             filename = f"{model._meta.label.split('.')[-1]}-fixtures.json"
-            model_fields = model._meta.get_fields()
-            data = serialize(
-                "json",
-                model.objects.all(),
-                fields=[
-                    x.name
-                    for x in model_fields
-                    if not x.name in ["created_at", "updated_at"]
-                ],
-            )
             path = self.get_output_dir() / filename
             with open(path, "w+") as f:
-                f.write(data)
+                f.write(self.serialize_model(model))
 
         return True
 
@@ -265,11 +255,11 @@ class Command(Fixture):
                     continue
 
                 try:
-                    o, _ = Newspaper.objects.update_or_create(
-                        publication_code=newspaper["publication_code"],
-                        defaults=newspaper,
+                    Newspaper.objects.upsert(
+                        [Newspaper(**newspaper)],
+                        update_fields=newspaper.keys() - {"publication_code"},
                     )
-                    success_msg("Newspaper", o.id)
+                    success_msg("Newspaper", newspaper["publication_code"])
 
                 except OperationalError as e:
                     if "database is locked" in str(e):
@@ -287,6 +277,16 @@ class Command(Fixture):
                 issues = [
                     json.loads(line) for line in json_path.read_text().splitlines()
                 ]
+                # One lookup per file, rather than one `Newspaper` query per issue
+                newspaper_pks: dict[str, int] = dict(
+                    Newspaper.objects.filter(
+                        publication_code__in={
+                            issue.get("publication__publication_code")
+                            for issue in issues
+                        }
+                    ).values_list("publication_code", "pk")
+                )
+                issue_objs: list[Issue] = []
 
                 for issue in (bar2 := tqdm(issues, leave=False)):
                     if not issue.get("issue_code"):
@@ -295,10 +295,6 @@ class Command(Fixture):
 
                     bar2.set_description(f"{total} saved :: {issue['issue_date']}")
 
-                    if Issue.objects.filter(issue_code=issue["issue_code"]).count():
-                        # there is already an issue - we might want to overwrite, but testing for speed here.
-                        continue
-
                     if not issue.get("publication__publication_code"):
                         error_msg(
                             "issue",
@@ -308,30 +304,38 @@ class Command(Fixture):
                         continue
 
                     # connections
-                    try:
-                        issue["newspaper"] = Newspaper.objects.get(
-                            publication_code=issue["publication__publication_code"]
-                        )
-                    except Newspaper.DoesNotExist:
+                    publication_code = issue.pop("publication__publication_code")
+                    if publication_code not in newspaper_pks:
                         error_msg(
                             "issue",
-                            required=f"related newspaper ({issue['publication__publication_code']}) in db",
+                            required=f"related newspaper ({publication_code}) in db",
                             json_path=json_path,
                         )
                         continue
 
-                    del issue["publication__publication_code"]
+                    issue["newspaper_id"] = newspaper_pks[publication_code]
+                    issue_objs.append(Issue(**issue))
 
-                    try:
-                        o, _ = Issue.objects.update_or_create(
-                            issue_code=issue["issue_code"], defaults=issue
-                        )
-                        total += 1
-                        success_msg("Issue", o.id)
-                    except OperationalError as e:
-                        if "database is locked" in str(e):
-                            error_msg("Newspaper", locked=True)
-                            continue
+                # Existing issues are updated by `ON CONFLICT`, not checked first
+                try:
+                    Issue.objects.upsert(
+                        issue_objs,
+                        update_fields=["issue_date", "input_sub_path", "newspaper"],
+                    )
+                    total += len(issue_objs)
+                    success_msg("Issues", json_path)
+                except OperationalError as e:
+                    if "database is locked" in str(e):
+                        error_msg("Issue", locked=True)
+                        continue
+
+                # Update counters once per file of issues, rather than per issue
+                Newspaper.objects.filter(
+                    pk__in={issue.newspaper_id for issue in issue_objs}
+                ).update_counts()
+
+        # Invalidate cached API responses once the whole ingest is written
+        bump_data_version()
 
     # def ingest_newspapers(self):
     #     for data_provider in DATA_PROVIDERS:
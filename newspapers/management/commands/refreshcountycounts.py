@@ -0,0 +1,29 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from ...models import COUNTY_YEAR_COUNTS_MODELS
+
+
+class Command(BaseCommand):
+    """Refresh materialized views of counts per county per year."""
+
+    help: str = "Refresh newspaper, issue and item counts per county per year"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--blocking",
+            action="store_true",
+            help="Refresh without `CONCURRENTLY`, locking out reads but faster",
+        )
+
+    def handle(self, *args, **options) -> None:
+        for model in COUNTY_YEAR_COUNTS_MODELS:
+            start: float = perf_counter()
+            model.objects.refresh(concurrently=not options["blocking"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Refreshed {model._meta.db_table} "
+                    f"({model.objects.count()} rows) in {perf_counter() - start:.1f}s"
+                )
+            )
@@ -0,0 +1,63 @@
+from time import perf_counter
+from typing import Final
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min, QuerySet
+
+from lwmdb.cache import bump_data_version
+
+from ...models import Issue, Newspaper
+
+# `pk` range updated per `UPDATE`, bounding each statement's locks and runtime
+DEFAULT_COUNTS_BATCH_SIZE: Final[int] = 50000
+
+
+def update_counts_in_batches(
+    queryset: QuerySet, batch_size: int = DEFAULT_COUNTS_BATCH_SIZE
+) -> int:
+    """Call `update_counts` on `queryset` a `pk` range at a time."""
+    bounds: dict[str, int | None] = queryset.aggregate(first=Min("pk"), last=Max("pk"))
+    if bounds["first"] is None:
+        return 0
+    updated: int = 0
+    for start in range(bounds["first"], bounds["last"] + 1, batch_size):
+        updated += queryset.filter(
+            pk__gte=start, pk__lt=start + batch_size
+        ).update_counts()
+    return updated
+
+
+class Command(BaseCommand):
+    """Recalculate denormalised `Issue` and `Newspaper` counters in bulk."""
+
+    help: str = "Recalculate item counts per issue and issue counts per newspaper"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--publication-code",
+            nargs="+",
+            type=str,
+            help="Only update these newspapers and their issues",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_COUNTS_BATCH_SIZE)
+
+    def handle(self, *args, **options) -> None:
+        issues: QuerySet = Issue.objects.all()
+        newspapers: QuerySet = Newspaper.objects.all()
+        if options["publication_code"]:
+            issues = issues.filter(
+                newspaper__publication_code__in=options["publication_code"]
+            )
+            newspapers = newspapers.filter(
+                publication_code__in=options["publication_code"]
+            )
+        for queryset in (issues, newspapers):
+            start: float = perf_counter()
+            updated: int = update_counts_in_batches(queryset, options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Updated {updated} {queryset.model._meta.verbose_name_plural} "
+                    f"in {perf_counter() - start:.1f}s"
+                )
+            )
+        bump_data_version()
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2023-11-22 11:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("newspapers", "0010_dataprovider_code_dataprovider_legacy_code"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="item",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"], name="item_title_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newspaper",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="newspaper_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
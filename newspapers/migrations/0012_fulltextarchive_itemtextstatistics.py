@@ -0,0 +1,78 @@
+# Generated by Django 4.2.7 on 2023-11-23 14:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("newspapers", "0011_trigram_title_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FulltextArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("item_count", models.IntegerField(default=0)),
+                ("unmatched_count", models.IntegerField(default=0)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ItemTextStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("token_count", models.IntegerField()),
+                ("char_count", models.IntegerField()),
+                ("line_count", models.IntegerField()),
+                ("noise_score", models.FloatField()),
+                (
+                    "archive",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="item_text_statistics",
+                        related_query_name="item_text_statistics",
+                        to="newspapers.fulltextarchive",
+                    ),
+                ),
+                (
+                    "item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="text_statistics",
+                        related_query_name="text_statistics",
+                        to="newspapers.item",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "item text statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 4.2.7 on 2023-11-27 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+COUNTY_FIELDS: dict[str, str] = {
+    "newspapers_historic_county_year_counts": "historic_county_id",
+    "newspapers_admin_county_year_counts": "admin_county_id",
+    "newspapers_country_year_counts": "country_id",
+}
+
+CREATE_VIEW_SQL: str = """
+CREATE MATERIALIZED VIEW {view} AS
+SELECT
+    place.{county_field}::bigint * 10000 + EXTRACT(YEAR FROM issue.issue_date)::int AS id,
+    place.{county_field} AS county_id,
+    EXTRACT(YEAR FROM issue.issue_date)::int AS year,
+    COUNT(DISTINCT newspaper.id)::int AS newspaper_count,
+    COUNT(DISTINCT issue.id)::int AS issue_count,
+    COUNT(item.id)::int AS item_count
+FROM newspapers_issue AS issue
+JOIN newspapers_newspaper AS newspaper ON issue.newspaper_id = newspaper.id
+JOIN gazetteer_place AS place ON newspaper.place_of_publication_id = place.id
+LEFT JOIN newspapers_item AS item ON item.issue_id = issue.id
+WHERE place.{county_field} IS NOT NULL
+GROUP BY place.{county_field}, EXTRACT(YEAR FROM issue.issue_date)
+WITH DATA;
+CREATE UNIQUE INDEX {view}_id ON {view} (id);
+CREATE INDEX {view}_year ON {view} (year);
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gazetteer", "0003_place_point"),
+        ("newspapers", "0012_fulltextarchive_itemtextstatistics"),
+    ]
+
+    operations = [
+        *(
+            migrations.RunSQL(
+                CREATE_VIEW_SQL.format(view=view, county_field=county_field),
+                f"DROP MATERIALIZED VIEW IF EXISTS {view};",
+            )
+            for view, county_field in COUNTY_FIELDS.items()
+        ),
+        migrations.CreateModel(
+            name="HistoricCountyYearCounts",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("year", models.IntegerField()),
+                ("newspaper_count", models.IntegerField()),
+                ("issue_count", models.IntegerField()),
+                ("item_count", models.IntegerField()),
+                (
+                    "county",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="year_counts",
+                        related_query_name="year_counts",
+                        to="gazetteer.historiccounty",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "historic county year counts",
+                "db_table": "newspapers_historic_county_year_counts",
+                "ordering": ["county", "year"],
+                "abstract": False,
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="AdminCountyYearCounts",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("year", models.IntegerField()),
+                ("newspaper_count", models.IntegerField()),
+                ("issue_count", models.IntegerField()),
+                ("item_count", models.IntegerField()),
+                (
+                    "county",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="year_counts",
+                        related_query_name="year_counts",
+                        to="gazetteer.admincounty",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "admin county year counts",
+                "db_table": "newspapers_admin_county_year_counts",
+                "ordering": ["county", "year"],
+                "abstract": False,
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="CountryYearCounts",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("year", models.IntegerField()),
+                ("newspaper_count", models.IntegerField()),
+                ("issue_count", models.IntegerField()),
+                ("item_count", models.IntegerField()),
+                (
+                    "county",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="year_counts",
+                        related_query_name="year_counts",
+                        to="gazetteer.country",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "country year counts",
+                "db_table": "newspapers_country_year_counts",
+                "ordering": ["county", "year"],
+                "abstract": False,
+                "managed": False,
+            },
+        ),
+    ]
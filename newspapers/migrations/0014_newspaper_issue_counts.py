@@ -0,0 +1,67 @@
+# Generated by Django 4.2.7 on 2026-10-19 16:31
+
+from django.db import migrations, models
+
+POPULATE_ISSUE_COUNTS_SQL: str = """
+UPDATE newspapers_issue AS issue
+SET item_count = counts.item_count, total_word_count = counts.total_word_count
+FROM (
+    SELECT issue_id, COUNT(*) AS item_count,
+        COALESCE(SUM(word_count), 0) AS total_word_count
+    FROM newspapers_item
+    WHERE issue_id IS NOT NULL
+    GROUP BY issue_id
+) AS counts
+WHERE issue.id = counts.issue_id;
+"""
+
+POPULATE_NEWSPAPER_COUNTS_SQL: str = """
+UPDATE newspapers_newspaper AS newspaper
+SET issue_count = counts.issue_count,
+    first_issue_date = counts.first_issue_date,
+    last_issue_date = counts.last_issue_date
+FROM (
+    SELECT newspaper_id, COUNT(*) AS issue_count,
+        MIN(issue_date) AS first_issue_date, MAX(issue_date) AS last_issue_date
+    FROM newspapers_issue
+    WHERE newspaper_id IS NOT NULL
+    GROUP BY newspaper_id
+) AS counts
+WHERE newspaper.id = counts.newspaper_id;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("newspapers", "0013_county_year_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newspaper",
+            name="issue_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="first_issue_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newspaper",
+            name="last_issue_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="item_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="total_word_count",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunSQL(POPULATE_ISSUE_COUNTS_SQL, migrations.RunSQL.noop),
+        migrations.RunSQL(POPULATE_NEWSPAPER_COUNTS_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 16:52
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("newspapers", "0014_newspaper_issue_counts"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["newspaper", "issue_date"], name="issue_newspaper_date_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["issue_date"], name="issue_date_brin_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="item",
+            index=models.Index(
+                fields=["issue", "item_type"], name="item_issue_type_idx"
+            ),
+        ),
+    ]
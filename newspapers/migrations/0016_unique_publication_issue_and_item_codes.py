@@ -0,0 +1,87 @@
+# Generated by Django 4.2.7 on 2026-10-19 17:24
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+def add_unique_constraint_concurrently(
+    model_name: str, table: str, column: str, name: str
+) -> migrations.SeparateDatabaseAndState:
+    """Build a unique index without blocking writes, then attach it.
+
+    Fails if `column` has duplicates: run `manage.py dedupcodes` first. As
+    the migration is not atomic, constraints already added by an earlier
+    failed run are skipped, and an invalid index left by a failed build is
+    dropped and rebuilt.
+    """
+
+    def forwards(apps, schema_editor) -> None:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_constraint WHERE conname = %s", [name])
+            if cursor.fetchone():
+                return
+            cursor.execute(
+                "SELECT NOT indisvalid FROM pg_index "
+                "WHERE indexrelid = to_regclass(%s)",
+                [name],
+            )
+            invalid: tuple[bool] | None = cursor.fetchone()
+        if invalid and invalid[0]:
+            schema_editor.execute(f'DROP INDEX CONCURRENTLY "{name}"')
+        if not invalid or invalid[0]:
+            schema_editor.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY "{name}" ON "{table}" ("{column}")'
+            )
+        schema_editor.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" UNIQUE USING INDEX "{name}"'
+        )
+
+    def backwards(apps, schema_editor) -> None:
+        schema_editor.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{name}"')
+
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[migrations.RunPython(forwards, backwards)],
+        state_operations=[
+            migrations.AddConstraint(
+                model_name=model_name,
+                constraint=models.UniqueConstraint(fields=[column], name=name),
+            ),
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("newspapers", "0015_issue_item_composite_and_brin_indexes"),
+    ]
+
+    operations = [
+        add_unique_constraint_concurrently(
+            "newspaper",
+            "newspapers_newspaper",
+            "publication_code",
+            "unique_publication_code",
+        ),
+        add_unique_constraint_concurrently(
+            "issue", "newspapers_issue", "issue_code", "unique_issue_code"
+        ),
+        add_unique_constraint_concurrently(
+            "item", "newspapers_item", "item_code", "unique_item_code"
+        ),
+        # Made redundant by the unique indexes above
+        RemoveIndexConcurrently(
+            model_name="newspaper",
+            name="newspapers__publica_bfbe2a_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="issue",
+            name="newspapers__issue_c_e41b28_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="item",
+            name="newspapers__item_co_417bcf_idx",
+        ),
+    ]
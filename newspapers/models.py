@@ -1,27 +1,298 @@
 import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
 from logging import getLogger
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from typing import Final
+from typing import Final, Literal
 from zipfile import ZipFile
 
 from azure.storage.blob import BlobClient
-from django.db import models
-from django_pandas.managers import DataFrameManager
-
-from fulltext.models import Fulltext
-from gazetteer.models import Place
-from lwmdb.utils import truncate_str, word_count
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
+from django.db import connection, models
+from django.db.models import (
+    Count,
+    F,
+    FloatField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+from django_pandas.managers import DataFrameQuerySet
+from pandas import DataFrame
+
+from fulltext.models import DEFAULT_SEARCH_CONFIG, Fulltext
+from gazetteer.models import AdminCounty, Country, HistoricCounty, Place
+from lwmdb.utils import (
+    DEFAULT_DATAFRAME_CHUNK_SIZE,
+    dataframe_dtypes,
+    decode_cursor,
+    encode_cursor,
+    truncate_str,
+    word_count,
+)
 
 logger = getLogger(__name__)
 
 MAX_PRINT_SELF_STR_LENGTH: Final[int] = 80
+DEFAULT_SEARCH_PAGE_SIZE: Final[int] = 50
+DEFAULT_SEARCH_TYPE: Final[str] = "websearch"
+
+# Default of the `pg_trgm.similarity_threshold` setting used by the `%` operator
+PG_TRGM_SIMILARITY_THRESHOLD: Final[float] = 0.3
+DEFAULT_SIMILARITY_THRESHOLD: Final[float] = PG_TRGM_SIMILARITY_THRESHOLD
+# Default of the `pg_trgm.word_similarity_threshold` setting used by `<%`
+PG_TRGM_WORD_SIMILARITY_THRESHOLD: Final[float] = 0.6
+DEFAULT_WORD_SIMILARITY_THRESHOLD: Final[float] = PG_TRGM_WORD_SIMILARITY_THRESHOLD
+DEFAULT_SIMILARITY_FIELD: Final[str] = "title"
+
+FulltextOutput = Literal["lines", "text", "iter", "mmap"]
+
+FULLTEXT_OUTPUT_LINES: Final[FulltextOutput] = "lines"
+FULLTEXT_OUTPUT_TEXT: Final[FulltextOutput] = "text"
+FULLTEXT_OUTPUT_ITER: Final[FulltextOutput] = "iter"
+FULLTEXT_OUTPUT_MMAP: Final[FulltextOutput] = "mmap"
+FULLTEXT_OUTPUTS: Final[tuple[FulltextOutput, ...]] = (
+    FULLTEXT_OUTPUT_LINES,
+    FULLTEXT_OUTPUT_TEXT,
+    FULLTEXT_OUTPUT_ITER,
+    FULLTEXT_OUTPUT_MMAP,
+)
+
+
+class EmptyFulltextMmap(bytes):
+    """Empty `bytes` standing in for an `mmap`, which cannot map empty files.
+
+    Like an `mmap`, it can be `close`d or used as a context manager.
+
+    Example:
+        ```pycon
+        >>> with EmptyFulltextMmap() as text:
+        ...     text[:]
+        b''
+
+        ```
+    """
+
+    def __enter__(self) -> "EmptyFulltextMmap":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+FulltextReturn = list[str] | str | Iterator[str] | mmap | EmptyFulltextMmap
+
+
+class NewspapersQuerySet(DataFrameQuerySet):
+    def iter_dataframes(
+        self,
+        *fields: str,
+        chunk_size: int = DEFAULT_DATAFRAME_CHUNK_SIZE,
+        categorical: Iterable[str] | None = None,
+    ) -> Iterator[DataFrame]:
+        """Yield `DataFrame`s of at most `chunk_size` rows of `fields`.
+
+        Unlike `to_dataframe()`, rows are read with `values_list` from a
+        server-side cursor, so memory is bounded by `chunk_size` however large
+        the `QuerySet`. Columns use nullable `dtypes` from `dataframe_dtypes`.
+
+        Note:
+            `category` columns are typed per chunk. To combine chunks, use
+            `pandas.api.types.union_categoricals` or cast to `string` first.
+
+        Args:
+            fields: Field names, attnames or related lookups. Defaults to the
+                `attname` of every concrete field.
+            chunk_size: Maximum rows per `DataFrame`.
+            categorical: Lookups to set as `category`. Defaults to `ForeignKey`
+                attnames and related `str` lookups like `data_provider__code`.
+
+        Example:
+            ```python
+            items = Item.objects.filter(issue__issue_date__year=1894)
+            for df in items.iter_dataframes(
+                "item_code", "word_count", "data_provider__code", chunk_size=50000
+            ):
+                df.groupby("data_provider__code", observed=True).word_count.sum()
+            ```
+        """
+        fields = fields or tuple(
+            field.attname for field in self.model._meta.concrete_fields
+        )
+        dtypes: dict[str, str] = dataframe_dtypes(self.model, fields, categorical)
+        rows: Iterator[tuple] = self.values_list(*fields).iterator(
+            chunk_size=chunk_size
+        )
+        while chunk := list(islice(rows, chunk_size)):
+            yield DataFrame.from_records(chunk, columns=fields).astype(dtypes)
+
+    def similar(
+        self,
+        text: str,
+        field: str = DEFAULT_SIMILARITY_FIELD,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> "NewspapersQuerySet":
+        """Filter `field` by trigram similarity to `text`, most similar first.
+
+        Intended for `OCR`-degraded titles where `icontains` misses near
+        matches. A `threshold` of at least `PG_TRGM_SIMILARITY_THRESHOLD`
+        also filters via the `%` operator so the trigram `GIN` index on `field`
+        is used; lower thresholds fall back to a sequential scan.
+
+        Args:
+            text: `str` to compare with `field`
+            field: name of an indexed text field, `title` by default
+            threshold: minimum `similarity` between `0` and `1`
+
+        Returns:
+            `QuerySet` annotated with `similarity`, ordered most similar first.
+        """
+        qs = self
+        if threshold >= PG_TRGM_SIMILARITY_THRESHOLD:
+            qs = qs.filter(**{f"{field}__trigram_similar": text})
+        return (
+            qs.annotate(similarity=TrigramSimilarity(field, text))
+            .filter(similarity__gte=threshold)
+            .order_by("-similarity", "pk")
+        )
+
+    def word_similar(
+        self,
+        text: str,
+        field: str = DEFAULT_SIMILARITY_FIELD,
+        threshold: float = DEFAULT_WORD_SIMILARITY_THRESHOLD,
+    ) -> "NewspapersQuerySet":
+        """Filter `field` by trigram word similarity to `text`, best first.
+
+        Unlike `similar`, `text` is compared with the most similar extent of
+        `field` rather than all of it, so a single (possibly misspelt) word
+        matches a long title. A `threshold` of at least
+        `PG_TRGM_WORD_SIMILARITY_THRESHOLD` also filters via the `<%`
+        operator so the trigram `GIN` index on `field` is used.
+
+        Args:
+            text: `str` to find within `field`
+            field: name of an indexed text field, `title` by default
+            threshold: minimum `word_similarity` between `0` and `1`
+
+        Returns:
+            `QuerySet` annotated with `word_similarity`, most similar first.
+        """
+        qs = self
+        if threshold >= PG_TRGM_WORD_SIMILARITY_THRESHOLD:
+            qs = qs.filter(**{f"{field}__trigram_word_similar": text})
+        return (
+            qs.annotate(word_similarity=TrigramWordSimilarity(text, field))
+            .filter(word_similarity__gte=threshold)
+            .order_by("-word_similarity", "pk")
+        )
+
+
+class NewspaperQuerySet(NewspapersQuerySet):
+    def update_counts(self) -> int:
+        """Recalculate `issue_count` and issue date span in one `UPDATE`.
+
+        Call once per ingest batch, on the `Newspaper`s whose issues changed,
+        rather than per saved `Issue`. Returns the number of rows updated.
+        """
+        issues = Issue.objects.filter(newspaper=OuterRef("pk")).order_by()
+        issues = issues.values("newspaper")
+        return self.update(
+            issue_count=Coalesce(
+                Subquery(issues.annotate(count=Count("pk")).values("count")), 0
+            ),
+            first_issue_date=Subquery(
+                issues.annotate(first=Min("issue_date")).values("first")
+            ),
+            last_issue_date=Subquery(
+                issues.annotate(last=Max("issue_date")).values("last")
+            ),
+            # `update` skips `auto_now`, which incremental exports rely on
+            updated_at=timezone.now(),
+        )
+
+
+class IssueQuerySet(NewspapersQuerySet):
+    def update_counts(self) -> int:
+        """Recalculate `item_count` and `total_word_count` in one `UPDATE`.
+
+        Call once per ingest batch, on the `Issue`s whose items changed,
+        rather than per saved `Item`. Returns the number of rows updated.
+        """
+        items = Item.objects.filter(issue=OuterRef("pk")).order_by().values("issue")
+        return self.update(
+            item_count=Coalesce(
+                Subquery(items.annotate(count=Count("pk")).values("count")), 0
+            ),
+            total_word_count=Coalesce(
+                Subquery(items.annotate(words=Sum("word_count")).values("words")), 0
+            ),
+            updated_at=timezone.now(),
+        )
+
+
+class CodeManager(models.Manager):
+    """Look up and upsert records by `code_field`, a unique natural key."""
+
+    code_field: str
+
+    def get_by_natural_key(self, code: str) -> models.Model:
+        return self.get(**{self.code_field: code})
+
+    def upsert(
+        self,
+        objs: Iterable[models.Model],
+        update_fields: Iterable[str],
+        batch_size: int | None = None,
+    ) -> list[models.Model]:
+        """Insert `objs`, updating `update_fields` of existing codes instead.
+
+        Each batch is a single `INSERT ... ON CONFLICT DO UPDATE`, so ingest
+        needs no existence check per record. If `objs` repeat a code, the
+        last is kept. Like `bulk_create`, `save` is not called.
+        """
+        unique_objs: dict[str, models.Model] = {
+            getattr(obj, self.code_field): obj for obj in objs
+        }
+        return self.bulk_create(
+            unique_objs.values(),
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=[self.code_field],
+            update_fields=[*update_fields, "updated_at"],
+        )
+
+
+class NewspaperManager(CodeManager.from_queryset(NewspaperQuerySet)):
+    code_field = "publication_code"
+
+
+class IssueManager(CodeManager.from_queryset(IssueQuerySet)):
+    code_field = "issue_code"
 
 
 class NewspapersModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    objects = DataFrameManager()
+    objects = models.Manager.from_queryset(NewspapersQuerySet)()
 
     class Meta:
         abstract = True
@@ -83,7 +354,6 @@ class Ingest(NewspapersModel):
 class Newspaper(NewspapersModel):
     """Newspaper, including title and place."""
 
-    # TODO #55: publication_code should be unique? Currently unique (but not tested with BNA)
     publication_code = models.CharField(max_length=600, default=None)
     title = models.CharField(max_length=255, default=None)
     location = models.CharField(max_length=255, default=None, blank=True, null=True)
@@ -94,27 +364,41 @@ class Newspaper(NewspapersModel):
         related_name="newspapers",
         related_query_name="newspaper",
     )
+    # Maintained by `NewspaperQuerySet.update_counts`, see `updatecounts`
+    issue_count = models.IntegerField(default=0)
+    first_issue_date = models.DateField(null=True, blank=True)
+    last_issue_date = models.DateField(null=True, blank=True)
+
+    objects = NewspaperManager()
 
     def __repr__(self):
         return self.publication_code
 
+    def natural_key(self) -> tuple[str]:
+        return (self.publication_code,)
+
     def __str__(self):
         return truncate_str(self.title, max_length=MAX_PRINT_SELF_STR_LENGTH)
 
     class Meta:
+        constraints = [
+            # Added concurrently, run `dedupcodes` before migrating, see #55
+            models.UniqueConstraint(
+                fields=["publication_code"], name="unique_publication_code"
+            ),
+        ]
         indexes = [
-            models.Index(
-                fields=[
-                    "publication_code",
-                ]
-            )
+            GinIndex(
+                fields=["title"],
+                opclasses=["gin_trgm_ops"],
+                name="newspaper_title_trgm_idx",
+            ),
         ]
 
 
 class Issue(NewspapersModel):
     """Newspaper Issue, including date and relevant source url."""
 
-    # TODO #55: issue_code should be unique? Currently unique (but not tested with BNA)
     issue_code = models.CharField(max_length=600, default=None)
     issue_date = models.DateField()
     input_sub_path = models.CharField(max_length=255, default=None)
@@ -127,10 +411,18 @@ class Issue(NewspapersModel):
         related_name="issues",
         related_query_name="issue",
     )
+    # Maintained by `IssueQuerySet.update_counts`, see `updatecounts`
+    item_count = models.IntegerField(default=0)
+    total_word_count = models.BigIntegerField(default=0)
+
+    objects = IssueManager()
 
     def __str__(self):
         return str(self.issue_code)
 
+    def natural_key(self) -> tuple[str]:
+        return (self.issue_code,)
+
     @property
     def url(self):
         """Return a URL similar to the British Newspaper Archive structure.
@@ -148,19 +440,94 @@ class Issue(NewspapersModel):
         )
 
     class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["issue_code"], name="unique_issue_code"),
+        ]
         indexes = [
             models.Index(
-                fields=[
-                    "issue_code",
-                ]
-            )
+                fields=["newspaper", "issue_date"], name="issue_newspaper_date_idx"
+            ),
+            # Issues are loaded roughly in date order, so a small BRIN index suffices
+            BrinIndex(fields=["issue_date"], name="issue_date_brin_idx"),
         ]
 
 
+@dataclass
+class ItemSearchPage:
+    """A page of ranked `Item` search results with a cursor for the next."""
+
+    items: list["Item"]
+    next_cursor: str | None
+
+
+class ItemQuerySet(NewspapersQuerySet):
+    def search(
+        self,
+        query: str,
+        publication_code: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        item_type: str | None = None,
+        cursor: str | None = None,
+        page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+        config: str = DEFAULT_SEARCH_CONFIG,
+        search_type: str = DEFAULT_SEARCH_TYPE,
+    ) -> ItemSearchPage:
+        """Return a page of `Item`s whose `Fulltext` matches `query`, best first.
+
+        Pagination is by keyset on `(rank, pk)` rather than `OFFSET`, so later
+        pages cost the same as the first. Pass `next_cursor` from the previous
+        page as `cursor` to continue.
+
+        Args:
+            query: search terms, parsed according to `search_type`
+            publication_code: only include `Item`s from this `Newspaper`
+            start_date: only include `Item`s from `Issue`s on or after this date
+            end_date: only include `Item`s from `Issue`s on or before this date
+            item_type: only include this `item_type`, for example `ARTICLE`
+            cursor: `next_cursor` of the previous `ItemSearchPage`
+            page_size: maximum number of `Item`s per page
+            config: `postgres` text search configuration
+            search_type: `SearchQuery` type: `websearch`, `plain` or `phrase`
+
+        Returns:
+            An `ItemSearchPage` with `rank` annotated on each `Item`.
+        """
+        search_query = SearchQuery(query, config=config, search_type=search_type)
+        qs = self.filter(fulltext__search_vector=search_query)
+        if publication_code:
+            qs = qs.filter(issue__newspaper__publication_code=publication_code)
+        if start_date:
+            qs = qs.filter(issue__issue_date__gte=start_date)
+        if end_date:
+            qs = qs.filter(issue__issue_date__lte=end_date)
+        if item_type:
+            qs = qs.filter(item_type=item_type.upper())
+        # `ts_rank` returns `real`: cast to `double precision` so the `rank`
+        # read into a `cursor` compares equal when bound to the next query
+        qs = qs.annotate(
+            rank=Cast(
+                SearchRank(F("fulltext__search_vector"), search_query), FloatField()
+            )
+        )
+        if cursor:
+            last_rank, last_pk = decode_cursor(cursor)
+            qs = qs.filter(Q(rank__lt=last_rank) | Q(rank=last_rank, pk__gt=last_pk))
+        items: list[Item] = list(qs.order_by("-rank", "pk")[: page_size + 1])
+        next_cursor: str | None = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = encode_cursor(items[-1].rank, items[-1].pk)
+        return ItemSearchPage(items=items, next_cursor=next_cursor)
+
+
+class ItemManager(CodeManager.from_queryset(ItemQuerySet)):
+    code_field = "item_code"
+
+
 class Item(NewspapersModel):
     """Printed element in a Newspaper issue including metadata."""
 
-    # TODO #55: item_code should be unique? Currently, not unique, however so needs fixing in alto2txt2fixture
     MAX_TITLE_CHAR_COUNT: Final[int] = 100
 
     item_code = models.CharField(max_length=600, default=None)
@@ -208,20 +575,30 @@ class Item(NewspapersModel):
     )
     fulltext = models.OneToOneField(Fulltext, null=True, on_delete=models.SET_NULL)
 
+    objects = ItemManager()
+
     class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["item_code"], name="unique_item_code"),
+        ]
         indexes = [
-            models.Index(
-                fields=[
-                    "item_code",
-                ]
-            )
+            GinIndex(
+                fields=["title"],
+                opclasses=["gin_trgm_ops"],
+                name="item_title_trgm_idx",
+            ),
+            models.Index(fields=["issue", "item_type"], name="item_issue_type_idx"),
         ]
 
     def save(self, sync_title_counts: bool = False, *args, **kwargs):
+        self.normalise(sync_title_counts=sync_title_counts)
+        return super().save(*args, **kwargs)
+
+    def normalise(self, sync_title_counts: bool = False) -> None:
+        """Prepare fields as `save` does, for use before `bulk_create`."""
         # for consistency, we save all item_type in uppercase
         self.item_type = str(self.item_type).upper()
         self._sync_title_counts(force=sync_title_counts)
-        return super().save(*args, **kwargs)
 
     def __str__(self):
         return truncate_str(self.title, max_length=MAX_PRINT_SELF_STR_LENGTH)
@@ -229,6 +606,9 @@ class Item(NewspapersModel):
     def __repr__(self):
         return str(self.item_code)
 
+    def natural_key(self) -> tuple[str]:
+        return (self.item_code,)
+
     def _sync_title_char_count(self, force: bool = False) -> None:
         title_text_char_count: int = len(self.title)
         if not self.title_char_count or force:
@@ -386,18 +766,68 @@ class Item(NewspapersModel):
         with ZipFile(archive, "r") as zip_ref:
             zip_ref.extract(str(self.text_path), path=self.text_extracted_dir)
 
-    def read_fulltext_file(self) -> list[str]:
-        """Read the full text for this Item from a file."""
-        with open(self.text_extracted_dir / self.text_path) as f:
-            lines = f.readlines()
-        return lines
+    @property
+    def text_extracted_path(self) -> Path:
+        """Path to the extracted full text file for this Item."""
+        return self.text_extracted_dir / self.text_path
+
+    def read_fulltext_file(
+        self, output: FulltextOutput = FULLTEXT_OUTPUT_LINES
+    ) -> FulltextReturn:
+        """Read the full text for this Item from a file.
+
+        Args:
+            output:
+                `lines` for a `list` of lines (the default), `text` for a single
+                `str`, `iter` for a lazy line iterator, or `mmap` for a
+                read-only `mmap` of the file `bytes`, which the caller should
+                `close` (or use as a context manager).
+
+        Returns:
+            The full text in the format set by `output`.
+        """
+        if output == FULLTEXT_OUTPUT_LINES:
+            with open(self.text_extracted_path) as f:
+                return f.readlines()
+        elif output == FULLTEXT_OUTPUT_TEXT:
+            return self.text_extracted_path.read_text()
+        elif output == FULLTEXT_OUTPUT_ITER:
+            return self.iter_fulltext_lines()
+        elif output == FULLTEXT_OUTPUT_MMAP:
+            return self.mmap_fulltext_file()
+        else:
+            raise ValueError(
+                f"`output` must be one of {FULLTEXT_OUTPUTS}, not {output!r}"
+            )
 
-    def extract_fulltext(self) -> list[str]:
-        """Extract the full text of this newspaper item."""
-        # If the item full text has already been extracted, read it.
-        if os.path.exists(self.text_extracted_dir / self.text_path):
-            return self.read_fulltext_file()
+    def iter_fulltext_lines(self) -> Iterator[str]:
+        """Lazily yield lines of the extracted full text file."""
+        with open(self.text_extracted_path) as f:
+            yield from f
+
+    def mmap_fulltext_file(self) -> mmap | EmptyFulltextMmap:
+        """Return a read-only `mmap` of the extracted full text file.
 
+        Note:
+            Empty files cannot be mapped, so an `EmptyFulltextMmap` is
+            returned for those, which also supports `close` and `with`.
+        """
+        with open(self.text_extracted_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return EmptyFulltextMmap()
+            return mmap(f.fileno(), 0, access=ACCESS_READ)
+
+    def extract_fulltext(
+        self, output: FulltextOutput = FULLTEXT_OUTPUT_LINES
+    ) -> FulltextReturn:
+        """Extract the full text of this newspaper item.
+
+        Args:
+            output: format of the returned full text, see `read_fulltext_file`
+        """
+        # If the item full text has already been extracted, read it.
+        if os.path.exists(self.text_extracted_path):
+            return self.read_fulltext_file(output=output)
         if self.FULLTEXT_METHOD == "download":
             # If not already available locally, download the full text archive.
             if not self.is_downloaded():
@@ -422,9 +852,146 @@ class Item(NewspapersModel):
             )
 
         # If the item full text still hasn't been extracted, report failure.
-        if not os.path.exists(self.text_extracted_dir / self.text_path):
+        if not os.path.exists(self.text_extracted_path):
             raise RuntimeError(
-                f"Failed to extract fulltext for {self.item_code}; path does not exist: {self.text_extracted_dir / self.text_path}"
+                f"Failed to extract fulltext for {self.item_code}; path does not exist: {self.text_extracted_path}"
             )
 
-        return self.read_fulltext_file()
+        return self.read_fulltext_file(output=output)
+
+
+class FulltextArchive(NewspapersModel):
+    """A plaintext `zip` archive processed for `ItemTextStatistics`."""
+
+    name = models.CharField(max_length=255, unique=True)
+    item_count = models.IntegerField(default=0)
+    unmatched_count = models.IntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return str(self.name)
+
+
+class ItemTextStatistics(NewspapersModel):
+    """Counts calculated from the full text of an `Item`, not its metadata."""
+
+    item = models.OneToOneField(
+        Item,
+        on_delete=models.CASCADE,
+        related_name="text_statistics",
+        related_query_name="text_statistics",
+    )
+    archive = models.ForeignKey(
+        FulltextArchive,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="item_text_statistics",
+        related_query_name="item_text_statistics",
+    )
+    token_count = models.IntegerField()
+    char_count = models.IntegerField()
+    line_count = models.IntegerField()
+    noise_score = models.FloatField()
+
+    class Meta:
+        verbose_name_plural = "item text statistics"
+
+    def __str__(self):
+        return f"{self.item_id}: {self.token_count} tokens"
+
+
+class CountyYearCountsQuerySet(models.QuerySet):
+    """Read and refresh a materialized view of counts per county per year."""
+
+    def refresh(self, concurrently: bool = True) -> None:
+        """Recalculate the view, without blocking reads if `concurrently`."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "REFRESH MATERIALIZED VIEW "
+                f"{'CONCURRENTLY ' if concurrently else ''}"
+                f"{connection.ops.quote_name(self.model._meta.db_table)}"
+            )
+
+    def by_decade(self) -> "CountyYearCountsQuerySet":
+        """Sum `issue_count` and `item_count` per county per decade.
+
+        Note:
+            `newspaper_count` is distinct per year so is not summed.
+        """
+        return (
+            self.annotate(decade=F("year") / 10 * 10)
+            .values("county", "decade")
+            .annotate(issue_count=Sum("issue_count"), item_count=Sum("item_count"))
+            .order_by("county", "decade")
+        )
+
+
+class CountyYearCounts(models.Model):
+    """Counts of `Newspaper`, `Issue` and `Item` per county per year.
+
+    Subclasses read a materialized view created in migrations, with `id`
+    calculated as `county_id * 10000 + year`. Refresh with the
+    `refreshcountycounts` command after each ingest.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    year = models.IntegerField()
+    newspaper_count = models.IntegerField()
+    issue_count = models.IntegerField()
+    item_count = models.IntegerField()
+
+    objects = CountyYearCountsQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        managed = False
+        ordering = ["county", "year"]
+
+    def __str__(self):
+        return f"{self.county_id} {self.year}: {self.issue_count} issues"
+
+
+class HistoricCountyYearCounts(CountyYearCounts):
+    county = models.ForeignKey(
+        HistoricCounty,
+        on_delete=models.DO_NOTHING,
+        related_name="year_counts",
+        related_query_name="year_counts",
+    )
+
+    class Meta(CountyYearCounts.Meta):
+        db_table = "newspapers_historic_county_year_counts"
+        verbose_name_plural = "historic county year counts"
+
+
+class AdminCountyYearCounts(CountyYearCounts):
+    county = models.ForeignKey(
+        AdminCounty,
+        on_delete=models.DO_NOTHING,
+        related_name="year_counts",
+        related_query_name="year_counts",
+    )
+
+    class Meta(CountyYearCounts.Meta):
+        db_table = "newspapers_admin_county_year_counts"
+        verbose_name_plural = "admin county year counts"
+
+
+class CountryYearCounts(CountyYearCounts):
+    county = models.ForeignKey(
+        Country,
+        on_delete=models.DO_NOTHING,
+        related_name="year_counts",
+        related_query_name="year_counts",
+    )
+
+    class Meta(CountyYearCounts.Meta):
+        db_table = "newspapers_country_year_counts"
+        verbose_name_plural = "country year counts"
+
+
+COUNTY_YEAR_COUNTS_MODELS: Final[tuple[type[CountyYearCounts], ...]] = (
+    HistoricCountyYearCounts,
+    AdminCountyYearCounts,
+    CountryYearCounts,
+)
@@ -0,0 +1,50 @@
+"""Cached aggregate queries over `Newspaper`, `Issue` and `Item`.
+
+Results are cached by `lwmdb.cache.cached_query` until the next ingest or
+fixture load bumps the `newspapers` data version.
+"""
+
+from datetime import date
+
+from django.db.models import Count, Max, Min
+
+from lwmdb.cache import cached_query
+
+from .models import Issue, Item, Newspaper
+
+
+@cached_query()
+def issue_counts(publication_code: str | None = None) -> dict[str, int]:
+    """Return the number of `Issue`s per `Newspaper` `publication_code`."""
+    newspapers = Newspaper.objects.all()
+    if publication_code:
+        newspapers = newspapers.filter(publication_code=publication_code)
+    return dict(
+        newspapers.annotate(issue_count=Count("issue"))
+        .order_by("publication_code")
+        .values_list("publication_code", "issue_count")
+    )
+
+
+@cached_query()
+def issue_date_range(publication_code: str | None = None) -> dict[str, date | None]:
+    """Return the first and last `issue_date`, optionally of one `Newspaper`."""
+    issues = Issue.objects.all()
+    if publication_code:
+        issues = issues.filter(newspaper__publication_code=publication_code)
+    return issues.aggregate(
+        first_issue_date=Min("issue_date"), last_issue_date=Max("issue_date")
+    )
+
+
+@cached_query()
+def item_type_counts(publication_code: str | None = None) -> dict[str | None, int]:
+    """Return the number of `Item`s per `item_type`, most common first."""
+    items = Item.objects.all()
+    if publication_code:
+        items = items.filter(issue__newspaper__publication_code=publication_code)
+    return dict(
+        items.values_list("item_type")
+        .annotate(item_count=Count("pk"))
+        .order_by("-item_count", "item_type")
+    )
@@ -1,15 +1,41 @@
+import json
+from contextlib import chdir
 from datetime import datetime
+from io import StringIO
 from logging import DEBUG
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Final
 
 import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
+from pyarrow import dataset
 from pyfakefs.fake_filesystem_unittest import patchfs
 
+from fulltext.models import Fulltext
+from fulltext.text_statistics import text_statistics
+from gazetteer.models import HistoricCounty, Place
+from lwmdb.admin import EstimatedCountPaginator, estimated_count
+from lwmdb.cache import bump_data_version
 from lwmdb.utils import truncate_str, word_count
 
-from .models import MAX_PRINT_SELF_STR_LENGTH, DataProvider, Issue, Item, Newspaper
+from .management.commands.items import Command as ItemsFixture
+from .management.commands.itemtextstatistics import Command as TextStatisticsCommand
+from .models import (
+    MAX_PRINT_SELF_STR_LENGTH,
+    DataProvider,
+    FulltextArchive,
+    HistoricCountyYearCounts,
+    Issue,
+    Item,
+    ItemTextStatistics,
+    Newspaper,
+)
+from .stats import item_type_counts
 
 TEST_ITEM_CODE: Final[str] = "0003040-18940905-art0030"
 TEST_ITEM_TITLE: Final[str] = "SAD END OF A RAILWAY"
@@ -96,6 +122,382 @@ class ItemTestCase(TestCase):
         # TODO #24: testing.
         # self.assertEqual(item.fulltext[-57:], last_57_chars)
 
+    def test_extract_fulltext_outputs(self):
+        """Test reading an extracted full text file in each `output` format."""
+        item = Item.objects.get(item_code=TEST_ITEM_CODE)
+        lines: list[str] = ["SAD END OF A RAILWAY\n", "The jury concurred.\n"]
+        default_download_dir = Item.DOWNLOAD_DIR
+        with TemporaryDirectory() as tmp_dir:
+            Item.DOWNLOAD_DIR = tmp_dir
+            item.text_extracted_path.parent.mkdir(parents=True)
+            item.text_extracted_path.write_text("".join(lines))
+            try:
+                assert item.extract_fulltext() == lines
+                assert item.extract_fulltext(output="text") == "".join(lines)
+                assert list(item.extract_fulltext(output="iter")) == lines
+                with item.extract_fulltext(output="mmap") as text_mmap:
+                    assert text_mmap[:].decode() == "".join(lines)
+                with pytest.raises(ValueError):
+                    item.extract_fulltext(output="words")
+                item.text_extracted_path.write_text("")
+                with item.extract_fulltext(output="mmap") as text_mmap:
+                    assert text_mmap[:] == b""
+            finally:
+                Item.DOWNLOAD_DIR = default_download_dir
+
+    def test_save_archive_text_statistics(self):
+        """Test bulk saving `ItemTextStatistics` per archive, rerun safely."""
+        archive_path = Path("0003040_plaintext.zip")
+        item = Item.objects.get(item_code=TEST_ITEM_CODE)
+        statistics = {
+            str(item.text_path): text_statistics("SAD END OF A RAILWAY\n"),
+            "0003040/1894/0905/missing.txt": text_statistics("Unmatched"),
+        }
+        command = TextStatisticsCommand()
+        for _ in range(2):
+            command.save_archive(archive_path, statistics)
+        archive = FulltextArchive.objects.get(name=archive_path.name)
+        assert archive.completed_at
+        assert archive.item_count == 1
+        assert archive.unmatched_count == 1
+        assert ItemTextStatistics.objects.count() == 1
+        assert item.text_statistics.token_count == 5
+        assert item.text_statistics.line_count == 1
+        # Rerunning updates the existing row, including its timestamp
+        assert item.text_statistics.updated_at > item.text_statistics.created_at
+
+    def test_search_fulltext(self):
+        """Test ranked `Item.objects.search` with keyset pagination."""
+        item = Item.objects.get(item_code=TEST_ITEM_CODE)
+        item.fulltext = Fulltext.objects.create(
+            text="The railway inquest: the jury returned a verdict accordingly."
+        )
+        item.save()
+        assert Fulltext.objects.update_search_vectors() == 1
+
+        page = Item.objects.search("railway jury", item_type="none")
+        assert page.items == [item]
+        assert page.next_cursor is None
+        assert not Item.objects.search("railway", publication_code="0000000").items
+        assert not Item.objects.search("railway", start_date=datetime(1900, 1, 1)).items
+
+        second_item = Item.objects.create(
+            item_code=TEST_ITEM_CODE + "1",
+            title=TEST_ITEM_TITLE,
+            input_filename="0003040_18940905_art0031.txt",
+            issue=item.issue,
+            fulltext=Fulltext.objects.create(text="A railway railway railway."),
+        )
+        Fulltext.objects.update_search_vectors()
+        first_page = Item.objects.search("railway", page_size=1)
+        assert len(first_page.items) == 1
+        assert first_page.next_cursor
+        second_page = Item.objects.search(
+            "railway", page_size=1, cursor=first_page.next_cursor
+        )
+        assert {*first_page.items, *second_page.items} == {item, second_item}
+        assert second_page.next_cursor is None
+
+        # Ranks which are not exact binary fractions, shared by two `Item`s
+        third_item = Item.objects.create(
+            item_code=TEST_ITEM_CODE + "2",
+            title=TEST_ITEM_TITLE,
+            input_filename="0003040_18940905_art0032.txt",
+            issue=item.issue,
+            fulltext=Fulltext.objects.create(text="A railway railway railway."),
+        )
+        Fulltext.objects.update_search_vectors()
+        ranked: list[Item] = []
+        cursor: str | None = None
+        for _ in range(Item.objects.count()):
+            page = Item.objects.search("railway", page_size=1, cursor=cursor)
+            ranked += page.items
+            if not (cursor := page.next_cursor):
+                break
+        assert ranked == [second_item, third_item, item]
+        assert ranked[0].rank == ranked[1].rank
+        assert all(i.rank.as_integer_ratio()[1] > 2**10 for i in ranked)
+
+    def test_update_counts(self):
+        """Test recalculating denormalised `Issue` and `Newspaper` counters."""
+        issue = Issue.objects.get()
+        Item.objects.filter(item_code=TEST_ITEM_CODE).update(word_count=80)
+        Item.objects.create(
+            item_code="0003040-18940905-art0031",
+            title="LOCAL NEWS",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=issue,
+            word_count=120,
+        )
+        Issue.objects.create(
+            issue_code="0003040-18950102",
+            issue_date=datetime(year=1895, month=1, day=2),
+            input_sub_path="0003040/1895/0102",
+            newspaper=issue.newspaper,
+        )
+        updated_before = timezone.now()
+        call_command("updatecounts", "--batch-size", "1")
+        issue.refresh_from_db()
+        assert (issue.item_count, issue.total_word_count) == (2, 200)
+        assert Issue.objects.get(issue_code="0003040-18950102").item_count == 0
+        newspaper = Newspaper.objects.get()
+        assert newspaper.issue_count == 2
+        assert str(newspaper.first_issue_date) == "1894-09-05"
+        assert str(newspaper.last_issue_date) == "1895-01-02"
+        # Included by `exportparquet --incremental`
+        assert issue.updated_at > updated_before
+        assert newspaper.updated_at > updated_before
+
+    def test_benchmark_indexes(self):
+        """Test the index benchmark reports timings and rolls back its data."""
+        stdout = StringIO()
+        call_command(
+            "benchmarkindexes",
+            "--newspapers",
+            "2",
+            "--issues-per-newspaper",
+            "20",
+            "--items-per-issue",
+            "2",
+            stdout=stdout,
+        )
+        assert "items by date and type" in stdout.getvalue()
+        assert Newspaper.objects.count() == 1
+        assert Issue.objects.count() == 1
+
+    def test_upsert_by_natural_key(self):
+        """Test `upsert` updates the existing `Item` with the same `item_code`."""
+        item = Item.objects.get_by_natural_key(TEST_ITEM_CODE)
+        assert item.natural_key() == (TEST_ITEM_CODE,)
+        Item.objects.upsert(
+            [
+                Item(
+                    item_code=TEST_ITEM_CODE,
+                    title="RAILWAY ACCIDENT",
+                    input_filename=item.input_filename,
+                )
+            ],
+            update_fields=["title"],
+        )
+        item.refresh_from_db()
+        assert item.title == "RAILWAY ACCIDENT"
+        assert item.issue is not None
+        assert Item.objects.count() == 1
+
+    def test_dedup_codes(self):
+        """Test merging `Issue`s with the same `issue_code` and their `Item`s."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE newspapers_issue DROP CONSTRAINT unique_issue_code"
+            )
+        issue = Issue.objects.get()
+        duplicate = Issue.objects.create(
+            issue_code=issue.issue_code,
+            issue_date=issue.issue_date,
+            input_sub_path=issue.input_sub_path,
+            newspaper=issue.newspaper,
+        )
+        Item.objects.create(
+            item_code="0003040-18940905-art0031",
+            title="LOCAL NEWS",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=duplicate,
+        )
+        call_command("dedupcodes", "--models", "issue", stdout=StringIO())
+        assert Issue.objects.get().pk == issue.pk
+        issue.refresh_from_db()
+        assert issue.item_count == 2
+        assert Newspaper.objects.get().issue_count == 1
+
+    def test_admin_estimated_counts(self):
+        """Test `Item` and `Newspaper` admin pages with estimated counts."""
+        self.client.force_login(
+            User.objects.create_superuser("admin", "admin@example.com", "password")
+        )
+        response = self.client.get("/admin/newspapers/item/")
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == 1
+        newspaper = Newspaper.objects.get()
+        response = self.client.get(
+            f"/admin/newspapers/newspaper/{newspaper.pk}/change/"
+        )
+        assert response.status_code == 200
+        assert "0003040-18940905" in response.content.decode()
+
+        paginator = EstimatedCountPaginator(Item.objects.order_by("pk"), 10)
+        paginator.threshold = 0
+        # Exact if the table has never been analysed, so reltuples is -1
+        assert paginator.count in (estimated_count(Item.objects.all()), 1)
+
+    def test_iter_dataframes(self):
+        """Test reading `Item`s as typed `DataFrame` chunks."""
+        Item.objects.create(
+            item_code="0003040-18940905-art0031",
+            title="LOCAL NEWS",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=Issue.objects.get(),
+            data_provider=DataProvider.objects.get(),
+            word_count=120,
+        )
+        chunks = list(
+            Item.objects.order_by("pk").iter_dataframes(
+                "item_code", "word_count", "data_provider__name", chunk_size=1
+            )
+        )
+        assert [len(df) for df in chunks] == [1, 1]
+        assert chunks[0].item_code[0] == TEST_ITEM_CODE
+        assert str(chunks[1].word_count.dtype) == "Int32"
+        assert str(chunks[1].data_provider__name.dtype) == "category"
+
+    def test_item_api(self):
+        """Test filtering, sparse fields and keyset pages of the `Item` API."""
+        issue = Issue.objects.get()
+        Item.objects.create(
+            item_code="0003040-18940905-art0031",
+            title="LOCAL NEWS",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=issue,
+            item_type="advert",
+        )
+        response = self.client.get(
+            "/api/items/",
+            {"publication_code": "0003040", "fields": "item_code,issue_date"},
+        )
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"item_code": TEST_ITEM_CODE, "issue_date": "1894-09-05"},
+            {"item_code": "0003040-18940905-art0031", "issue_date": "1894-09-05"},
+        ]
+
+        first_page = self.client.get("/api/items/", {"page_size": 1}).json()
+        assert [item["item_code"] for item in first_page["results"]] == [TEST_ITEM_CODE]
+        second_page = self.client.get(first_page["next"]).json()
+        assert second_page["results"][0]["item_code"] == "0003040-18940905-art0031"
+        assert second_page["next"] is None
+
+        adverts = self.client.get("/api/items/", {"item_type": "advert"}).json()
+        assert [item["item_type"] for item in adverts["results"]] == ["ADVERT"]
+        assert not self.client.get("/api/items/", {"end_date": "1890-01-01"}).json()[
+            "results"
+        ]
+        assert self.client.get("/api/items/", {"fields": "text"}).status_code == 400
+        assert self.client.get("/api/items/", {"cursor": "bad"}).status_code == 400
+        detail = self.client.get(f"/api/issues/{issue.pk}/").json()
+        assert detail["publication_code"] == "0003040"
+
+    def test_cached_stats(self):
+        """Test aggregate stats are cached until the data version is bumped."""
+        stats = self.client.get("/api/stats/").json()
+        assert stats["issue_counts"] == {"0003040": 1}
+        assert stats["first_issue_date"] == "1894-09-05"
+        assert stats["item_type_counts"] == {"NONE": 1}
+        Item.objects.create(
+            item_code="0003040-18940905-art0031",
+            title="LOCAL NEWS",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=Issue.objects.get(),
+            item_type="advert",
+        )
+        assert item_type_counts() == {"NONE": 1}
+        assert self.client.get("/api/stats/").json() == stats
+        bump_data_version()
+        assert item_type_counts() == {"ADVERT": 1, "NONE": 1}
+        assert self.client.get("/api/stats/").json()["item_type_counts"] == {
+            "ADVERT": 1,
+            "NONE": 1,
+        }
+
+        # Ingesting (here an empty cache) also bumps the data version
+        Item.objects.filter(item_type="ADVERT").delete()
+        assert item_type_counts() == {"ADVERT": 1, "NONE": 1}
+        with TemporaryDirectory() as empty_dir, chdir(empty_dir):
+            ItemsFixture().ingest_cache()
+        assert item_type_counts() == {"NONE": 1}
+
+    def test_item_export(self):
+        """Test streaming filtered `Item`s as `CSV` and `NDJSON`."""
+        params = {"publication_code": "0003040", "fields": "item_code,issue_date"}
+        response = self.client.get("/api/items/export/", params)
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert b"".join(response.streaming_content).decode().splitlines() == [
+            "item_code,issue_date",
+            f"{TEST_ITEM_CODE},1894-09-05",
+        ]
+        response = self.client.get("/api/items/export/", {**params, "format": "ndjson"})
+        assert [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ] == [{"item_code": TEST_ITEM_CODE, "issue_date": "1894-09-05"}]
+        assert (
+            self.client.get("/api/items/export/", {"format": "xml"}).status_code == 400
+        )
+
+    def test_export_parquet(self):
+        """Test full and incremental `exportparquet` of `Item`s."""
+        DataProvider.objects.update(code="lwm")
+        with TemporaryDirectory() as output_dir:
+            call_command(
+                "exportparquet",
+                "--output-dir",
+                output_dir,
+                "--models",
+                "item",
+                "--dictionary-codes",
+            )
+            item_path: Path = Path(output_dir) / "item"
+            assert (item_path / "data_provider_code=lwm" / "year=1894").is_dir()
+            table = dataset.dataset(item_path, partitioning="hive").to_table()
+            assert table.column("item_code").to_pylist() == [TEST_ITEM_CODE]
+            assert table.column("issue_code").to_pylist() == ["0003040-18940905"]
+
+            call_command(
+                "exportparquet",
+                "--output-dir",
+                output_dir,
+                "--models",
+                "item",
+                "--incremental",
+            )
+            assert dataset.dataset(item_path).count_rows() == 1
+
+    def test_similar_title(self):
+        """Test trigram `similar` search tolerates OCR errors in titles."""
+        ocr_title: str = "The Birkenhcad Nevvs and Wirral Gencral Advertiser"
+        assert not Newspaper.objects.filter(title__icontains=ocr_title).exists()
+        newspaper = Newspaper.objects.similar(ocr_title).get()
+        assert newspaper.publication_code == "0003040"
+        assert 0.3 <= newspaper.similarity < 1
+        assert not Newspaper.objects.similar(ocr_title, threshold=0.99).exists()
+        assert Item.objects.similar("SAD END OF RAILWAY").get().item_code == (
+            TEST_ITEM_CODE
+        )
+
+    def test_word_similar_title(self):
+        """Test searching for one word within a long title, as in the admin."""
+        assert not Newspaper.objects.similar("Birkenhead").exists()
+        newspaper = Newspaper.objects.word_similar("Birkenhcad").get()
+        assert newspaper.publication_code == "0003040"
+        assert 0.6 <= newspaper.word_similarity < 1
+
+        self.client.force_login(
+            User.objects.create_superuser("admin", "admin@example.com", "password")
+        )
+        response = self.client.get("/admin/newspapers/newspaper/", {"q": "Birkenhead"})
+        assert list(response.context["cl"].result_list) == [newspaper]
+        # Newer, so listed first by the default `-pk` ordering without a search
+        Item.objects.create(
+            item_code=TEST_ITEM_CODE + "1",
+            title="RAILWAYS OF THE NORTH",
+            input_filename="0003040_18940905_art0031.txt",
+            issue=Issue.objects.get(),
+        )
+        response = self.client.get("/admin/newspapers/item/", {"q": "RAILWAY"})
+        assert [item.item_code for item in response.context["cl"].result_list] == [
+            TEST_ITEM_CODE,
+            TEST_ITEM_CODE + "1",
+        ]
+
     def test_sync_title_length(self):
         """Test managing title length."""
         title_extension: str = " LINE"
@@ -163,3 +565,32 @@ class ItemTestCase(TestCase):
         assert str(test_item) == truncate_str(
             test_item.title, MAX_PRINT_SELF_STR_LENGTH
         )
+
+
+@pytest.mark.django_db
+def test_historic_county_year_counts() -> None:
+    """Test refreshing and reading counts per historic county per year."""
+    cheshire = HistoricCounty.objects.create(label="Cheshire", wikidata_id="Q23064")
+    birkenhead = Place.objects.create(
+        label="Birkenhead", wikidata_id="Q746718", historic_county=cheshire
+    )
+    newspaper = Newspaper.objects.create(
+        publication_code="0003040",
+        title="The Birkenhead News and Wirral General Advertiser",
+        place_of_publication=birkenhead,
+    )
+    for issue_date in ("1894-09-05", "1894-09-12", "1901-01-02"):
+        Issue.objects.create(
+            issue_code=f"0003040-{issue_date.replace('-', '')}",
+            issue_date=issue_date,
+            input_sub_path=f"0003040/{issue_date[:4]}/{issue_date[5:].replace('-', '')}",
+            newspaper=newspaper,
+        )
+    HistoricCountyYearCounts.objects.refresh()
+    assert list(
+        cheshire.year_counts.values_list("year", "newspaper_count", "issue_count")
+    ) == [(1894, 1, 2), (1901, 1, 1)]
+    assert [
+        (row["decade"], row["issue_count"])
+        for row in HistoricCountyYearCounts.objects.by_decade()
+    ] == [(1890, 2), (1900, 1)]
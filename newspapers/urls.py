@@ -0,0 +1,26 @@
+from django.urls import path
+
+from . import views
+
+app_name = "newspapers"
+
+urlpatterns = [
+    path("newspapers/", views.NewspaperListView.as_view(), name="newspaper-list"),
+    path(
+        "newspapers/<int:pk>/",
+        views.NewspaperDetailView.as_view(),
+        name="newspaper-detail",
+    ),
+    path(
+        "newspapers/export/",
+        views.NewspaperExportView.as_view(),
+        name="newspaper-export",
+    ),
+    path("stats/", views.StatsAPIView.as_view(), name="stats"),
+    path("issues/", views.IssueListView.as_view(), name="issue-list"),
+    path("issues/<int:pk>/", views.IssueDetailView.as_view(), name="issue-detail"),
+    path("issues/export/", views.IssueExportView.as_view(), name="issue-export"),
+    path("items/", views.ItemListView.as_view(), name="item-list"),
+    path("items/<int:pk>/", views.ItemDetailView.as_view(), name="item-detail"),
+    path("items/export/", views.ItemExportView.as_view(), name="item-export"),
+]
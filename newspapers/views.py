@@ -1 +1,340 @@
-# Create your views here.
+"""Read-only `JSON` API for `Newspaper`, `Issue` and `Item` records.
+
+Lists are paginated by keyset on `pk` (`?cursor=`) rather than `OFFSET`, and
+never `COUNT(*)`, so every page costs the same however deep into `Item` it
+is. Rows are read with `values_list`, joining related codes in the same
+query, and `?fields=` restricts the columns selected.
+
+Export views stream every matching row as `CSV` or `NDJSON` from a
+server-side cursor, for downloads too large to page through. List, detail and
+stats responses are cached until the next ingest, see `lwmdb.cache`.
+"""
+
+import csv
+import json
+from collections.abc import Callable, Iterator
+from datetime import date
+from itertools import islice
+from logging import getLogger
+from typing import Any, Final
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+
+from lwmdb.cache import cache_response
+from lwmdb.utils import decode_cursor, encode_cursor
+
+from .models import Issue, Item, Newspaper
+from .stats import issue_counts, issue_date_range, item_type_counts
+
+logger = getLogger(__name__)
+
+DEFAULT_API_PAGE_SIZE: Final[int] = 100
+MAX_API_PAGE_SIZE: Final[int] = 1000
+
+API_FIELDS_PARAM: Final[str] = "fields"
+API_CURSOR_PARAM: Final[str] = "cursor"
+API_PAGE_SIZE_PARAM: Final[str] = "page_size"
+API_FORMAT_PARAM: Final[str] = "format"
+
+# Rows fetched per server-side cursor round trip and joined per streamed chunk
+DEFAULT_EXPORT_CHUNK_SIZE: Final[int] = 2000
+EXPORT_FORMAT_CSV: Final[str] = "csv"
+EXPORT_FORMAT_NDJSON: Final[str] = "ndjson"
+EXPORT_CONTENT_TYPES: Final[dict[str, str]] = {
+    EXPORT_FORMAT_CSV: "text/csv",
+    EXPORT_FORMAT_NDJSON: "application/x-ndjson",
+}
+
+NEWSPAPER_API_FIELDS: Final[dict[str, str]] = {
+    "id": "pk",
+    "publication_code": "publication_code",
+    "title": "title",
+    "location": "location",
+    "place_of_publication_id": "place_of_publication_id",
+    "place_of_publication": "place_of_publication__label",
+    "updated_at": "updated_at",
+}
+ISSUE_API_FIELDS: Final[dict[str, str]] = {
+    "id": "pk",
+    "issue_code": "issue_code",
+    "issue_date": "issue_date",
+    "input_sub_path": "input_sub_path",
+    "newspaper_id": "newspaper_id",
+    "publication_code": "newspaper__publication_code",
+    "updated_at": "updated_at",
+}
+ITEM_API_FIELDS: Final[dict[str, str]] = {
+    "id": "pk",
+    "item_code": "item_code",
+    "title": "title",
+    "item_type": "item_type",
+    "word_count": "word_count",
+    "ocr_quality_mean": "ocr_quality_mean",
+    "ocr_quality_sd": "ocr_quality_sd",
+    "input_filename": "input_filename",
+    "issue_id": "issue_id",
+    "issue_code": "issue__issue_code",
+    "issue_date": "issue__issue_date",
+    "publication_code": "issue__newspaper__publication_code",
+    "data_provider": "data_provider__code",
+    "updated_at": "updated_at",
+}
+
+# Query parameter to (lookup, parser of the parameter value)
+NEWSPAPER_API_FILTERS: Final[dict[str, tuple[str, Callable[[str], Any]]]] = {
+    "publication_code": ("publication_code", str),
+}
+ISSUE_API_FILTERS: Final[dict[str, tuple[str, Callable[[str], Any]]]] = {
+    "publication_code": ("newspaper__publication_code", str),
+    "start_date": ("issue_date__gte", date.fromisoformat),
+    "end_date": ("issue_date__lte", date.fromisoformat),
+}
+ITEM_API_FILTERS: Final[dict[str, tuple[str, Callable[[str], Any]]]] = {
+    "publication_code": ("issue__newspaper__publication_code", str),
+    "start_date": ("issue__issue_date__gte", date.fromisoformat),
+    "end_date": ("issue__issue_date__lte", date.fromisoformat),
+    "item_type": ("item_type", str.upper),
+    "data_provider": ("data_provider__code", str),
+}
+
+
+class APIError(ValueError):
+    """An invalid API request, returned as a `400` response."""
+
+
+class NewspapersAPIMixin:
+    """Parse filters and sparse fieldsets from a request to a `QuerySet`.
+
+    Attributes:
+        model: `Model` to query.
+        fields: Public field names to `values_list` lookups, in output order.
+        filters: Query parameters to lookups and value parsers.
+    """
+
+    model: type[Model]
+    fields: dict[str, str]
+    filters: dict[str, tuple[str, Callable[[str], Any]]]
+
+    def get_fields(self, request: HttpRequest) -> dict[str, str]:
+        """Return `fields` selected by `?fields=a,b`, or all of them."""
+        if not (requested := request.GET.get(API_FIELDS_PARAM)):
+            return self.fields
+        names: list[str] = [name.strip() for name in requested.split(",")]
+        if unknown := [name for name in names if name not in self.fields]:
+            raise APIError(
+                f"Unknown fields: {unknown}. Choose from {list(self.fields)}"
+            )
+        return {name: self.fields[name] for name in names}
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Return `model` records filtered by the request, ordered by `pk`."""
+        lookups: dict[str, Any] = {}
+        for param, (lookup, parse) in self.filters.items():
+            if value := request.GET.get(param):
+                try:
+                    lookups[lookup] = parse(value)
+                except ValueError:
+                    raise APIError(f"Invalid {param}: {value!r}")
+        return self.model.objects.filter(**lookups).order_by("pk")
+
+
+@method_decorator(cache_response(), name="get")
+class ListAPIView(NewspapersAPIMixin, View):
+    """List records a page at a time with a `next` keyset cursor."""
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            fields: dict[str, str] = self.get_fields(request)
+            queryset: QuerySet = self.get_queryset(request)
+            page_size: int = int(
+                request.GET.get(API_PAGE_SIZE_PARAM, DEFAULT_API_PAGE_SIZE)
+            )
+            page_size = min(max(page_size, 1), MAX_API_PAGE_SIZE)
+            if cursor := request.GET.get(API_CURSOR_PARAM):
+                (last_pk,) = decode_cursor(cursor)
+                queryset = queryset.filter(pk__gt=last_pk)
+        except (APIError, ValueError) as error:
+            return JsonResponse({"error": str(error)}, status=400)
+        # `pk` is always selected last to build the next cursor
+        rows: list[tuple] = list(
+            queryset.values_list(*fields.values(), "pk")[: page_size + 1]
+        )
+        next_cursor: str | None = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(rows[-1][-1])
+        next_url: str | None = None
+        if next_cursor:
+            params = request.GET.copy()
+            params[API_CURSOR_PARAM] = next_cursor
+            next_url = request.build_absolute_uri(f"?{params.urlencode()}")
+        return JsonResponse(
+            {
+                "results": [dict(zip(fields, row)) for row in rows],
+                "next_cursor": next_cursor,
+                "next": next_url,
+            }
+        )
+
+
+@method_decorator(cache_response(), name="get")
+class DetailAPIView(NewspapersAPIMixin, View):
+    """Return a single record by `pk`."""
+
+    filters: dict[str, tuple[str, Callable[[str], Any]]] = {}
+
+    def get(self, request: HttpRequest, pk: int) -> JsonResponse:
+        try:
+            fields: dict[str, str] = self.get_fields(request)
+        except APIError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+        row: tuple | None = (
+            self.model.objects.filter(pk=pk).values_list(*fields.values()).first()
+        )
+        if row is None:
+            return JsonResponse(
+                {"error": f"{self.model.__name__} not found"}, status=404
+            )
+        return JsonResponse(dict(zip(fields, row)))
+
+
+@method_decorator(cache_response(), name="get")
+class StatsAPIView(View):
+    """Return cached issue counts, date range and item types by newspaper."""
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        publication_code: str | None = request.GET.get("publication_code") or None
+        return JsonResponse(
+            {
+                "issue_counts": issue_counts(publication_code),
+                **issue_date_range(publication_code),
+                "item_type_counts": {
+                    str(item_type): count
+                    for item_type, count in item_type_counts(publication_code).items()
+                },
+            }
+        )
+
+
+class Echo:
+    """A file-like object returning what is written, for `csv.writer`."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_rows(
+    queryset: QuerySet,
+    fields: dict[str, str],
+    export_format: str = EXPORT_FORMAT_CSV,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Yield `fields` of `queryset` as `CSV` or `NDJSON` chunks of lines.
+
+    Rows are read through a server-side cursor with `iterator`, so memory use
+    is bounded by `chunk_size` however many rows match. If the client
+    disconnects, the server closes this generator and the cursor is closed.
+    """
+    rows: Iterator[tuple] = queryset.values_list(*fields.values()).iterator(
+        chunk_size=chunk_size
+    )
+    writer = csv.writer(Echo())
+    sent: int = 0
+    try:
+        if export_format == EXPORT_FORMAT_CSV:
+            yield writer.writerow(fields)
+        while chunk := list(islice(rows, chunk_size)):
+            if export_format == EXPORT_FORMAT_CSV:
+                yield "".join(writer.writerow(row) for row in chunk)
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + "\n"
+                    for row in chunk
+                )
+            sent += len(chunk)
+    except GeneratorExit:
+        logger.info(f"Export of {queryset.model.__name__} closed after {sent} rows")
+        raise
+    finally:
+        rows.close()
+
+
+class ExportAPIView(NewspapersAPIMixin, View):
+    """Stream all filtered records as `?format=csv` (default) or `ndjson`."""
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse | JsonResponse:
+        export_format: str = request.GET.get(API_FORMAT_PARAM, EXPORT_FORMAT_CSV)
+        try:
+            if export_format not in EXPORT_CONTENT_TYPES:
+                raise APIError(
+                    f"Invalid format: {export_format!r}. "
+                    f"Choose from {list(EXPORT_CONTENT_TYPES)}"
+                )
+            fields: dict[str, str] = self.get_fields(request)
+            queryset: QuerySet = self.get_queryset(request)
+        except APIError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+        response = StreamingHttpResponse(
+            stream_rows(queryset, fields, export_format),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        file_name: str = f"{self.model._meta.verbose_name_plural}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+        # Ask proxies such as `nginx` to pass chunks on rather than buffer them
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class NewspaperListView(ListAPIView):
+    model = Newspaper
+    fields = NEWSPAPER_API_FIELDS
+    filters = NEWSPAPER_API_FILTERS
+
+
+class NewspaperDetailView(DetailAPIView):
+    model = Newspaper
+    fields = NEWSPAPER_API_FIELDS
+
+
+class NewspaperExportView(ExportAPIView):
+    model = Newspaper
+    fields = NEWSPAPER_API_FIELDS
+    filters = NEWSPAPER_API_FILTERS
+
+
+class IssueListView(ListAPIView):
+    model = Issue
+    fields = ISSUE_API_FIELDS
+    filters = ISSUE_API_FILTERS
+
+
+class IssueDetailView(DetailAPIView):
+    model = Issue
+    fields = ISSUE_API_FIELDS
+
+
+class IssueExportView(ExportAPIView):
+    model = Issue
+    fields = ISSUE_API_FIELDS
+    filters = ISSUE_API_FILTERS
+
+
+class ItemListView(ListAPIView):
+    model = Item
+    fields = ITEM_API_FIELDS
+    filters = ITEM_API_FILTERS
+
+
+class ItemDetailView(DetailAPIView):
+    model = Item
+    fields = ITEM_API_FIELDS
+
+
+class ItemExportView(ExportAPIView):
+    model = Item
+    fields = ITEM_API_FIELDS
+    filters = ITEM_API_FILTERS